@@ -0,0 +1,236 @@
+"""
+Adaptive sort dispatcher for the S1C sorting algorithms.
+
+S1C compares the sorts in prose: insertion sort is fast on small or nearly
+sorted lists, merge sort is stable, quicksort is fast on random data but not
+stable, and so on. sort() turns that table into code: it profiles the input
+once (size, presortedness, duplicate ratio, key type) and sends it to the
+most suitable implementation, including counting sort and LSD radix sort
+for integer keys with a small range and a grouping bucket sort for keys with
+many duplicates.
+
+Every decision is reported as a SortDecision to the stats hook passed to
+sort(), or to the module-wide hook installed with set_stats_hook(), so the
+choices can be audited under production load.
+
+Example:
+  decisions = []
+  sort(records, key=lambda r: r["age"], stable=True, stats_hook=decisions.append)
+  decisions[0].algorithm   # e.g. "counting_sort"
+"""
+
+import time
+from collections import namedtuple
+
+from sorting import insertion_sort, introsort, merge_sort_bottom_up, natural_merge_sort
+
+SMALL_SIZE = 32           # Below this, insertion sort wins outright
+SAMPLE_WINDOWS = 16       # Contiguous windows scanned for presortedness
+WINDOW_SIZE = 64          # Items per window
+NEARLY_SORTED = 0.05      # At most this fraction of descents counts as nearly sorted
+MANY_DUPLICATES = 0.5     # At least this fraction of repeated sample keys
+COUNTING_RANGE = 2        # Counting sort if max - min < COUNTING_RANGE * n
+RADIX_BITS = 8            # Bits per radix sort pass
+RADIX_MAX_BITS = 32       # Radix sort only for ranges up to 2**RADIX_MAX_BITS
+
+Profile = namedtuple("Profile", "size descent_ratio duplicate_ratio integer_keys key_range")
+SortDecision = namedtuple("SortDecision", "algorithm profile stable seconds")
+
+_stats_hook = None
+
+
+def set_stats_hook(hook):
+    """Installs a callable that receives a SortDecision for every sort() call (None to remove)."""
+    global _stats_hook
+    _stats_hook = hook
+
+
+def profile_input(keys):
+    """
+    Builds a cheap Profile of a list of keys.
+
+    Presortedness and duplicates are estimated from SAMPLE_WINDOWS evenly
+    spaced windows of WINDOW_SIZE consecutive keys, so profiling costs
+    O(SAMPLE_WINDOWS * WINDOW_SIZE) comparisons however long the list is.
+    Only when the sample is all integers is a full min/max/type pass made,
+    because counting and radix sort must know the exact range.
+    """
+    n = len(keys)
+    step = max(WINDOW_SIZE, n // SAMPLE_WINDOWS)
+    descents = 0
+    pairs = 0
+    sample = []
+    for start in range(0, n, step):
+        window = keys[start:start + WINDOW_SIZE]
+        sample.extend(window)
+        for i in range(1, len(window)):
+            if window[i] < window[i - 1]:
+                descents += 1
+        pairs += max(0, len(window) - 1)
+
+    descent_ratio = descents / pairs if pairs else 0.0
+    try:
+        duplicate_ratio = 1 - len(set(sample)) / len(sample) if sample else 0.0
+    except TypeError: # Unhashable keys
+        duplicate_ratio = 0.0
+
+    integer_keys = bool(sample) and all(type(value) is int for value in sample)
+    key_range = None
+    if integer_keys:
+        integer_keys = all(type(value) is int for value in keys)
+        if integer_keys:
+            key_range = (min(keys), max(keys))
+    return Profile(n, descent_ratio, duplicate_ratio, integer_keys, key_range)
+
+
+def choose_algorithm(profile, stable):
+    """Returns the name of the algorithm sort() will use for this profile."""
+    n = profile.size
+    if n < SMALL_SIZE:
+        return "insertion_sort"
+    if profile.integer_keys:
+        low, high = profile.key_range
+        span = high - low + 1
+        if span < COUNTING_RANGE * n:
+            return "counting_sort"
+        if span <= 1 << RADIX_MAX_BITS:
+            return "radix_sort"
+    if profile.descent_ratio <= NEARLY_SORTED or profile.descent_ratio >= 1 - NEARLY_SORTED:
+        return "natural_merge_sort" # Long ascending or descending runs
+    if profile.duplicate_ratio >= MANY_DUPLICATES:
+        return "bucket_sort" # Sort the few distinct keys, then collect their items
+    if stable:
+        return "merge_sort_bottom_up"
+    return "introsort"
+
+
+def counting_sort(items, keys, low, high):
+    """
+    Stable counting sort of items by integer keys in [low, high].
+
+    Returns a new list. O(n + high - low) time.
+    """
+    counts = [0] * (high - low + 2)
+    for key in keys:
+        counts[key - low + 1] += 1
+    for i in range(1, len(counts)): # counts[k] becomes the first slot of key low + k
+        counts[i] += counts[i - 1]
+    result = [None] * len(items)
+    for item, key in zip(items, keys):
+        slot = key - low
+        result[counts[slot]] = item
+        counts[slot] += 1
+    return result
+
+
+def radix_sort(items, keys, low, high):
+    """
+    Stable LSD radix sort of items by integer keys in [low, high].
+
+    Keys are offset by low so they are non-negative, then distributed into
+    2**RADIX_BITS buckets per pass, least significant digit first. Returns a
+    new list.
+    """
+    pairs = [(key - low, item) for key, item in zip(keys, items)]
+    mask = (1 << RADIX_BITS) - 1
+    shift = 0
+    span = high - low
+    while span >> shift:
+        buckets = [[] for _ in range(1 << RADIX_BITS)]
+        for pair in pairs:
+            buckets[(pair[0] >> shift) & mask].append(pair)
+        pairs = [pair for bucket in buckets for pair in bucket]
+        shift += RADIX_BITS
+    return [item for _, item in pairs]
+
+
+def bucket_sort(items, keys):
+    """
+    Stable sort for hashable keys with many duplicates.
+
+    Groups the items by key in a dict, sorts only the distinct keys with
+    natural_merge_sort, then concatenates the groups. O(n + u log u) for u
+    distinct keys. Returns a new list.
+    """
+    groups = {}
+    for item, key in zip(items, keys):
+        group = groups.get(key)
+        if group is None:
+            groups[key] = [item]
+        else:
+            group.append(item)
+    distinct = list(groups)
+    natural_merge_sort(distinct)
+    return [item for key in distinct for item in groups[key]]
+
+
+def _comparison_sort(name, arr, keys):
+    """Runs one of the sorting.py comparison sorts, decorating with keys if needed."""
+    sort_function = {
+        "insertion_sort": insertion_sort,
+        "natural_merge_sort": natural_merge_sort,
+        "merge_sort_bottom_up": merge_sort_bottom_up,
+        "introsort": introsort,
+    }[name]
+    if keys is None:
+        sort_function(arr)
+        return arr
+    # The position breaks ties, so items themselves are never compared
+    decorated = [(key, index, item) for index, (key, item) in enumerate(zip(keys, arr))]
+    sort_function(decorated)
+    return [item for _, _, item in decorated]
+
+
+def sort(arr, key=None, stable=False, stats_hook=None):
+    """
+    Sorts a list in place with the algorithm that best fits its profile.
+
+    Args:
+        arr: The list to sort.
+        key: Optional function giving the value to sort each item by.
+        stable: Require equal items to keep their original order. When False
+            an unstable algorithm may be chosen.
+        stats_hook: Optional callable receiving the SortDecision for this call.
+            Falls back to the hook installed with set_stats_hook().
+
+    Returns:
+        The SortDecision describing what was done.
+    """
+    start = time.perf_counter()
+    keys = arr if key is None else [key(item) for item in arr]
+    profile = profile_input(keys)
+    algorithm = choose_algorithm(profile, stable)
+
+    if algorithm == "counting_sort":
+        result = counting_sort(arr, keys, *profile.key_range)
+    elif algorithm == "radix_sort":
+        result = radix_sort(arr, keys, *profile.key_range)
+    elif algorithm == "bucket_sort":
+        result = bucket_sort(arr, keys)
+    else:
+        result = _comparison_sort(algorithm, arr, None if key is None else keys)
+    if result is not arr:
+        arr[:] = result
+
+    decision = SortDecision(algorithm, profile, stable, time.perf_counter() - start)
+    hook = stats_hook or _stats_hook
+    if hook is not None:
+        hook(decision)
+    return decision
+
+
+# Example usage
+if __name__ == "__main__":
+    import random
+
+    samples = {
+        "small": [5, 3, 9, 1],
+        "small int range": [random.randrange(100) for _ in range(10_000)],
+        "wide int range": [random.randrange(10**9) for _ in range(10_000)],
+        "nearly sorted floats": sorted(random.random() for _ in range(10_000))[::-1],
+        "random floats": [random.random() for _ in range(10_000)],
+        "few unique strings": [random.choice("ABCDE") for _ in range(10_000)],
+    }
+    for name, data in samples.items():
+        decision = sort(data)
+        print(f"{name:<22} -> {decision.algorithm:<20} sorted: {data == sorted(data)}")
@@ -0,0 +1,290 @@
+"""
+Typed, fixed-size arrays with pseudo-code bounds (companion to S2A section 2).
+
+S2A simulates DECLARE Scores : ARRAY[1:5] OF INTEGER with [0] * 5 and
+DECLARE Attendance : ARRAY[1:5, 1:4] OF CHAR with a list of lists, so every
+cell is a boxed Python object and every row a separate list. The classes
+here store all cells in one contiguous buffer from the standard array
+module (8 bytes per INTEGER/REAL, 1 byte per CHAR/BOOLEAN; STRING cells,
+which have no fixed size, are kept in a plain list) and index them the
+pseudo-code way:
+
+  attendance = declare("ARRAY[1:5, 1:4] OF CHAR")
+  attendance[3, 2] = 'Y'          # Attendance[3, 2] <- 'Y'
+  attendance[5, :]                # row 5 as a view (no copy)
+  attendance[:, 3].fill('N')      # fill column 3 through the view
+
+Indices are checked against the declared (inclusive) bounds and raise
+IndexError when out of range, like the runtime error S2A section 5 describes.
+"""
+
+import re
+import sys
+from array import array
+
+# Pseudo-code type -> (array typecode, default value, to-buffer, from-buffer)
+TYPES = {
+    "INTEGER": ("q", 0, None, None),
+    "REAL": ("d", 0.0, None, None),
+    "CHAR": ("B", " ", None, None),     # One byte per character (Latin-1)
+    "BOOLEAN": ("B", False, int, bool),
+    "STRING": (None, "", None, None),   # No typecode: a list of str objects
+}
+
+DECLARATION = re.compile(
+    r"^\s*ARRAY\s*\[\s*(-?\d+)\s*:\s*(-?\d+)\s*(?:,\s*(-?\d+)\s*:\s*(-?\d+)\s*)?\]\s*OF\s+(\w+)\s*$",
+    re.IGNORECASE,
+)
+
+
+def _char_to_byte(value):
+    if not isinstance(value, str) or len(value) != 1:
+        raise TypeError(f"CHAR value must be a single character, got {value!r}")
+    code = ord(value)
+    if code > 255:
+        raise ValueError(f"CHAR value {value!r} is outside Latin-1")
+    return code
+
+
+def _codec(data_type):
+    """Returns (typecode, default, encode, decode) for a pseudo-code type name."""
+    data_type = data_type.upper()
+    if data_type not in TYPES:
+        raise ValueError(f"Unknown array type {data_type!r}, expected one of {sorted(TYPES)}")
+    typecode, default, encode, decode = TYPES[data_type]
+    if data_type == "CHAR":
+        encode, decode = _char_to_byte, chr
+    return typecode, default, encode, decode
+
+
+def _new_buffer(typecode, stored, count):
+    """Returns a buffer of count copies of stored: an array, or a list for typecode None."""
+    if typecode is None:
+        return [stored] * count
+    return array(typecode, [stored]) * count
+
+
+def _check_bounds(lower, upper):
+    if upper < lower:
+        raise ValueError(f"Upper bound {upper} is below lower bound {lower}")
+
+
+class ArrayView:
+    """
+    A 1D window onto a typed buffer: `length` cells starting at `start`,
+    `stride` cells apart, indexed from `lower`.
+
+    Rows and columns of an Array2D are ArrayViews over the grid's buffer, so
+    reading or writing through a view changes the grid and nothing is copied.
+    """
+
+    def __init__(self, buffer, start, stride, lower, upper, data_type):
+        self.buffer = buffer
+        self.start = start
+        self.stride = stride
+        self.lower = lower
+        self.upper = upper
+        self.data_type = data_type
+        _, self.default, self.encode, self.decode = _codec(data_type)
+
+    def __len__(self):
+        return self.upper - self.lower + 1
+
+    def _offset(self, index):
+        if not isinstance(index, int):
+            raise TypeError(f"Array index must be an integer, got {index!r}")
+        if not self.lower <= index <= self.upper:
+            raise IndexError(f"Index {index} is outside the bounds [{self.lower}:{self.upper}]")
+        return self.start + (index - self.lower) * self.stride
+
+    def __getitem__(self, index):
+        value = self.buffer[self._offset(index)]
+        return value if self.decode is None else self.decode(value)
+
+    def __setitem__(self, index, value):
+        self.buffer[self._offset(index)] = value if self.encode is None else self.encode(value)
+
+    def _buffer_slice(self):
+        return slice(self.start, self.start + len(self) * self.stride, self.stride)
+
+    def __iter__(self):
+        values = self.buffer[self._buffer_slice()]
+        if self.decode is None:
+            return iter(values)
+        return map(self.decode, values)
+
+    def fill(self, value):
+        """Sets every cell of the view to value in one bulk buffer operation."""
+        stored = value if self.encode is None else self.encode(value)
+        self.buffer[self._buffer_slice()] = _new_buffer(getattr(self.buffer, "typecode", None), stored, len(self))
+
+    def tolist(self):
+        return list(self)
+
+    def __repr__(self):
+        return f"{type(self).__name__}[{self.lower}:{self.upper}] OF {self.data_type}: {self.tolist()}"
+
+
+class Array(ArrayView):
+    """
+    DECLARE name : ARRAY[lower:upper] OF type
+
+    Example:
+      scores = Array(1, 5, "INTEGER")
+      scores[1] = 95
+      scores[5] = 78
+      scores[6]  # IndexError: Index 6 is outside the bounds [1:5]
+    """
+
+    def __init__(self, lower, upper, data_type="INTEGER", fill=None):
+        _check_bounds(lower, upper)
+        typecode, default, encode, _ = _codec(data_type)
+        value = default if fill is None else fill
+        stored = value if encode is None else encode(value)
+        buffer = _new_buffer(typecode, stored, upper - lower + 1)
+        super().__init__(buffer, 0, 1, lower, upper, data_type.upper())
+
+    @classmethod
+    def from_values(cls, values, data_type="INTEGER", lower=1):
+        """Returns an array holding values, indexed from lower (1 by default)."""
+        values = list(values)
+        if not values:
+            raise ValueError("An array needs at least one element")
+        result = cls(lower, lower + len(values) - 1, data_type)
+        if result.encode is not None:
+            values = [result.encode(value) for value in values]
+        result.buffer[:] = values if isinstance(result.buffer, list) else array(result.buffer.typecode, values)
+        return result
+
+    def view(self, first, last):
+        """Returns cells first..last (inclusive, declared indices) as a view."""
+        self._offset(first)
+        self._offset(last)
+        if last < first:
+            raise ValueError(f"View end {last} is before its start {first}")
+        return ArrayView(self.buffer, first - self.lower, 1, first, last, self.data_type)
+
+
+class Array2D:
+    """
+    DECLARE name : ARRAY[row_lower:row_upper, col_lower:col_upper] OF type
+
+    Cells are stored row by row in one buffer. grid[r, c] reads or writes a
+    cell; grid[r, :] / grid.row(r) and grid[:, c] / grid.column(c) return
+    ArrayViews of a whole row or column without copying.
+
+    Example:
+      attendance = Array2D((1, 5), (1, 4), "CHAR")
+      attendance[3, 2] = 'Y'
+      attendance[5, 3] = 'N'
+    """
+
+    def __init__(self, row_bounds, col_bounds, data_type="INTEGER", fill=None):
+        self.row_lower, self.row_upper = row_bounds
+        self.col_lower, self.col_upper = col_bounds
+        _check_bounds(self.row_lower, self.row_upper)
+        _check_bounds(self.col_lower, self.col_upper)
+        self.data_type = data_type.upper()
+        self.rows = self.row_upper - self.row_lower + 1
+        self.cols = self.col_upper - self.col_lower + 1
+
+        typecode, default, self.encode, self.decode = _codec(data_type)
+        value = default if fill is None else fill
+        stored = value if self.encode is None else self.encode(value)
+        self.buffer = _new_buffer(typecode, stored, self.rows * self.cols)
+
+    def _offset(self, row, col):
+        if not (isinstance(row, int) and isinstance(col, int)):
+            raise TypeError(f"Array indices must be integers, got [{row!r}, {col!r}]")
+        if not self.row_lower <= row <= self.row_upper:
+            raise IndexError(f"Row {row} is outside the bounds [{self.row_lower}:{self.row_upper}]")
+        if not self.col_lower <= col <= self.col_upper:
+            raise IndexError(f"Column {col} is outside the bounds [{self.col_lower}:{self.col_upper}]")
+        return (row - self.row_lower) * self.cols + (col - self.col_lower)
+
+    def row(self, row):
+        """Returns row `row` as a view indexed by column."""
+        start = self._offset(row, self.col_lower)
+        return ArrayView(self.buffer, start, 1, self.col_lower, self.col_upper, self.data_type)
+
+    def column(self, col):
+        """Returns column `col` as a view indexed by row."""
+        start = self._offset(self.row_lower, col)
+        return ArrayView(self.buffer, start, self.cols, self.row_lower, self.row_upper, self.data_type)
+
+    def __getitem__(self, index):
+        row, col = index
+        if row == slice(None):
+            return self.column(col)
+        if col == slice(None):
+            return self.row(row)
+        value = self.buffer[self._offset(row, col)]
+        return value if self.decode is None else self.decode(value)
+
+    def __setitem__(self, index, value):
+        row, col = index
+        self.buffer[self._offset(row, col)] = value if self.encode is None else self.encode(value)
+
+    def fill(self, value):
+        """Sets every cell to value in one bulk buffer operation."""
+        stored = value if self.encode is None else self.encode(value)
+        self.buffer[:] = _new_buffer(getattr(self.buffer, "typecode", None), stored, len(self.buffer))
+
+    @property
+    def shape(self):
+        return self.rows, self.cols
+
+    def nbytes(self):
+        """Bytes used by the cell buffer."""
+        if isinstance(self.buffer, list):
+            return sum(map(sys.getsizeof, self.buffer)) + sys.getsizeof(self.buffer)
+        return len(self.buffer) * self.buffer.itemsize
+
+    def tolist(self):
+        """Returns the grid as a list of row lists (copies)."""
+        return [self.row(r).tolist() for r in range(self.row_lower, self.row_upper + 1)]
+
+    def __repr__(self):
+        return (f"Array2D[{self.row_lower}:{self.row_upper}, {self.col_lower}:{self.col_upper}] "
+                f"OF {self.data_type}")
+
+
+def declare(declaration, fill=None):
+    """
+    Creates an array from a pseudo-code declaration.
+
+    Example:
+      declare("ARRAY[1:10] OF INTEGER")       # -> Array
+      declare("ARRAY[1:5, 1:4] OF CHAR")      # -> Array2D
+    """
+    match = DECLARATION.match(declaration)
+    if match is None:
+        raise ValueError(f"Not an array declaration: {declaration!r}")
+    lower, upper, col_lower, col_upper, data_type = match.groups()
+    if col_lower is None:
+        return Array(int(lower), int(upper), data_type, fill)
+    return Array2D((int(lower), int(upper)), (int(col_lower), int(col_upper)), data_type, fill)
+
+
+# Example usage
+if __name__ == "__main__":
+    # Simulating DECLARE Scores : ARRAY[1:5] OF INTEGER
+    scores = declare("ARRAY[1:5] OF INTEGER")
+    scores[1] = 95
+    scores[5] = 78
+    print(f"Scores array: {scores.tolist()}")
+    try:
+        print(scores[6])
+    except IndexError as e:
+        print(f"Error accessing index 6: {e}")
+
+    # Simulating DECLARE Attendance : ARRAY[1:5, 1:4] OF CHAR
+    attendance = declare("ARRAY[1:5, 1:4] OF CHAR")
+    attendance[3, 2] = 'Y'
+    attendance[5, 3] = 'N'
+    for row in attendance.tolist():
+        print(row)
+    print(f"Column 2: {attendance[:, 2].tolist()}")
+
+    big = Array2D((1, 10_000), (1, 10_000), "CHAR")
+    print(f"10,000 x 10,000 CHAR grid uses {big.nbytes() / 1e6:.0f} MB")
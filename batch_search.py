@@ -0,0 +1,183 @@
+"""
+Batch searching over NumPy arrays (companion to S1B - Searching Algorithms).
+
+The S1B functions look up one key per call with a Python loop. The functions
+here take a whole array of keys and return an array of indices (-1 for
+misses), doing the work inside NumPy:
+
+  binary_search_batch    - many keys against a sorted array (bisection)
+  contains_sorted_batch  - True/False per key, like linear_search_ordered
+  UnsortedIndex          - index built once over unsorted data, then queried
+                           in batches, like linear_search_unordered
+"""
+
+import numpy as np
+
+NOT_FOUND = -1
+
+
+def binary_search_batch(keys, sorted_array, exact=False):
+  """
+  Looks up every key in a sorted array.
+
+  Args:
+    keys: Array-like of keys to search for.
+    sorted_array: 1D array sorted in ascending order.
+    exact: If False (default), a found key reports its leftmost occurrence
+      (one np.searchsorted call). If True, every key follows exactly the
+      same low/mid/high steps as binary_search_iterative, all keys moving in
+      lock-step, so duplicate keys report the same index the scalar version
+      would.
+
+  Returns:
+    An int64 array the same length as keys holding indices, -1 for misses.
+  """
+  keys = np.asarray(keys)
+  sorted_array = np.asarray(sorted_array)
+  n = len(sorted_array)
+  if n == 0:
+    return np.full(len(keys), NOT_FOUND, dtype=np.int64)
+  if exact:
+    return _bisect_lockstep(keys, sorted_array)
+
+  index = np.searchsorted(sorted_array, keys, side="left")
+  in_range = index < n
+  hit = in_range & (sorted_array[np.minimum(index, n - 1)] == keys)
+  return np.where(hit, index, NOT_FOUND).astype(np.int64)
+
+
+def _bisect_lockstep(keys, sorted_array):
+  """Runs binary_search_iterative for all keys at once, one halving per pass."""
+  count = len(keys)
+  low = np.zeros(count, dtype=np.int64)
+  high = np.full(count, len(sorted_array) - 1, dtype=np.int64)
+  found_at = np.full(count, NOT_FOUND, dtype=np.int64)
+  active = np.arange(count)
+
+  while len(active) > 0:
+    mid = (low[active] + high[active]) // 2
+    probe = sorted_array[mid]
+    active_keys = keys[active]
+
+    equal = active_keys == probe
+    found_at[active[equal]] = mid[equal]
+    lower = active_keys < probe
+    high[active[lower]] = mid[lower] - 1 # Search lower half
+    upper = ~(equal | lower)
+    low[active[upper]] = mid[upper] + 1 # Search upper half
+
+    # Keys that were found or whose range became empty drop out
+    still = ~equal & (low[active] <= high[active])
+    active = active[still]
+
+  return found_at
+
+
+def contains_sorted_batch(keys, sorted_array):
+  """
+  Batch version of linear_search_ordered.
+
+  Returns:
+    A boolean array, True where the key occurs in sorted_array.
+  """
+  return binary_search_batch(keys, sorted_array) != NOT_FOUND
+
+
+def _as_object_free_array(data):
+  """
+  Returns data as an array NumPy can order, or None if it would need dtype
+  object or would change what the values compare equal to.
+  """
+  try:
+    array = np.asarray(data)
+  except ValueError: # Ragged values such as tuples of different lengths
+    return None
+  if array.dtype == object or array.ndim != 1:
+    return None
+  if array.dtype.kind in "US" and not isinstance(data, np.ndarray):
+    # [1, 'a'] becomes strings, so 1 would then match '1'
+    item_type = str if array.dtype.kind == "U" else bytes
+    if not all(isinstance(value, item_type) for value in data):
+      return None
+  return array
+
+
+class UnsortedIndex:
+  """
+  Index over unsorted data answering "first index of key" for many keys.
+
+  Gives the same answers as linear_search_unordered (the first occurrence,
+  -1 if absent) but is built once in O(n log n) and then queried in bulk.
+
+  Two backends:
+    "table" - for numeric, bool and fixed-width string arrays. Keeps the
+              distinct values sorted next to the index of their first
+              occurrence, and answers a batch with one searchsorted call.
+              NumPy has no vectorised hash lookup, so this is the fastest
+              way to resolve millions of keys.
+    "hash"  - a dict from value to first index, for object arrays (mixed
+              types, tuples, ...) that cannot be ordered by NumPy.
+
+  Example:
+    index = UnsortedIndex([65, 20, 10, 55, 32, 12, 50])
+    index.lookup([32, 37])   # -> array([ 4, -1])
+  """
+
+  def __init__(self, data, backend="auto"):
+    """
+    Args:
+      data: The (unsorted) values to index.
+      backend: "table", "hash" or "auto" (table unless data has dtype object).
+    """
+    if backend not in ("auto", "table", "hash"):
+      raise ValueError(f"Unknown backend {backend!r}")
+    if backend == "auto":
+      backend = "hash" if _as_object_free_array(data) is None else "table"
+    self.backend = backend
+    self.size = len(data)
+
+    if backend == "table":
+      # np.unique returns the first occurrence of each value
+      self.values, self.first_index = np.unique(np.asarray(data), return_index=True)
+    else:
+      self.positions = {}
+      values = data.tolist() if isinstance(data, np.ndarray) else data
+      for index, value in enumerate(values):
+        self.positions.setdefault(value, index)
+
+  def lookup(self, keys):
+    """Returns an int64 array of first-occurrence indices, -1 for misses."""
+    if self.backend == "hash":
+      get = self.positions.get
+      values = keys.tolist() if isinstance(keys, np.ndarray) else keys
+      return np.fromiter((get(key, NOT_FOUND) for key in values),
+                         dtype=np.int64, count=len(keys))
+
+    if not len(self.values): # Nothing indexed
+      return np.full(len(keys), NOT_FOUND, dtype=np.int64)
+    slot = binary_search_batch(keys, self.values)
+    hit = slot != NOT_FOUND
+    return np.where(hit, self.first_index[np.where(hit, slot, 0)], NOT_FOUND).astype(np.int64)
+
+  def __len__(self):
+    return self.size
+
+
+def linear_search_batch(keys, data_list):
+  """
+  Batch version of linear_search_unordered.
+
+  Builds a one-off UnsortedIndex; keep the index yourself when searching
+  the same data repeatedly.
+  """
+  return UnsortedIndex(data_list).lookup(keys)
+
+
+# Example usage
+if __name__ == "__main__":
+  my_list_unordered = [65, 20, 10, 55, 32, 12, 50]
+  print(f"Batch linear search: {linear_search_batch([37, 32, 65], my_list_unordered)}")
+
+  my_list_ordered = [8, 14, 18, 19, 33, 51, 66]
+  print(f"Batch binary search: {binary_search_batch([30, 51, 8, 99], my_list_ordered)}")
+  print(f"Batch contains:      {contains_sorted_batch([30, 51], my_list_ordered)}")
@@ -0,0 +1,87 @@
+"""
+Benchmarks batch_search.py against the scalar S1B search functions.
+
+Run from the repository root:
+  python -m benchmarks.bench_batch_search
+"""
+
+import time
+
+import numpy as np
+
+from batch_search import UnsortedIndex, binary_search_batch, contains_sorted_batch
+from searching import binary_search_iterative, linear_search_ordered, linear_search_unordered
+
+SIZES = [1_000, 100_000, 10_000_000]
+KEY_COUNT = 1_000_000
+SCALAR_KEY_COUNT = 2_000   # The scalar loops are timed on a sample and scaled up
+LINEAR_KEY_COUNT = 50      # Linear search is O(n) per key, so sample even less
+
+
+def timed(func, *args):
+  start = time.perf_counter()
+  result = func(*args)
+  return time.perf_counter() - start, result
+
+
+def per_million(seconds, count):
+  """Scales a measured time to the cost of one million lookups."""
+  return seconds * 1_000_000 / count
+
+
+def main():
+  rng = np.random.default_rng(9569)
+  print(f"{'n':>11} | {'algorithm':<28} | {'per 1M keys':>12}")
+  print("-" * 58)
+
+  for n in SIZES:
+    sorted_array = np.sort(rng.integers(0, 2 * n, n))
+    unsorted_array = rng.permutation(sorted_array)
+    keys = rng.integers(0, 2 * n, KEY_COUNT)
+
+    sorted_list = sorted_array.tolist()
+    unsorted_list = unsorted_array.tolist()
+    sample = keys[:SCALAR_KEY_COUNT].tolist()
+    linear_sample = keys[:LINEAR_KEY_COUNT].tolist()
+
+    # Batch versions
+    batch_time, batch_result = timed(binary_search_batch, keys, sorted_array)
+    exact_time, exact_result = timed(binary_search_batch, keys, sorted_array, True)
+    contains_time, contains_result = timed(contains_sorted_batch, keys, sorted_array)
+    build_time, index = timed(UnsortedIndex, unsorted_array)
+    lookup_time, lookup_result = timed(index.lookup, keys)
+
+    # Scalar versions on a sample, checking the batch results as we go
+    start = time.perf_counter()
+    scalar = [binary_search_iterative(key, sorted_list) for key in sample]
+    binary_time = time.perf_counter() - start
+    assert scalar == exact_result[:SCALAR_KEY_COUNT].tolist()
+    assert [s != -1 for s in scalar] == (batch_result[:SCALAR_KEY_COUNT] != -1).tolist()
+
+    start = time.perf_counter()
+    ordered = [linear_search_ordered(key, sorted_list) for key in linear_sample]
+    ordered_time = time.perf_counter() - start
+    assert ordered == contains_result[:LINEAR_KEY_COUNT].tolist()
+
+    start = time.perf_counter()
+    unordered = [linear_search_unordered(key, unsorted_list) for key in linear_sample]
+    unordered_time = time.perf_counter() - start
+    assert unordered == lookup_result[:LINEAR_KEY_COUNT].tolist()
+
+    rows = [
+      ("binary_search_iterative", per_million(binary_time, SCALAR_KEY_COUNT)),
+      ("binary_search_batch", per_million(batch_time, KEY_COUNT)),
+      ("binary_search_batch(exact)", per_million(exact_time, KEY_COUNT)),
+      ("linear_search_ordered", per_million(ordered_time, LINEAR_KEY_COUNT)),
+      ("contains_sorted_batch", per_million(contains_time, KEY_COUNT)),
+      ("linear_search_unordered", per_million(unordered_time, LINEAR_KEY_COUNT)),
+      ("UnsortedIndex build (total)", build_time),
+      ("UnsortedIndex.lookup", per_million(lookup_time, KEY_COUNT)),
+    ]
+    for name, seconds in rows:
+      print(f"{n:>11} | {name:<28} | {seconds:>10.3f} s")
+    print("-" * 58)
+
+
+if __name__ == "__main__":
+  main()
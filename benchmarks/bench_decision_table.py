@@ -0,0 +1,104 @@
+"""
+Benchmarks compiled decision tables against nested-if evaluation.
+
+Two tables are timed:
+  produce_toys   The S1A "Produce Toys" table, against the nested if/else a
+                 programmer would write for it by hand.
+  generated      RULE_COUNT random rules over CONDITION_COUNT Y/N conditions,
+                 against DecisionTable.evaluate_naive (one if per rule entry).
+
+Run from the repository root:
+  python -m benchmarks.bench_decision_table
+"""
+
+import io
+import random
+import time
+
+import numpy as np
+
+from decision_table import PRODUCE_TOYS_CSV, YES_NO, DecisionTable, compile_table
+
+INPUT_COUNT = 200_000
+CONDITION_COUNT = 16
+RULE_COUNT = 60
+
+ACCEPT = ("X", "", "")
+REPAIR = ("", "X", "")
+REJECT = ("", "", "X")
+
+
+def produce_toys_nested_if(values):
+    """The Produce Toys logic as nested if/else (S1A section 6.6)."""
+    dimensions, safety, paint = values
+    if dimensions == "Y":
+        if safety == "Y":
+            if paint == "Y":
+                return ACCEPT
+            return REPAIR
+        if paint == "Y":
+            return REPAIR
+        return REJECT
+    return REJECT
+
+
+def generated_table(rng):
+    """A table of random rules with a catch-all last rule, so every input is covered."""
+    rules = []
+    for _ in range(RULE_COUNT - 1):
+        entries = [rng.choice(("Y", "N", None, None)) for _ in range(CONDITION_COUNT)]
+        actions = [rng.choice(("X", "")) for _ in range(4)]
+        rules.append((entries, actions))
+    rules.append(([None] * CONDITION_COUNT, ["", "", "", "X"]))
+    conditions = [f"C{i + 1}" for i in range(CONDITION_COUNT)]
+    return DecisionTable(conditions, ["A1", "A2", "A3", "A4"], rules)
+
+
+def time_per_input(func, inputs):
+    start = time.perf_counter()
+    results = [func(values) for values in inputs]
+    return (time.perf_counter() - start) / len(inputs), results
+
+
+def time_batch(engine, rows):
+    start = time.perf_counter()
+    ids = engine.evaluate_batch(rows)
+    return (time.perf_counter() - start) / len(rows), ids
+
+
+def benchmark(name, table, reference, rows):
+    inputs = [tuple(row) for row in rows.tolist()]
+    results = [("nested if", *time_per_input(reference, inputs))]
+    for method in ("lookup", "tree"):
+        start = time.perf_counter()
+        engine = compile_table(table, method)
+        compile_time = time.perf_counter() - start
+        seconds, outcomes = time_per_input(engine.evaluate, inputs)
+        results.append((f"{method} (compile {compile_time * 1000:.1f} ms)", seconds, outcomes))
+        seconds, ids = time_batch(engine, rows)
+        results.append((f"{method} batch", seconds, [engine.outcome(i) for i in ids.tolist()]))
+
+    expected = results[0][2]
+    for label, seconds, outcomes in results:
+        assert outcomes == expected, f"{name}: {label} disagrees with nested if"
+        print(f"{name:<14} | {label:<28} | {seconds * 1e9:>10.1f} ns")
+    print("-" * 60)
+
+
+def main():
+    rng = random.Random(617)
+    np_rng = np.random.default_rng(617)
+    print(f"{'table':<14} | {'evaluator':<28} | {'per input':>13}")
+    print("-" * 60)
+
+    toys = DecisionTable.from_csv(io.StringIO(PRODUCE_TOYS_CSV)).simplify()
+    rows = np.array(YES_NO)[np_rng.integers(0, 2, (INPUT_COUNT, 3))]
+    benchmark("produce_toys", toys, produce_toys_nested_if, rows)
+
+    table = generated_table(rng)
+    rows = np.array(YES_NO)[np_rng.integers(0, 2, (INPUT_COUNT, CONDITION_COUNT))]
+    benchmark("generated", table, table.evaluate_naive, rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Throughput benchmark for external_sort.py.
+
+Generates a file of random records, sorts it with different worker counts
+and memory budgets, and reports records/s and MB/s.
+
+Run from the repository root:
+  python -m benchmarks.bench_external_sort
+  python -m benchmarks.bench_external_sort --records 10000000 --workers 1 2 4 8
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from external_sort import FieldKey, external_sort, parse_size
+
+
+def write_records(path, count, seed=9569):
+    """Writes `count` CSV records: name,score,id (about 30 bytes each)."""
+    rng = random.Random(seed)
+    names = ["alice", "bob", "carol", "dave", "erin", "frank", "grace"]
+    with open(path, "w", buffering=1 << 20) as f:
+        for record_id in range(count):
+            f.write(f"{rng.choice(names)},{rng.randrange(100_000)},{record_id:010d}\n")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the external merge sort.")
+    parser.add_argument("--records", type=int, default=1_000_000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--memory", type=parse_size, nargs="+", default=[parse_size("16M"), parse_size("256M")])
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as directory:
+        input_path = os.path.join(directory, "input.csv")
+        output_path = os.path.join(directory, "output.csv")
+        write_records(input_path, args.records)
+        size_mb = os.path.getsize(input_path) / (1 << 20)
+        print(f"Input: {args.records:,} records, {size_mb:.1f} MB")
+        print(f"{'key':<8} | {'workers':>7} | {'memory':>8} | {'runs':>5} | {'seconds':>8} | {'records/s':>11} | {'MB/s':>6}")
+        print("-" * 72)
+
+        for key_name, key in [("bytes", None), ("score", FieldKey(1, b",", numeric=True))]:
+            for memory in args.memory:
+                for workers in args.workers:
+                    start = time.perf_counter()
+                    runs = external_sort(input_path, output_path, memory_budget=memory,
+                                         workers=workers, key=key, temp_dir=directory)
+                    seconds = time.perf_counter() - start
+                    print(f"{key_name:<8} | {workers:>7} | {memory >> 20:>6}MB | {runs:>5} | {seconds:>8.2f} | "
+                          f"{args.records / seconds:>11,.0f} | {size_mb / seconds:>6.2f}")
+
+
+if __name__ == "__main__":
+    main()
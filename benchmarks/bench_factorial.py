@@ -0,0 +1,67 @@
+"""
+Benchmarks factorial.py against the S2A factorial_recursive.
+
+Run from the repository root:
+  python -m benchmarks.bench_factorial
+"""
+
+import math
+import sys
+import time
+
+from factorial import FactorialTable, factorial
+
+SIZES = [10, 100, 1_000, 10_000, 100_000, 1_000_000]
+
+
+def factorial_recursive(n):
+    """factorial_recursive from S2A section 6, copied unchanged."""
+    if n < 0:
+        return "Factorial not defined for negative numbers"
+    elif n == 0: # Base case
+        return 1
+    else: # Recursive step
+        return n * factorial_recursive(n - 1)
+
+
+def time_call(func, n):
+    """Returns (seconds, result), or (None, error name) if func fails."""
+    start = time.perf_counter()
+    try:
+        result = func(n)
+    except RecursionError:
+        return None, "RecursionError"
+    return time.perf_counter() - start, result
+
+
+def format_time(seconds):
+    if seconds is None:
+        return "-"
+    return f"{seconds * 1000:.3f} ms"
+
+
+def main():
+    table = FactorialTable(interval=1024)
+    print(f"Recursion limit: {sys.getrecursionlimit()}")
+    print(f"{'n':>10} | {'recursive':>16} | {'product tree':>14} | {'table (cold)':>14} | {'table (warm)':>14}")
+    print("-" * 82)
+    for n in SIZES:
+        rec_time, rec_result = time_call(factorial_recursive, n)
+        tree_time, tree_result = time_call(factorial, n)
+        cold_time, cold_result = time_call(table.factorial, n)
+        warm_time, warm_result = time_call(table.factorial, n)
+
+        # Check correctness against the standard library on smaller n
+        if n <= 100_000:
+            expected = math.factorial(n)
+            assert tree_result == expected and cold_result == expected and warm_result == expected
+            if rec_time is not None:
+                assert rec_result == expected
+
+        rec_cell = format_time(rec_time) if rec_time is not None else rec_result
+        print(f"{n:>10} | {rec_cell:>16} | {format_time(tree_time):>14} | "
+              f"{format_time(cold_time):>14} | {format_time(warm_time):>14}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""
+Benchmarks pseudocode.py on the pseudo-code blocks of the notebooks.
+
+For every pseudo-code block (a code cell made only of comments), reports:
+  parse    tokenize + parse to a Python AST
+  compile  AST to a code object
+  cached   loading the code object from the on-disk cache
+  exec     running the block (defining its procedures and functions);
+           blocks see the subroutines defined by earlier blocks of the same
+           notebook, as when the notebook is run top to bottom
+  call     one call of its function on a sample input, where WORKLOADS has one
+
+Blocks that are templates rather than code (e.g. IF <condition> THEN) are
+listed as skipped.
+
+Run from the repository root:
+  python -m benchmarks.bench_pseudocode
+"""
+
+import glob
+import itertools
+import json
+import random
+import re
+import shutil
+import tempfile
+import time
+
+import pseudocode
+from arrays import Array
+from pseudocode import PseudocodeError, compile_pseudocode, runtime, transpile
+
+REPEATS = 5
+INPUT_LINE = "12345678" # Answers every INPUT; 8 digits satisfies the telephone-number loops
+PSEUDOCODE_WORDS = re.compile(r"\b(DECLARE|ENDFOR|ENDWHILE|UNTIL|ENDPROCEDURE|ENDFUNCTION|ENDIF|OUTPUT|INPUT)\b")
+
+_rng = random.Random(18)
+_sorted = Array.from_values(range(0, 2000, 2))
+
+# Function name -> function returning fresh arguments for one call
+WORKLOADS = {
+    "Fac": lambda: (12,),
+    "Fibonacci": lambda: (15,),
+    "Fibonacci_Iterative": lambda: (30,),
+    "find_max": lambda: (7, 11),
+    "LinearSearchOnSortedArray": lambda: (777, _sorted),
+    "recSearch1": lambda: (_sorted, 1, 776),
+    "BinarySearch": lambda: (777, _sorted),
+    "BinarySearchRec": lambda: (1, len(_sorted), 777, _sorted),
+    "INSERTIONSORT": lambda: (Array.from_values(_rng.sample(range(1000), 200), lower=0),), # 0-based in S1C
+    "Quicksort": lambda: (Array.from_values(_rng.sample(range(1000), 1000)), 1, 1000),
+}
+
+
+def notebook_blocks(pattern="S*.ipynb"):
+    """Yields (notebook path, label, pseudo-code) for each all-comment code cell that looks like pseudo-code."""
+    for path in sorted(glob.glob(pattern)):
+        with open(path, encoding="utf-8") as f:
+            notebook = json.load(f)
+        for number, cell in enumerate(notebook["cells"]):
+            lines = "".join(cell["source"]).splitlines()
+            if cell["cell_type"] != "code" or not all(line.startswith("#") or not line.strip() for line in lines):
+                continue
+            lines = [re.sub(r"^# ?", "", line) for line in lines]
+            source = "\n".join(line for line in lines if not line.lstrip().startswith("---")) # Cell titles
+            if PSEUDOCODE_WORDS.search(source):
+                yield path, f"{path.split(' ')[0]} cell {number}", source
+
+
+def best_time(func, repeats=REPEATS):
+    """Returns (best seconds, result) over repeats runs."""
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def format_time(seconds):
+    return "-" if seconds is None else f"{seconds * 1e6:.1f} us"
+
+
+def main():
+    cache_dir = tempfile.mkdtemp(prefix="pseudocode-cache-")
+    print(f"{'block':<16} | {'lines':>5} | {'parse':>10} | {'compile':>10} | {'cached':>10} | "
+          f"{'exec':>10} | call")
+    print("-" * 100)
+    try:
+        notebook, defined = None, {}
+        for path, label, source in notebook_blocks():
+            if path != notebook:
+                notebook, defined = path, {} # Subroutines defined so far in this notebook
+            lines = source.count("\n") + 1
+            try:
+                parse_time, tree = best_time(lambda: transpile(source))
+            except PseudocodeError as e:
+                print(f"{label:<16} | {lines:>5} | skipped: {e}")
+                continue
+            compile_time, _ = best_time(lambda: compile(tree, "<pseudocode>", "exec"))
+
+            compile_pseudocode(source, cache_dir=cache_dir) # Populate the disk cache
+            def load_cached():
+                pseudocode._compiled.clear() # Force a disk read
+                return compile_pseudocode(source, cache_dir=cache_dir)
+            cached_time, code = best_time(load_cached)
+
+            def execute():
+                namespace = runtime(inputs=itertools.repeat(INPUT_LINE), output=lambda line: None)
+                namespace.update(defined)
+                exec(code, namespace)
+                return namespace
+            try:
+                exec_time, namespace = best_time(execute)
+            except Exception as e:
+                print(f"{label:<16} | {lines:>5} | failed: {type(e).__name__}: {e}")
+                continue
+
+            calls = []
+            for name, make_args in WORKLOADS.items():
+                if name in namespace and namespace[name] is not defined.get(name): # Defined by this block
+                    call_time, _ = best_time(lambda: namespace[name](*make_args()))
+                    calls.append(f"{name} {format_time(call_time)}")
+            defined.update((name, value) for name, value in namespace.items()
+                           if getattr(getattr(value, "__code__", None), "co_filename", None) == "<pseudocode>")
+            print(f"{label:<16} | {lines:>5} | {format_time(parse_time):>10} | {format_time(compile_time):>10} | "
+                  f"{format_time(cached_time):>10} | {format_time(exec_time):>10} | {', '.join(calls)}")
+    finally:
+        shutil.rmtree(cache_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,268 @@
+"""
+Benchmark harness for the S1C sorting algorithms (sorting.py).
+
+Runs every sort on random, sorted, reverse-sorted, few-unique and
+nearly-sorted inputs and records, per (algorithm, input, size):
+
+  seconds      best wall time over --repeat runs on plain values
+  comparisons  number of <, <=, >, >=, == calls between items
+  inplace_writes
+               item assignments into the list being sorted (or slices of
+               it), i.e. swaps count as two writes and shifts as one. Writes
+               into scratch buffers the sort allocates itself (the merge
+               buffers of merge_sort_bottom_up and natural_merge_sort, the
+               new lists of merge_sort) are not counted, so the merge sorts
+               do more writes than this column shows
+  peak_bytes   peak memory allocated during the sort (tracemalloc)
+
+Counts and memory are measured in separate runs so that the
+instrumentation does not distort the timings. The O(n^2) sorts are only
+run up to --quadratic-limit items. A sort that fails (for example
+quick_sort hitting RecursionError on sorted input) is recorded with its
+error instead of numbers.
+
+Results are written as JSON so that two runs can be compared:
+
+  python -m benchmarks.bench_sorting --output results.json
+  python -m benchmarks.bench_sorting --output new.json --compare results.json
+
+With --compare the exit status is 1 when any case regressed, so the
+benchmark can gate a CI job.
+"""
+
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+import sorting
+
+ALGORITHMS = {
+    "insertion_sort": sorting.insertion_sort,
+    "bubble_sort_optimized": sorting.bubble_sort_optimized,
+    "quick_sort": sorting.quick_sort,
+    "merge_sort": sorting.merge_sort,
+    "introsort": sorting.introsort,
+    "merge_sort_bottom_up": sorting.merge_sort_bottom_up,
+    "natural_merge_sort": sorting.natural_merge_sort,
+}
+QUADRATIC = {"insertion_sort", "bubble_sort_optimized"}
+SIZES = [10, 100, 1_000, 10_000, 100_000, 1_000_000]
+REGRESSION_THRESHOLD = 1.25 # Slower than baseline by this factor is reported
+
+
+# --- Input generators ---
+
+def random_input(n, rng):
+    return [rng.randrange(n * 10) for _ in range(n)]
+
+
+def sorted_input(n, rng):
+    return list(range(n))
+
+
+def reverse_input(n, rng):
+    return list(range(n, 0, -1))
+
+
+def few_unique_input(n, rng):
+    return [rng.randrange(10) for _ in range(n)]
+
+
+def nearly_sorted_input(n, rng):
+    data = list(range(n))
+    for _ in range(max(1, n // 100)): # Swap 1% of the positions
+        a = rng.randrange(n)
+        b = rng.randrange(n)
+        data[a], data[b] = data[b], data[a]
+    return data
+
+
+INPUTS = {
+    "random": random_input,
+    "sorted": sorted_input,
+    "reverse": reverse_input,
+    "few_unique": few_unique_input,
+    "nearly_sorted": nearly_sorted_input,
+}
+
+
+# --- Instrumentation ---
+
+class Counters:
+    def __init__(self):
+        self.comparisons = 0
+        self.writes = 0
+
+
+class CountedValue:
+    """Wraps a value and counts every comparison made with it."""
+
+    __slots__ = ("value", "counters")
+
+    def __init__(self, value, counters):
+        self.value = value
+        self.counters = counters
+
+    def __lt__(self, other):
+        self.counters.comparisons += 1
+        return self.value < other.value
+
+    def __le__(self, other):
+        self.counters.comparisons += 1
+        return self.value <= other.value
+
+    def __gt__(self, other):
+        self.counters.comparisons += 1
+        return self.value > other.value
+
+    def __ge__(self, other):
+        self.counters.comparisons += 1
+        return self.value >= other.value
+
+    def __eq__(self, other):
+        self.counters.comparisons += 1
+        return self.value == other.value
+
+    __hash__ = None
+
+
+class CountedList(list):
+    """List that counts item writes (in place only); slices share the same counters."""
+
+    def __init__(self, items, counters):
+        super().__init__(items)
+        self.counters = counters
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            self.counters.writes += len(range(*index.indices(len(self))))
+        else:
+            self.counters.writes += 1
+        super().__setitem__(index, value)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return CountedList(super().__getitem__(index), self.counters)
+        return super().__getitem__(index)
+
+
+# --- Measurements ---
+
+def measure_time(sort, data, repeat):
+    best = None
+    for _ in range(repeat):
+        arr = list(data)
+        start = time.perf_counter()
+        sort(arr)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    if arr != sorted(data):
+        raise AssertionError("output is not sorted")
+    return best
+
+
+def measure_counts(sort, data):
+    counters = Counters()
+    arr = CountedList((CountedValue(value, counters) for value in data), counters)
+    counters.writes = 0 # Building the list is not part of the sort
+    sort(arr)
+    return counters.comparisons, counters.writes
+
+
+def measure_memory(sort, data):
+    arr = list(data)
+    tracemalloc.start()
+    try:
+        sort(arr)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def run_case(name, input_name, n, data, args):
+    """Measures one (algorithm, input, size) combination and returns its result row."""
+    sort = ALGORITHMS[name]
+    result = {"algorithm": name, "input": input_name, "size": n}
+    try:
+        result["seconds"] = measure_time(sort, data, args.repeat)
+        if not args.no_counts:
+            result["comparisons"], result["inplace_writes"] = measure_counts(sort, data)
+        if not args.no_memory:
+            result["peak_bytes"] = measure_memory(sort, data)
+    except (RecursionError, AssertionError) as error:
+        result["error"] = type(error).__name__
+    return result
+
+
+def compare(results, baseline_path, threshold):
+    """Prints every case that got slower than the baseline by more than threshold."""
+    with open(baseline_path) as f:
+        baseline = {(r["algorithm"], r["input"], r["size"]): r for r in json.load(f)["results"]}
+
+    regressions = 0
+    for result in results:
+        old = baseline.get((result["algorithm"], result["input"], result["size"]))
+        if not old or "seconds" not in old or "seconds" not in result:
+            continue
+        ratio = result["seconds"] / old["seconds"] if old["seconds"] else 1.0
+        if ratio > threshold:
+            regressions += 1
+            print(f"REGRESSION {result['algorithm']} {result['input']} n={result['size']}: "
+                  f"{old['seconds']:.4f}s -> {result['seconds']:.4f}s ({ratio:.2f}x)")
+    print(f"{regressions} regression(s) against {baseline_path}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the S1C sorting algorithms.")
+    parser.add_argument("--algorithms", nargs="+", choices=sorted(ALGORITHMS), default=list(ALGORITHMS))
+    parser.add_argument("--inputs", nargs="+", choices=sorted(INPUTS), default=list(INPUTS))
+    parser.add_argument("--sizes", type=int, nargs="+", default=SIZES)
+    parser.add_argument("--quadratic-limit", type=int, default=10_000,
+                        help="largest size for the O(n^2) sorts")
+    parser.add_argument("--repeat", type=int, default=3, help="timing runs per case (best is kept)")
+    parser.add_argument("--no-counts", action="store_true", help="skip comparison/write counting")
+    parser.add_argument("--no-memory", action="store_true", help="skip peak memory measurement")
+    parser.add_argument("--seed", type=int, default=9569)
+    parser.add_argument("--output", help="write JSON results to this file")
+    parser.add_argument("--compare", help="baseline JSON file to check for regressions")
+    parser.add_argument("--threshold", type=float, default=REGRESSION_THRESHOLD)
+    args = parser.parse_args(argv)
+
+    results = []
+    print(f"{'algorithm':<22} {'input':<14} {'n':>9} {'seconds':>10} {'comparisons':>13} {'inplace_writes':>15} {'peak KB':>9}")
+    for n in args.sizes:
+        for input_name in args.inputs:
+            data = INPUTS[input_name](n, random.Random(args.seed))
+            for name in args.algorithms:
+                if name in QUADRATIC and n > args.quadratic_limit:
+                    continue
+                result = run_case(name, input_name, n, data, args)
+                results.append(result)
+                if "error" in result:
+                    print(f"{name:<22} {input_name:<14} {n:>9} {result['error']:>10}")
+                else:
+                    print(f"{name:<22} {input_name:<14} {n:>9} {result['seconds']:>10.5f} "
+                          f"{result.get('comparisons', '-'):>13} {result.get('inplace_writes', '-'):>15} "
+                          f"{result.get('peak_bytes', 0) // 1024:>9}")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({
+                "python": sys.version,
+                "platform": platform.platform(),
+                "seed": args.seed,
+                "results": results,
+            }, f, indent=1)
+    if args.compare and compare(results, args.compare, args.threshold):
+        return 1 # Regressions found
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
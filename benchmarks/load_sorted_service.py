@@ -0,0 +1,146 @@
+"""
+Load test for sorted_list.py and sorted_service.py.
+
+Three parts:
+  baseline   keeping a plain list sorted the S1B/S1C way (append, then
+             insertion_sort; lookups with binary_search_iterative) against
+             SortedList.add / `in`, on BASELINE_SIZE inserts
+  snapshot   saving and restoring PRELOAD items
+  service    CLIENT_COUNT local TCP clients, each sending REQUESTS_PER_CLIENT
+             requests (mostly HAS, some ADD, DEL and RANGE) to a
+             SortedListService preloaded with PRELOAD items; reports
+             throughput, latency percentiles per request type and how many
+             writes shared each batch
+
+Run from the repository root:
+  python -m benchmarks.load_sorted_service
+"""
+
+import asyncio
+import os
+import random
+import tempfile
+import time
+
+from searching import binary_search_iterative
+from sorted_list import SortedList, load_snapshot, save_snapshot
+from sorted_service import Client, SortedListService, serve
+from sorting import insertion_sort
+
+BASELINE_SIZE = 2_000
+PRELOAD = 1_000_000
+CLIENT_COUNT = 50
+REQUESTS_PER_CLIENT = 2_000
+KEY_SPACE = 4 * PRELOAD
+RANGE_WIDTH = 200 # Key span of each RANGE request (about 50 items)
+
+# Request type -> share of the requests
+MIX = {"HAS": 0.70, "ADD": 0.20, "DEL": 0.08, "RANGE": 0.02}
+
+
+def timed(func, *args):
+  start = time.perf_counter()
+  result = func(*args)
+  return time.perf_counter() - start, result
+
+
+def baseline(rng):
+  values = [rng.randrange(KEY_SPACE) for _ in range(BASELINE_SIZE)]
+
+  def plain_list():
+    data = []
+    for value in values:
+      data.append(value)
+      insertion_sort(data)
+    return sum(binary_search_iterative(value, data) != -1 for value in values)
+
+  def sorted_list():
+    data = SortedList()
+    for value in values:
+      data.add(value)
+    return sum(value in data for value in values)
+
+  plain_time, plain_found = timed(plain_list)
+  sorted_time, sorted_found = timed(sorted_list)
+  assert plain_found == sorted_found == BASELINE_SIZE
+  print(f"{'append + insertion_sort':<28} | {plain_time / BASELINE_SIZE * 1e6:>10.1f} us per insert+lookup")
+  print(f"{'SortedList':<28} | {sorted_time / BASELINE_SIZE * 1e6:>10.1f} us per insert+lookup")
+
+
+def snapshot(items):
+  path = os.path.join(tempfile.gettempdir(), "load_sorted_service.slst")
+  try:
+    save_time, _ = timed(save_snapshot, items, path)
+    size = os.path.getsize(path)
+    load_time, restored = timed(load_snapshot, path)
+    assert len(restored) == len(items)
+    print(f"{'snapshot save':<28} | {save_time * 1000:>10.1f} ms ({size / 1e6:.1f} MB)")
+    print(f"{'snapshot load':<28} | {load_time * 1000:>10.1f} ms")
+  finally:
+    if os.path.exists(path):
+      os.remove(path)
+
+
+def percentile(sorted_values, fraction):
+  return sorted_values[min(int(len(sorted_values) * fraction), len(sorted_values) - 1)]
+
+
+async def run_client(port, seed, latencies):
+  rng = random.Random(seed)
+  client = await Client.connect("127.0.0.1", port)
+  kinds = rng.choices(list(MIX), weights=list(MIX.values()), k=REQUESTS_PER_CLIENT)
+  try:
+    for kind in kinds:
+      key = rng.randrange(KEY_SPACE)
+      start = time.perf_counter()
+      if kind == "HAS":
+        await client.contains(key)
+      elif kind == "ADD":
+        await client.add(key)
+      elif kind == "DEL":
+        await client.remove(key)
+      else:
+        await client.range(key, key + RANGE_WIDTH)
+      latencies[kind].append(time.perf_counter() - start)
+  finally:
+    await client.close()
+
+
+async def service_load(items):
+  latencies = {kind: [] for kind in MIX}
+  service = await SortedListService(items).start()
+  server = await serve(service)
+  port = server.sockets[0].getsockname()[1]
+  try:
+    start = time.perf_counter()
+    await asyncio.gather(*(run_client(port, seed, latencies) for seed in range(CLIENT_COUNT)))
+    elapsed = time.perf_counter() - start
+  finally:
+    server.close()
+    await server.wait_closed()
+    await service.close()
+
+  total = CLIENT_COUNT * REQUESTS_PER_CLIENT
+  print(f"{'requests':<28} | {total} from {CLIENT_COUNT} clients in {elapsed:.2f} s "
+        f"({total / elapsed:,.0f} per second)")
+  for kind, values in latencies.items():
+    values.sort()
+    print(f"{kind + ' latency':<28} | p50 {percentile(values, 0.5) * 1e6:>8.0f} us | "
+          f"p99 {percentile(values, 0.99) * 1e6:>8.0f} us")
+  print(f"{'write batches':<28} | {service.batches} for {service.batched_writes} writes "
+        f"({service.batched_writes / max(service.batches, 1):.1f} per batch)")
+  print(f"{'items at end':<28} | {len(service)}")
+
+
+def main():
+  rng = random.Random(2020)
+  baseline(rng)
+  print("-" * 72)
+  items = SortedList.from_sorted(sorted(rng.randrange(KEY_SPACE) for _ in range(PRELOAD)))
+  snapshot(items)
+  print("-" * 72)
+  asyncio.run(service_load(items))
+
+
+if __name__ == "__main__":
+  main()
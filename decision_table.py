@@ -0,0 +1,532 @@
+"""
+Decision tables compiled into lookup-based rule engines (companion to S1A section 6).
+
+S1A describes decision tables as four quadrants: conditions stub, actions
+stub, condition entries and action entries, with one column per rule. This
+module loads such a table, simplifies it the way S1A section 6.6 does by
+hand (impossible rules dropped, rules that differ only in a "don't care"
+condition combined), and compiles it so that evaluating an input costs one
+array index instead of a chain of if/else:
+
+  table = DecisionTable.from_csv("produce_toys.csv").simplify()
+  print(table.to_markdown())
+  engine = compile_table(table)
+  engine.evaluate(("Y", "N", "Y"))        # -> ('', 'X', '')  (Repair product)
+  engine.evaluate_batch(columns)          # -> outcome id per row (NumPy)
+
+CSV layout (the S1A layout, rules as columns):
+
+  CONDITIONS,Rule 1,Rule 2,Rule 3
+  All dimensions correct?,Y,Y,N
+  Safety tests are passed?,Y,N,-
+  ACTIONS,,,
+  Accept product,X,,
+  Reject product,,X,X
+
+A condition entry of "-", "—" or blank means "don't care". An action entry of
+"*" marks an impossible rule, which is dropped. When rules overlap, the first
+matching rule (leftmost column) wins.
+
+compile_table() packs the conditions into one integer, ceil(log2(values))
+bits per condition, and fills a table of outcome ids indexed by it. Tables
+with too many conditions for that are compiled into a decision tree instead
+(S1A section 6.5), built directly from the rules so it never expands every
+combination.
+"""
+
+import csv
+import io
+import json
+from collections import namedtuple
+from collections.abc import Mapping
+from itertools import product
+
+import numpy as np
+
+DONT_CARE = {"", "-", "—", "–"}
+IMPOSSIBLE = "*"
+YES_NO = ("Y", "N")
+LOOKUP_BITS = 22 # Largest packed index compiled to a lookup table (4M entries)
+SIMPLIFY_LIMIT = 1 << 16 # Most combinations simplify() will expand
+NO_RULE = -1 # Outcome id of an input no rule covers
+SMALL_DOMAIN = 16 # Conditions with at most this many values are batch-encoded by comparison
+
+Rule = namedtuple("Rule", "conditions actions")
+
+
+class DecisionTableError(ValueError):
+    """Raised for malformed tables and inputs outside a condition's values."""
+
+
+def _limited_entry(cell, entries):
+    """Upper-cases y/n (or x) limited entries; extended entries such as "Red" keep their case."""
+    return cell.upper() if cell.upper() in entries else cell
+
+
+def _open_text(source):
+    """Returns (file, should_close) for a path or an already open text file."""
+    if isinstance(source, str):
+        return open(source, newline="", encoding="utf-8"), True
+    return source, False
+
+
+class DecisionTable:
+    """
+    Conditions stub, actions stub and rules of a decision table.
+
+    Args:
+      conditions: Condition names, in table order.
+      actions: Action names, in table order.
+      rules: Sequence of (condition entries, action entries). A condition
+        entry of None means "don't care".
+      domains: Optional {condition: values}. By default a condition whose
+        entries are all Y/N is limited entry (values Y, N) and any other is
+        extended entry with the values that appear in the table.
+    """
+
+    def __init__(self, conditions, actions, rules, domains=None):
+        self.conditions = list(conditions)
+        self.actions = list(actions)
+        self.rules = []
+        for number, (entries, outcome) in enumerate(rules, 1):
+            entries, outcome = tuple(entries), tuple(outcome)
+            if len(entries) != len(self.conditions) or len(outcome) != len(self.actions):
+                raise DecisionTableError(f"Rule {number} does not have one entry per condition and action")
+            self.rules.append(Rule(entries, outcome))
+        self.domains = [self._domain(i, (domains or {}).get(name)) for i, name in enumerate(self.conditions)]
+
+    def _domain(self, index, declared):
+        seen = [rule.conditions[index] for rule in self.rules if rule.conditions[index] is not None]
+        if declared is not None:
+            declared = tuple(declared)
+            unknown = set(seen) - set(declared)
+            if unknown:
+                raise DecisionTableError(f"Condition {self.conditions[index]!r} has undeclared values {sorted(unknown)}")
+            return declared
+        if set(seen) <= set(YES_NO):
+            return YES_NO
+        return tuple(dict.fromkeys(seen)) # Extended entry: values in order of appearance
+
+    # --- Loading and saving ---
+
+    @classmethod
+    def from_csv(cls, source):
+        """Loads a table in the S1A layout (see the module docstring) from a path or text file."""
+        f, close = _open_text(source)
+        try:
+            rows = [[cell.strip() for cell in row] for row in csv.reader(f) if any(cell.strip() for cell in row)]
+        finally:
+            if close:
+                f.close()
+        if not rows:
+            raise DecisionTableError("Empty decision table")
+        rule_count = len(rows[0]) - 1
+        split = next((i for i, row in enumerate(rows) if row[0].upper() == "ACTIONS"), None)
+        if split is None:
+            raise DecisionTableError("No ACTIONS row separating conditions from actions")
+
+        def entries(row):
+            cells = row[1:] + [""] * (rule_count - len(row) + 1)
+            return cells[:rule_count]
+
+        condition_rows = rows[1:split]
+        action_rows = rows[split + 1:]
+        columns = [
+            ([None if cells[r] in DONT_CARE else _limited_entry(cells[r], YES_NO)
+              for cells in map(entries, condition_rows)],
+             [_limited_entry(cells[r], ("X",)) for cells in map(entries, action_rows)])
+            for r in range(rule_count)]
+        return cls([row[0] for row in condition_rows], [row[0] for row in action_rows], columns)
+
+    @classmethod
+    def from_json(cls, source):
+        """
+        Loads a table from JSON:
+
+          {"conditions": ["C1", {"name": "Colour", "values": ["Red", "Blue"]}],
+           "actions": ["A1", "A2"],
+           "rules": [{"conditions": ["Y", "Red"], "actions": ["X", ""]}, ...]}
+
+        A condition entry of null or "-" means "don't care".
+        """
+        f, close = _open_text(source)
+        try:
+            data = json.load(f)
+        finally:
+            if close:
+                f.close()
+        names, domains = [], {}
+        for condition in data["conditions"]:
+            if isinstance(condition, Mapping):
+                names.append(condition["name"])
+                if "values" in condition:
+                    domains[condition["name"]] = condition["values"]
+            else:
+                names.append(condition)
+        rules = [([None if entry is None or entry in DONT_CARE else entry for entry in rule["conditions"]],
+                  rule["actions"])
+                 for rule in data["rules"]]
+        return cls(names, data["actions"], rules, domains)
+
+    def to_markdown(self):
+        """Returns the table in the S1A layout as Markdown."""
+        width = len(self.rules)
+        header = ["CONDITIONS"] + [f"Rule {number}" for number in range(1, width + 1)]
+        lines = ["| " + " | ".join(header) + " |", "| :--- |" + " :---: |" * width]
+        for i, name in enumerate(self.conditions):
+            cells = ["—" if rule.conditions[i] is None else str(rule.conditions[i]) for rule in self.rules]
+            lines.append("| " + " | ".join([name] + cells) + " |")
+        lines.append("| **ACTIONS** |" + " |" * width)
+        for i, name in enumerate(self.actions):
+            lines.append("| " + " | ".join([name] + [rule.actions[i] for rule in self.rules]) + " |")
+        return "\n".join(lines)
+
+    # --- Analysis and simplification ---
+
+    def combinations(self):
+        """Number of possible inputs (2^n for n limited-entry conditions)."""
+        count = 1
+        for domain in self.domains:
+            count *= len(domain)
+        return count
+
+    def _possible_rules(self):
+        return [rule for rule in self.rules if IMPOSSIBLE not in rule.actions]
+
+    def evaluate_naive(self, values):
+        """
+        Returns the action entries of the first rule matching values, or None.
+
+        This is the direct reading of the table, one condition test per rule,
+        and is the reference the compiled engines are checked against.
+        """
+        for entries, outcome in self._possible_rules():
+            for entry, value in zip(entries, values):
+                if entry is not None and entry != value:
+                    break
+            else:
+                return outcome
+        return None
+
+    def expand(self):
+        """Returns {input combination: action entries} for every covered input."""
+        if self.combinations() > SIMPLIFY_LIMIT:
+            raise DecisionTableError(f"{self.combinations()} combinations is too many to expand")
+        expanded = {}
+        for entries, outcome in self._possible_rules():
+            choices = [domain if entry is None else (entry,) for entry, domain in zip(entries, self.domains)]
+            for values in product(*choices):
+                expanded.setdefault(values, outcome) # First matching rule wins
+        return expanded
+
+    def missing(self):
+        """Input combinations no rule covers (S1A: a complete table covers all 2^n)."""
+        expanded = self.expand()
+        return [values for values in product(*self.domains) if values not in expanded]
+
+    def simplify(self):
+        """
+        Returns an equivalent table with redundant rules removed.
+
+        Following S1A section 6.6: impossible rules are dropped, rules that
+        are never reached (because earlier rules cover all their inputs) are
+        dropped, and rules with the same actions that together cover every
+        value of one condition are combined into a single rule with "—" for
+        it, repeatedly, until no more rules can be combined.
+        """
+        rules = set(self.expand().items())
+        merged = True
+        while merged:
+            merged = False
+            # Last condition first, as S1A combines rules 5-8 on C3 and then C2
+            for position in reversed(range(len(self.domains))):
+                domain = self.domains[position]
+                groups = {}
+                for entries, outcome in rules:
+                    if entries[position] is not None:
+                        rest = entries[:position] + (None,) + entries[position + 1:]
+                        groups.setdefault((rest, outcome), []).append(entries)
+                for (rest, outcome), members in groups.items():
+                    if len(members) == len(domain): # Rules are disjoint, so this covers the domain
+                        rules.difference_update((entries, outcome) for entries in members)
+                        rules.add((rest, outcome))
+                        merged = True
+
+        orders = [{value: index for index, value in enumerate(domain)} for domain in self.domains]
+        def order(rule):
+            return tuple(len(o) if entry is None else o[entry] for entry, o in zip(rule[0], orders))
+        domains = dict(zip(self.conditions, self.domains))
+        return DecisionTable(self.conditions, self.actions, sorted(rules, key=order), domains)
+
+
+# --- Compiled engines ---
+
+class _Engine:
+    """Shared outcome numbering and input encoding for the compiled engines."""
+
+    def __init__(self, table):
+        self.conditions = table.conditions
+        self.actions = table.actions
+        self.outcomes = list(dict.fromkeys(rule.actions for rule in table._possible_rules()))
+        self.outcome_ids = {outcome: index for index, outcome in enumerate(self.outcomes)}
+        self.domains = table.domains
+
+    def _values(self, values):
+        if isinstance(values, dict): # Not the Mapping ABC, whose check costs more than the lookup
+            return [values[name] for name in self.conditions]
+        return values
+
+    def _columns(self, rows):
+        """Returns one NumPy array per condition from a mapping of columns or a 2D array of rows."""
+        if isinstance(rows, Mapping):
+            return [np.asarray(rows[name]) for name in self.conditions]
+        rows = np.asarray(rows)
+        if rows.ndim != 2 or rows.shape[1] != len(self.conditions):
+            raise DecisionTableError(f"Expected rows of {len(self.conditions)} condition values")
+        return [rows[:, i] for i in range(len(self.conditions))]
+
+    def _encode_column(self, index, column, codes):
+        """Maps a column of condition values to codes, checking that every value is known."""
+        if len(codes) <= SMALL_DOMAIN: # One vectorised comparison per value beats sorting the column
+            encoded = np.zeros(len(column), dtype=np.int64)
+            known = np.zeros(len(column), dtype=bool)
+            for value, code in codes.items():
+                matches = column == value
+                encoded[matches] = code
+                known |= matches
+            if not known.all():
+                first = int(np.argmin(known))
+                unknown = column[first:first + 1].tolist()[0]
+                raise DecisionTableError(f"{unknown!r} is not a value of condition {self.conditions[index]!r}")
+            return encoded
+        distinct, inverse = np.unique(column, return_inverse=True)
+        try:
+            mapped = np.array([codes[value] for value in distinct.tolist()], dtype=np.int64)
+        except KeyError as e:
+            raise DecisionTableError(f"{e.args[0]!r} is not a value of condition {self.conditions[index]!r}") from None
+        return mapped[inverse]
+
+    def outcome(self, outcome_id):
+        """Action entries for an outcome id, or None for NO_RULE."""
+        return None if outcome_id == NO_RULE else self.outcomes[outcome_id]
+
+    def action_names(self, outcome):
+        """Names of the actions an outcome performs (non-blank entries)."""
+        return [name for name, entry in zip(self.actions, outcome or ()) if entry]
+
+
+class LookupTable(_Engine):
+    """
+    A decision table compiled into one array of outcome ids.
+
+    Each condition value has a code that is pre-shifted into its bit field,
+    so an input's index is the sum of its codes and evaluation is one table
+    read. Inputs no rule covers map to NO_RULE.
+    """
+
+    def __init__(self, table):
+        super().__init__(table)
+        self.codes = []
+        shift = 0
+        for domain in self.domains:
+            self.codes.append({value: code << shift for code, value in enumerate(domain)})
+            shift += max(1, (len(domain) - 1).bit_length())
+        if shift > LOOKUP_BITS:
+            raise DecisionTableError(f"{shift} condition bits is too many for a lookup table")
+        self.bits = shift
+
+        self.table = np.full(1 << shift, NO_RULE, dtype=np.int32)
+        for entries, outcome in reversed(table._possible_rules()): # Earlier rules overwrite later ones
+            choices = [codes.values() if entry is None else (codes[entry],)
+                       for entry, codes in zip(entries, self.codes)]
+            indices = np.zeros(1, dtype=np.int64)
+            for choice in choices:
+                indices = (indices[:, None] + np.fromiter(choice, dtype=np.int64)[None, :]).ravel()
+            self.table[indices] = self.outcome_ids[outcome]
+        self._index = self._compile_index()
+
+    def _compile_index(self):
+        """
+        Generates index(values) -> outcome id as straight-line code, e.g.
+        `v0, v1, v2 = values; return ids[codes0[v0] + codes1[v1] + codes2[v2]]`,
+        so a scalar evaluation runs no Python loop.
+        """
+        namespace = {f"codes{i}": codes for i, codes in enumerate(self.codes)}
+        namespace["ids"] = self.table.tolist() # A list indexes faster than an array from Python
+        count = len(self.codes)
+        if count:
+            unpack = "".join(f"v{i}, " for i in range(count))
+            index = " + ".join(f"codes{i}[v{i}]" for i in range(count))
+            source = f"def index(values):\n    {unpack}= values\n    return ids[{index}]"
+        else:
+            source = "def index(values):\n    return ids[0]"
+        exec(compile(source, "<decision table>", "exec"), namespace)
+        return namespace["index"]
+
+    def evaluate_id(self, values):
+        """Outcome id for one input (a sequence in condition order, or a dict by condition name)."""
+        if isinstance(values, dict):
+            values = [values[name] for name in self.conditions]
+        try:
+            return self._index(values)
+        except KeyError as e:
+            raise DecisionTableError(f"{e.args[0]!r} is not a value of its condition") from None
+        except ValueError:
+            raise DecisionTableError(f"Expected {len(self.codes)} condition values, got {values!r}") from None
+
+    def evaluate(self, values):
+        """Action entries of the rule matching one input, or None."""
+        outcome_id = self.evaluate_id(values)
+        return None if outcome_id == NO_RULE else self.outcomes[outcome_id]
+
+    def evaluate_batch(self, rows):
+        """
+        Outcome ids for many inputs at once.
+
+        Args:
+          rows: A mapping {condition: column of values} or a 2D array with
+            one row per input.
+
+        Returns:
+          An int32 array of outcome ids (NO_RULE where uncovered); see outcomes.
+        """
+        columns = self._columns(rows)
+        index = np.zeros(len(columns[0]) if columns else 0, dtype=np.int64)
+        for i, (codes, column) in enumerate(zip(self.codes, columns)):
+            index += self._encode_column(i, column, codes)
+        return self.table[index]
+
+
+class DecisionTree(_Engine):
+    """
+    A decision table compiled into a decision tree (S1A section 6.5).
+
+    Each node tests one condition and branches on its value; leaves hold
+    outcome ids. The tree is built from the rules in first-match order, so it
+    tests only the conditions that still matter on each path.
+    """
+
+    def __init__(self, table):
+        super().__init__(table)
+        self.codes = [{value: value for value in domain} for domain in self.domains]
+        rules = [(entries, self.outcome_ids[outcome]) for entries, outcome in table._possible_rules()]
+        self.root = self._build(rules, [None] * len(self.conditions))
+
+    def _build(self, rules, assigned):
+        """Returns an outcome id (leaf) or (condition index, {value: subtree})."""
+        if not rules:
+            return NO_RULE
+        first_entries, first_outcome = rules[0]
+        undecided = [i for i, entry in enumerate(first_entries) if entry is not None and assigned[i] is None]
+        if not undecided: # The first remaining rule matches everything here
+            return first_outcome
+        # Split on the undecided condition the remaining rules test most often
+        split = max(undecided, key=lambda i: sum(entries[i] is not None for entries, _ in rules))
+        branches = {}
+        for value in self.domains[split]:
+            assigned[split] = value
+            branch_rules = [(entries, outcome) for entries, outcome in rules
+                            if entries[split] is None or entries[split] == value]
+            branches[value] = self._build(branch_rules, assigned)
+        assigned[split] = None
+        return split, branches
+
+    def depth(self):
+        """Longest path from the root to a leaf, in condition tests."""
+        def node_depth(node):
+            if not isinstance(node, tuple):
+                return 0
+            return 1 + max(node_depth(child) for child in node[1].values())
+        return node_depth(self.root)
+
+    def evaluate_id(self, values):
+        """Outcome id for one input (a sequence in condition order, or a dict by condition name)."""
+        values = self._values(values)
+        node = self.root
+        while type(node) is tuple:
+            condition, branches = node
+            try:
+                node = branches[values[condition]]
+            except KeyError:
+                raise DecisionTableError(f"{values[condition]!r} is not a value of condition "
+                                         f"{self.conditions[condition]!r}") from None
+        return node
+
+    def evaluate(self, values):
+        """Action entries of the rule matching one input, or None."""
+        return self.outcome(self.evaluate_id(values))
+
+    def evaluate_batch(self, rows):
+        """Outcome ids for many inputs, routing whole groups of rows down each branch."""
+        columns = self._columns(rows)
+        count = len(columns[0]) if columns else 0
+        codes = [self._encode_column(i, column, {value: n for n, value in enumerate(domain)})
+                 for i, (column, domain) in enumerate(zip(columns, self.domains))]
+        result = np.full(count, NO_RULE, dtype=np.int32)
+        pending = [(self.root, np.arange(count))]
+        while pending:
+            node, rows_here = pending.pop()
+            if type(node) is not tuple:
+                result[rows_here] = node
+                continue
+            condition, branches = node
+            column = codes[condition][rows_here]
+            for n, value in enumerate(self.domains[condition]):
+                selected = rows_here[column == n]
+                if len(selected):
+                    pending.append((branches[value], selected))
+        return result
+
+
+def compile_table(table, method="auto"):
+    """
+    Compiles a DecisionTable for fast evaluation.
+
+    Args:
+      table: The DecisionTable (simplify() it first to shrink a tree).
+      method: "lookup" for a bit-packed LookupTable, "tree" for a
+        DecisionTree, or "auto" to use a lookup table when the packed index
+        fits in LOOKUP_BITS bits.
+
+    Returns:
+      A LookupTable or DecisionTree with evaluate(), evaluate_id() and
+      evaluate_batch().
+    """
+    if method == "auto":
+        bits = sum(max(1, (len(domain) - 1).bit_length()) for domain in table.domains)
+        method = "lookup" if bits <= LOOKUP_BITS else "tree"
+    if method == "lookup":
+        return LookupTable(table)
+    if method == "tree":
+        return DecisionTree(table)
+    raise ValueError(f"Unknown compile method {method!r}")
+
+
+PRODUCE_TOYS_CSV = """\
+CONDITIONS,Rule 1,Rule 2,Rule 3,Rule 4,Rule 5,Rule 6,Rule 7,Rule 8
+All dimensions correct?,Y,Y,Y,Y,N,N,N,N
+Safety tests are passed?,Y,Y,N,N,Y,Y,N,N
+Paint tests are passed?,Y,N,Y,N,Y,N,Y,N
+ACTIONS,,,,,,,,
+Accept product,X,,,,,,,
+Repair product,,X,X,,,,,
+Reject product,,,,X,X,X,X,X
+"""
+
+
+# Example usage
+if __name__ == "__main__":
+    # The unsimplified "Produce Toys" table from S1A section 6.6
+    toys = DecisionTable.from_csv(io.StringIO(PRODUCE_TOYS_CSV))
+    simplified = toys.simplify()
+    print(simplified.to_markdown())
+    print()
+
+    for method in ("lookup", "tree"):
+        engine = compile_table(simplified, method)
+        for values in [("Y", "Y", "Y"), ("Y", "N", "Y"), ("N", "Y", "N")]:
+            print(f"{method:<6} {values} -> {engine.action_names(engine.evaluate(values))}")
+        ids = engine.evaluate_batch({"All dimensions correct?": ["Y", "Y", "N"],
+                                     "Safety tests are passed?": ["Y", "N", "N"],
+                                     "Paint tests are passed?": ["Y", "N", "Y"]})
+        print(f"{method:<6} batch -> {[engine.action_names(engine.outcome(i)) for i in ids]}")
@@ -0,0 +1,248 @@
+"""
+External merge sort for files larger than memory (companion to S1C).
+
+Every sort in S1C works on a list held in memory. This module sorts a text
+file of newline-separated records in two phases:
+
+  1. Split: the input is cut into chunks of about chunk_bytes at line
+     boundaries. Each worker process reads its own chunk straight from the
+     input file, sorts it with natural_merge_sort from sorting.py and spills
+     it to a temporary run file. Only the chunk offsets travel between
+     processes.
+  2. Merge: the sorted runs are k-way merged with a heap (heapq.merge) using
+     buffered reads and writes. If there are more runs than max_fan_in, they
+     are merged in several passes so the number of open files stays bounded.
+
+Records are compared as bytes without their line terminator, or by a key
+function. The sort is stable: runs are merged in input order and heapq.merge
+prefers earlier runs on ties.
+
+Usage:
+  python external_sort.py input.txt output.txt --memory 512M --workers 4
+  python external_sort.py scores.csv sorted.csv --field 2 --separator , --numeric
+"""
+
+import argparse
+import heapq
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+from sorting import natural_merge_sort
+
+MEMORY_BUDGET = 256 * 1024 * 1024  # Default total memory budget in bytes
+MAX_FAN_IN = 256                   # Most runs merged (files opened) at once
+MIN_BUFFER = 64 * 1024             # Smallest read/write buffer per file
+MAX_BUFFER = 4 * 1024 * 1024       # Largest read/write buffer per file
+MEMORY_OVERHEAD = 4                # Python lists of bytes take ~4x the raw chunk size
+
+
+class FieldKey:
+    """
+    Picklable key function that sorts by one field of a delimited record.
+
+    Example:
+        FieldKey(2, b",", numeric=True)(b"alice,17,83.5")  # -> 83.5
+    """
+
+    def __init__(self, field, separator=None, numeric=False):
+        """
+        Args:
+            field: 0-based index of the field to sort by.
+            separator: Field separator as bytes (None splits on whitespace).
+            numeric: Compare the field as a float instead of as bytes.
+        """
+        self.field = field
+        self.separator = separator
+        self.numeric = numeric
+
+    def __call__(self, record):
+        value = record.split(self.separator)[self.field]
+        return float(value) if self.numeric else value
+
+
+def chunk_boundaries(path, chunk_bytes):
+    """
+    Splits a file into (start, end) byte ranges of about chunk_bytes, each
+    ending just after a newline so that no record is cut in two.
+    """
+    size = os.path.getsize(path)
+    boundaries = []
+    with open(path, "rb") as f:
+        start = 0
+        while start < size:
+            f.seek(min(start + chunk_bytes, size))
+            f.readline() # Advance to the end of the current record
+            end = min(f.tell(), size)
+            boundaries.append((start, end))
+            start = end
+    return boundaries
+
+
+def _sort_records(records, key):
+    """Stably sorts a list of records in place with natural_merge_sort."""
+    if key is None:
+        natural_merge_sort(records)
+        return records
+    # Decorate with the position so ties fall back to input order, not to the record
+    decorated = [(key(record), index, record) for index, record in enumerate(records)]
+    natural_merge_sort(decorated)
+    return [record for _, _, record in decorated]
+
+
+def sort_chunk(path, start, end, key, temp_dir):
+    """
+    Worker: sorts bytes [start, end) of the input and writes them to a run file.
+
+    Returns:
+        The path of the run file.
+    """
+    with open(path, "rb") as f:
+        f.seek(start)
+        data = f.read(end - start)
+    records = data.split(b"\n")
+    if records[-1] == b"":
+        records.pop() # The chunk ended with a newline
+    del data
+    records = _sort_records(records, key)
+
+    run = tempfile.NamedTemporaryFile(dir=temp_dir, suffix=".run", delete=False)
+    with run:
+        for record in records:
+            run.write(record)
+            run.write(b"\n")
+    return run.name
+
+
+def _read_records(path, buffer_size):
+    """Yields the records of a run file without their newline, using buffered reads."""
+    with open(path, "rb", buffering=buffer_size) as f:
+        for line in f:
+            yield line[:-1]
+
+
+def merge_runs(runs, output, key=None, buffer_size=MAX_BUFFER):
+    """
+    k-way merges sorted run files into output with a heap.
+
+    Runs must be given in input order for the result to be stable.
+    """
+    streams = [_read_records(run, buffer_size) for run in runs]
+    with open(output, "wb", buffering=buffer_size) as out:
+        for record in heapq.merge(*streams, key=key):
+            out.write(record)
+            out.write(b"\n")
+    return output
+
+
+def _merge_group(runs, key, buffer_size, temp_dir):
+    """Worker: merges a group of runs into a new run file, deleting the inputs."""
+    run = tempfile.NamedTemporaryFile(dir=temp_dir, suffix=".run", delete=False)
+    run.close()
+    merge_runs(runs, run.name, key, buffer_size)
+    for path in runs:
+        os.remove(path)
+    return run.name
+
+
+def _buffer_size(memory_budget, files):
+    """Splits the memory budget between the files that are open at once."""
+    return max(MIN_BUFFER, min(MAX_BUFFER, memory_budget // (files + 1)))
+
+
+def external_sort(input_path, output_path, memory_budget=MEMORY_BUDGET, workers=None,
+                  key=None, temp_dir=None, max_fan_in=MAX_FAN_IN):
+    """
+    Sorts the lines of input_path into output_path using bounded memory.
+
+    Args:
+        input_path: Text file with one record per line.
+        output_path: Where to write the sorted records (may equal input_path).
+        memory_budget: Approximate total memory to use, in bytes. Each of the
+            workers gets an equal share for its chunk.
+        workers: Number of sorting processes (default: one per CPU).
+        key: Optional key function taking a record (bytes, no newline). Must be
+            picklable, e.g. a module-level function or a FieldKey.
+        temp_dir: Directory for run files (default: next to output_path).
+        max_fan_in: Largest number of runs merged in one pass.
+
+    Returns:
+        The number of run files produced by the split phase.
+    """
+    workers = workers or os.cpu_count() or 1
+    if temp_dir is None:
+        temp_dir = os.path.dirname(os.path.abspath(output_path))
+    chunk_bytes = max(1, memory_budget // (workers * MEMORY_OVERHEAD))
+
+    boundaries = chunk_boundaries(input_path, chunk_bytes)
+    futures = [] # Every task submitted, so runs finished before a failure are still removed
+    runs = []
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            try:
+                # Phase 1: sort chunks in parallel
+                futures = [pool.submit(sort_chunk, input_path, start, end, key, temp_dir)
+                           for start, end in boundaries]
+                runs = [future.result() for future in futures]
+                run_count = len(runs)
+
+                # Merge in several passes while there are too many runs to open at once
+                while len(runs) > max_fan_in:
+                    groups = [runs[i:i + max_fan_in] for i in range(0, len(runs), max_fan_in)]
+                    buffer_size = _buffer_size(memory_budget // workers, max_fan_in)
+                    merges = [pool.submit(_merge_group, group, key, buffer_size, temp_dir)
+                              for group in groups]
+                    futures += merges
+                    runs = [future.result() for future in merges]
+            except BaseException:
+                # Drop the tasks that have not started and wait for the running ones
+                pool.shutdown(wait=True, cancel_futures=True)
+                raise
+
+        # Phase 2: final k-way merge
+        merge_runs(runs, output_path, key, _buffer_size(memory_budget, len(runs)))
+    finally:
+        finished = [future.result() for future in futures
+                    if future.done() and not future.cancelled() and future.exception() is None]
+        for run in set(runs).union(finished):
+            if os.path.exists(run):
+                os.remove(run)
+    return run_count
+
+
+def parse_size(text):
+    """Parses sizes such as '512M', '2G' or '1048576' into bytes."""
+    units = {"K": 1 << 10, "M": 1 << 20, "G": 1 << 30}
+    text = text.strip().upper().rstrip("B")
+    if text and text[-1] in units:
+        return int(float(text[:-1]) * units[text[-1]])
+    return int(text)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sort a file of lines larger than memory.")
+    parser.add_argument("input")
+    parser.add_argument("output")
+    parser.add_argument("-m", "--memory", type=parse_size, default=MEMORY_BUDGET,
+                        help="memory budget, e.g. 512M (default 256M)")
+    parser.add_argument("-j", "--workers", type=int, default=None, help="number of sorting processes")
+    parser.add_argument("--field", type=int, default=None, help="sort by this 0-based field")
+    parser.add_argument("--separator", default=None, help="field separator (default: whitespace)")
+    parser.add_argument("--numeric", action="store_true", help="compare the sort field as a number")
+    parser.add_argument("--temp-dir", default=None, help="directory for temporary run files")
+    args = parser.parse_args(argv)
+
+    key = None
+    if args.field is not None:
+        separator = args.separator.encode() if args.separator is not None else None
+        key = FieldKey(args.field, separator, args.numeric)
+    elif args.numeric:
+        key = float
+
+    runs = external_sort(args.input, args.output, memory_budget=args.memory,
+                         workers=args.workers, key=key, temp_dir=args.temp_dir)
+    print(f"Sorted {args.input} -> {args.output} ({runs} runs)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+Stack-safe factorial (companion to S2A section 6, Recursion).
+
+factorial_recursive in S2A pushes one stack frame per n, so it raises
+RecursionError near n = 1000, and it multiplies a huge running product by
+one small number at a time. The functions here never recurse: they multiply
+the numbers 1..n as a balanced product tree (binary splitting), so the
+expensive big-int multiplications are always between operands of similar
+size.
+"""
+
+from bisect import bisect_right, insort
+
+LEAF_SIZE = 32 # Numbers multiplied directly before joining the tree
+
+
+def _check(n):
+    if not isinstance(n, int) or n < 0:
+        raise ValueError(f"Factorial is only defined for non-negative integers, got {n!r}")
+
+
+def range_product(low, high):
+    """
+    Returns low * (low + 1) * ... * high (1 if the range is empty).
+
+    The range is cut into small leaves that are multiplied directly, then
+    neighbouring products are multiplied pairwise, level by level, until one
+    remains. Uses a loop per level instead of recursion.
+    """
+    if low > high:
+        return 1
+    level = []
+    for start in range(low, high + 1, LEAF_SIZE):
+        product = 1
+        for value in range(start, min(start + LEAF_SIZE, high + 1)):
+            product *= value
+        level.append(product)
+
+    while len(level) > 1:
+        paired = [level[i] * level[i + 1] for i in range(0, len(level) - 1, 2)]
+        if len(level) % 2 == 1:
+            paired.append(level[-1]) # Odd one out moves up unchanged
+        level = paired
+    return level[0]
+
+
+def factorial(n):
+    """Returns n! using a balanced product tree. Never recurses."""
+    _check(n)
+    return range_product(2, n)
+
+
+class FactorialTable:
+    """
+    Answers repeated factorial queries from checkpointed precomputed values.
+
+    Checkpoints are factorials of multiples of `interval`. A query for n
+    starts from the largest stored checkpoint <= n, multiplies in the rest
+    of the range as a product tree, and stores (n // interval * interval)!
+    as a new checkpoint. A cold query therefore costs about the same as
+    factorial(n), and later queries near or above it only pay for the gap.
+
+    Example:
+      table = FactorialTable(interval=1000)
+      table.factorial(12345)
+    """
+
+    def __init__(self, interval=1024, max_checkpoints=None):
+        """
+        Args:
+          interval: Checkpoints are only stored for multiples of this.
+          max_checkpoints: Maximum number of stored checkpoints (None for no
+            limit). When full, the smallest non-zero checkpoint is dropped.
+        """
+        if interval < 1:
+            raise ValueError("interval must be at least 1")
+        self.interval = interval
+        self.max_checkpoints = max_checkpoints
+        self.keys = [0]          # Sorted checkpoint positions
+        self.values = {0: 1}     # position -> position!
+
+    def factorial(self, n):
+        """Returns n!, reusing and extending the stored checkpoints."""
+        _check(n)
+        start = self.keys[bisect_right(self.keys, n) - 1]
+        value = self.values[start]
+        checkpoint = n // self.interval * self.interval
+
+        if checkpoint > start:
+            value *= range_product(start + 1, checkpoint)
+            self._store(checkpoint, value)
+            start = checkpoint
+        return value * range_product(start + 1, n)
+
+    def _store(self, position, value):
+        insort(self.keys, position)
+        self.values[position] = value
+        if self.max_checkpoints is not None and len(self.keys) > self.max_checkpoints:
+            evicted = self.keys.pop(1) # Keep 0! so every query has a start
+            del self.values[evicted]
+
+    def clear(self):
+        """Drops every checkpoint except 0!."""
+        self.keys = [0]
+        self.values = {0: 1}
+
+
+# Example usage
+if __name__ == "__main__":
+    print(f"Factorial(5) = {factorial(5)}")
+    print(f"Factorial(0) = {factorial(0)}")
+    print(f"Factorial(5000) has {factorial(5000).bit_length()} bits") # factorial_recursive overflows here
+    table = FactorialTable(interval=100)
+    print(f"Table factorial(250) == factorial(250): {table.factorial(250) == factorial(250)}")
@@ -0,0 +1,143 @@
+"""
+Fast Fibonacci numbers (companion to S2A section 6, Recursion).
+
+fibonacci_recursive in S2A is O(2^n) and fibonacci_iterative is O(n) big-int
+additions. The functions here use the fast-doubling identities
+
+  F(2k)   = F(k) * (2*F(k+1) - F(k))
+  F(2k+1) = F(k)^2 + F(k+1)^2
+
+so F(n) needs only O(log n) big-int multiplications, which keeps n in the
+millions practical.
+"""
+
+from functools import lru_cache
+
+MEMO_SIZE = 1024   # Entries kept by fibonacci_memoized's LRU cache
+STEP_LIMIT = 64    # fib_many walks gaps up to this size with plain additions
+
+
+def _check(n):
+    if not isinstance(n, int) or n < 0:
+        raise ValueError(f"Fibonacci is only defined for non-negative integers, got {n!r}")
+
+
+def fib_pair(n):
+    """
+    Returns (F(n), F(n+1)) using iterative fast doubling.
+
+    Walks the bits of n from the most significant end, so it never recurses
+    and performs about 3 multiplications per bit.
+    """
+    _check(n)
+    a, b = 0, 1 # (F(0), F(1))
+    for bit in bin(n)[2:]:
+        # Doubling step: (F(k), F(k+1)) -> (F(2k), F(2k+1))
+        c = a * ((b << 1) - a)
+        d = a * a + b * b
+        if bit == "1":
+            a, b = d, c + d # Advance one more: (F(2k+1), F(2k+2))
+        else:
+            a, b = c, d
+    return a, b
+
+
+def fibonacci_fast_doubling(n):
+    """Returns F(n) in O(log n) multiplications (fast doubling)."""
+    return fib_pair(n)[0]
+
+
+def _matrix_multiply(x, y):
+    """Multiplies two symmetric 2x2 matrices stored as (top-left, off-diagonal, bottom-right)."""
+    a, b, c = x
+    d, e, f = y
+    return (a * d + b * e, a * e + b * f, b * e + c * f)
+
+
+def fibonacci_matrix(n):
+    """
+    Returns F(n) by exponentiating [[1, 1], [1, 0]] with repeated squaring.
+
+    [[1, 1], [1, 0]]^n = [[F(n+1), F(n)], [F(n), F(n-1)]]. Powers of this
+    matrix are symmetric, so only three entries are stored.
+    """
+    _check(n)
+    result = (1, 0, 1)  # Identity
+    base = (1, 1, 0)
+    while n > 0:
+        if n & 1:
+            result = _matrix_multiply(result, base)
+        base = _matrix_multiply(base, base)
+        n >>= 1
+    return result[1]
+
+
+@lru_cache(maxsize=MEMO_SIZE)
+def _memo_pair(n):
+    if n == 0:
+        return 0, 1
+    a, b = _memo_pair(n >> 1) # Recursion depth is only log2(n)
+    c = a * ((b << 1) - a)
+    d = a * a + b * b
+    if n & 1:
+        return d, c + d
+    return c, d
+
+
+def fibonacci_memoized(n):
+    """
+    Returns F(n) with a bounded LRU-memoized recursive definition.
+
+    Recurses on n // 2 (fast doubling) rather than n - 1 and n - 2, so the
+    depth is log2(n) and repeated queries for nearby n share cached halves.
+    The cache holds at most MEMO_SIZE entries; call
+    fibonacci_memoized.cache_clear() to release them.
+    """
+    _check(n)
+    return _memo_pair(n)[0]
+
+
+fibonacci_memoized.cache_clear = _memo_pair.cache_clear
+fibonacci_memoized.cache_info = _memo_pair.cache_info
+
+
+def fib_many(ns):
+    """
+    Returns [F(n) for n in ns], reusing work between queries.
+
+    The distinct values are processed in ascending order. Each one is reached
+    from the previous pair (F(a), F(a+1)): small gaps are walked with
+    additions, larger gaps d use the addition formula
+
+      F(a+d)   = F(a) * F(d+1) + F(a+1) * F(d) - F(a) * F(d)
+      F(a+d+1) = F(a+1) * F(d+1) + F(a) * F(d)
+
+    with (F(d), F(d+1)) from fast doubling, which is cheaper than starting
+    from scratch because d <= a + d.
+    """
+    ns = list(ns)
+    for n in ns:
+        _check(n)
+
+    results = {}
+    prev = 0
+    a, b = 0, 1 # (F(prev), F(prev+1))
+    for n in sorted(set(ns)):
+        gap = n - prev
+        if gap <= STEP_LIMIT:
+            for _ in range(gap):
+                a, b = b, a + b
+        else:
+            fd, fd1 = fib_pair(gap)
+            a, b = a * fd1 + b * fd - a * fd, b * fd1 + a * fd
+        results[n] = a
+        prev = n
+    return [results[n] for n in ns]
+
+
+# Example usage
+if __name__ == "__main__":
+    print(f"F(10) = {fibonacci_fast_doubling(10)}")
+    print(f"F(90) = {fibonacci_matrix(90)}")
+    print(f"F(1000) has {len(str(fibonacci_memoized(1000)))} digits")
+    print(f"fib_many([10, 5, 200, 10]) = {fib_many([10, 5, 200, 10])[:2]} ...")
@@ -1,7 +1,162 @@
-import jupytext
-
-# Load the .py file as a notebook
-nb = jupytext.read("temp.py")
-
-# Save it as .ipynb
-jupytext.write(nb, "temp.ipynb")
\ No newline at end of file
+"""
+Builds the chapter notebooks (.ipynb) from their percent-format .py sources.
+
+Usage:
+  python main.py               # rebuild every stale notebook
+  python main.py temp.py       # rebuild only the given sources
+  python main.py --force       # ignore the manifest and rebuild everything
+  python main.py --jobs 4      # limit the number of worker processes
+
+A source is considered stale when its content hash, or the hash of the
+notebook it produced last time, no longer matches the manifest. Only stale
+sources are converted, and they are converted in a process pool, so a
+rebuild costs roughly the number of changed chapters rather than the total.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import jupytext
+
+MANIFEST_FILE = ".notebook-manifest.json"
+HEADER_LINES = 20 # The jupytext header always sits at the top of the file
+
+
+def file_hash(path):
+    """Returns the SHA-256 hex digest of a file's contents (or None if missing)."""
+    if not os.path.exists(path):
+        return None
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 16), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def is_percent_source(path):
+    """True if the .py file declares a jupytext percent-format header."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            head = [f.readline() for _ in range(HEADER_LINES)]
+    except (OSError, UnicodeDecodeError):
+        return False
+    return any("format_name: percent" in line for line in head)
+
+
+def find_sources(root="."):
+    """Finds every percent-format .py source below root (sorted for stable output)."""
+    sources = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        # Skip hidden directories (.git, .venv, ...) and caches
+        dirnames[:] = [d for d in dirnames if not d.startswith(".") and d != "__pycache__"]
+        for name in filenames:
+            path = os.path.join(dirpath, name)
+            if name.endswith(".py") and is_percent_source(path):
+                sources.append(os.path.relpath(path, root))
+    return sorted(sources)
+
+
+def output_path(source):
+    """The notebook written for a source: temp.py -> temp.ipynb."""
+    return os.path.splitext(source)[0] + ".ipynb"
+
+
+def source_key(path):
+    """Normalizes a source path (./temp.py, /abs/temp.py -> temp.py) for use as a manifest key."""
+    return os.path.relpath(path)
+
+
+def load_manifest(path):
+    """Loads the manifest, treating a missing or corrupt file as empty."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_manifest(path, manifest):
+    """Writes the manifest atomically so an interrupted build can't corrupt it."""
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+        f.write("\n")
+    os.replace(tmp_path, path)
+
+
+def is_stale(source, manifest):
+    """True if the source or its notebook differs from what the manifest recorded."""
+    entry = manifest.get(source)
+    if entry is None:
+        return True
+    return (entry.get("source") != file_hash(source)
+            or entry.get("output") != file_hash(output_path(source)))
+
+
+def convert(source):
+    """Converts one source to its notebook. Runs inside a worker process."""
+    target = output_path(source)
+    nb = jupytext.read(source)
+    jupytext.write(nb, target)
+    return source, {"source": file_hash(source), "output": file_hash(target)}
+
+
+def build(sources, manifest_path=MANIFEST_FILE, jobs=None, force=False):
+    """
+    Converts the stale sources in a process pool and updates the manifest.
+
+    Args:
+      sources: The .py sources to consider. Paths are normalized relative to
+        the current directory, so ./temp.py and temp.py are the same source.
+      manifest_path: Where the content hashes are stored between builds.
+      jobs: Maximum number of worker processes (default: one per CPU).
+      force: Rebuild every source even if the manifest says it is up to date.
+
+    Returns:
+      The list of sources that were rebuilt.
+    """
+    manifest = {source_key(source): entry for source, entry in load_manifest(manifest_path).items()}
+    sources = list(dict.fromkeys(map(source_key, sources))) # One entry per file, however it was named
+    stale = [s for s in sources if force or is_stale(s, manifest)]
+
+    if len(stale) == 1:
+        # Not worth starting a pool for a single chapter
+        results = [convert(stale[0])]
+    elif stale:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            results = list(pool.map(convert, stale))
+    else:
+        results = []
+
+    for source, entry in results:
+        manifest[source] = entry
+    # Forget sources that no longer exist
+    for source in list(manifest):
+        if not os.path.exists(source):
+            del manifest[source]
+    save_manifest(manifest_path, manifest)
+    return stale
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build notebooks from percent-format .py sources.")
+    parser.add_argument("sources", nargs="*", help="sources to build (default: discover all)")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="number of worker processes")
+    parser.add_argument("-f", "--force", action="store_true", help="rebuild even if up to date")
+    parser.add_argument("--manifest", default=MANIFEST_FILE, help="path of the hash manifest")
+    args = parser.parse_args(argv)
+
+    # Normalized here too so the summary counts each notebook once
+    sources = list(dict.fromkeys(map(source_key, args.sources))) or find_sources()
+    rebuilt = build(sources, manifest_path=args.manifest, jobs=args.jobs, force=args.force)
+
+    for source in rebuilt:
+        print(f"Built {output_path(source)} from {source}")
+    print(f"{len(rebuilt)} rebuilt, {len(sources) - len(rebuilt)} up to date")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,771 @@
+"""
+Cambridge-style pseudo-code to Python (companion to S1A sections 3-5).
+
+Every chapter pairs pseudo-code with a hand-written Python translation. This
+module does the translation mechanically: it parses a block of pseudo-code
+and builds a Python AST, which is compiled and run like any Python code.
+
+  source = '''
+  FUNCTION Fac(N : INTEGER) RETURNS INTEGER
+    IF N = 0 THEN
+      RETURN 1
+    ELSE
+      RETURN N * Fac(N - 1)
+    ENDIF
+  ENDFUNCTION
+  OUTPUT "5! = ", Fac(5)
+  '''
+  namespace = run(source)          # prints "5! = 120"
+  namespace["Fac"](10)             # functions can be called from Python
+  print(to_python(source))         # the generated Python
+
+Supported:
+  DECLARE x : INTEGER | REAL | CHAR | STRING | BOOLEAN
+  DECLARE a : ARRAY[1:10] OF INTEGER, ARRAY[1:5, 1:4] OF CHAR, ARRAY[30] OF REAL
+  CONSTANT Pi = 3.142
+  x ← expr (also <- and =), a[i] ← expr, a[r, c] ← expr
+  IF .. THEN .. ELSE IF .. ELSE .. ENDIF
+  WHILE .. [DO] .. ENDWHILE, REPEAT .. UNTIL ..
+  FOR i ← a TO b [STEP s] .. ENDFOR (or NEXT i)
+  PROCEDURE / FUNCTION .. RETURNS .. with BYVAL/BYREF parameters, CALL, RETURN
+  INPUT x, USERINPUT, OUTPUT a, b
+  Operators + - * / DIV MOD ^ & = <> < > <= >= AND OR NOT, and the built-in
+  functions in BUILTINS (LENGTH, INT, MID, ...)
+
+Arrays are arrays.py Arrays, so they are indexed from their declared lower
+bound (usually 1) and out-of-range indices raise IndexError. FOR loops
+become range() with the end bound made inclusive, the mapping S1A works out
+by hand. A variable DECLAREd at the top level is global: procedures that
+assign to it change the global, as in pseudo-code. BYREF only matters for
+arrays, which Python always passes by reference.
+
+compile_pseudocode() caches compiled code objects on disk, keyed by a hash
+of the source, so a large set of exercises is only parsed once.
+"""
+
+import ast
+import hashlib
+import importlib.util
+import keyword
+import marshal
+import os
+import random
+import re
+from collections import namedtuple
+
+from arrays import TYPES as ARRAY_TYPES, Array, Array2D
+
+CACHE_DIR = ".pseudocode-cache"
+COMPILER_VERSION = "1" # Bump when the generated code changes, to invalidate caches
+
+TOKEN = re.compile(r"""
+    (?P<comment>//[^\n]*)
+  | (?P<newline>\n)
+  | (?P<space>[ \t\r\f]+)
+  | (?P<real>\d+\.\d+)
+  | (?P<integer>\d+)
+  | (?P<string>"[^"\n]*")
+  | (?P<char>'[^'\n]')
+  | (?P<name>[A-Za-z][A-Za-z0-9_]*)
+  | (?P<op><-|←|<>|<=|>=|≤|≥|≠|[-+*/^&=<>()\[\],:])
+""", re.VERBOSE)
+
+OPERATOR_ALIASES = {"<-": "←", "≤": "<=", "≥": ">=", "≠": "<>"}
+
+KEYWORDS = {
+    "DECLARE", "CONSTANT", "ARRAY", "OF", "INPUT", "OUTPUT", "USERINPUT",
+    "IF", "THEN", "ELSE", "ELSEIF", "ENDIF", "WHILE", "DO", "ENDWHILE",
+    "REPEAT", "UNTIL", "FOR", "TO", "STEP", "ENDFOR", "NEXT",
+    "PROCEDURE", "ENDPROCEDURE", "FUNCTION", "RETURNS", "ENDFUNCTION",
+    "CALL", "RETURN", "BYVAL", "BYREF", "TRUE", "FALSE", "AND", "OR", "NOT",
+    "DIV", "MOD",
+}
+
+COMPARISONS = {"=": ast.Eq, "<>": ast.NotEq, "<": ast.Lt, ">": ast.Gt, "<=": ast.LtE, ">=": ast.GtE}
+ADDITIVE = {"+": ast.Add, "-": ast.Sub, "&": ast.Add}
+MULTIPLICATIVE = {"*": ast.Mult, "/": ast.Div, "DIV": ast.FloorDiv, "MOD": ast.Mod}
+
+
+def _mid(text, start, length):
+    """MID(s, start, n): n characters of s from 1-based position start."""
+    return text[start - 1:start - 1 + length]
+
+
+def _str_to_num(text):
+    try:
+        return int(text)
+    except ValueError:
+        return float(text)
+
+
+# Built-in functions of the pseudo-code guide, by their pseudo-code names
+BUILTINS = {
+    "LENGTH": len,
+    "INT": int,
+    "ROUND": round,
+    "RAND": lambda high: random.random() * high,
+    "RANDOMBETWEEN": random.randint,
+    "DIV": lambda a, b: a // b,
+    "MOD": lambda a, b: a % b,
+    "LEFT": lambda text, n: text[:n],
+    "RIGHT": lambda text, n: text[len(text) - n:],
+    "MID": _mid,
+    "UCASE": str.upper,
+    "LCASE": str.lower,
+    "TO_UPPER": str.upper,
+    "TO_LOWER": str.lower,
+    "ASC": ord,
+    "CHR": chr,
+    "NUM_TO_STR": str,
+    "STR_TO_NUM": _str_to_num,
+}
+
+Token = namedtuple("Token", "kind text line")
+
+
+class PseudocodeError(ValueError):
+    """Raised for pseudo-code that cannot be parsed, with the line number."""
+
+
+def tokenize(source):
+    """Splits pseudo-code into Tokens. Comments are dropped; newlines end statements."""
+    tokens = []
+    line = 1
+    pos = 0
+    while pos < len(source):
+        match = TOKEN.match(source, pos)
+        if match is None:
+            raise PseudocodeError(f"Line {line}: unexpected character {source[pos]!r}")
+        kind, text = match.lastgroup, match.group()
+        pos = match.end()
+        if kind == "newline":
+            if tokens and tokens[-1].kind != "newline":
+                tokens.append(Token("newline", text, line))
+            line += 1
+            continue
+        if kind in ("space", "comment"):
+            continue
+        if kind == "name" and text in KEYWORDS:
+            kind = "keyword"
+        elif kind == "op":
+            text = OPERATOR_ALIASES.get(text, text)
+        tokens.append(Token(kind, text, line))
+    tokens.append(Token("newline", "\n", line))
+    tokens.append(Token("end", "", line))
+    return tokens
+
+
+def _identifier(text):
+    """Python name for a pseudo-code identifier (Python keywords get a trailing _)."""
+    return text + "_" if keyword.iskeyword(text) else text
+
+
+def _load(name):
+    return ast.Name(name, ast.Load())
+
+
+def _call(name, args):
+    return ast.Call(_load(name), args, [])
+
+
+def _located(nodes, line):
+    """Gives every node without a position the pseudo-code line, so tracebacks point at it."""
+    pending = list(nodes)
+    while pending:
+        node = pending.pop()
+        if hasattr(node, "lineno"):
+            continue # A nested statement, already located with its children
+        if "lineno" in node._attributes:
+            node.lineno = node.end_lineno = line
+            node.col_offset = node.end_col_offset = 0
+        pending.extend(ast.iter_child_nodes(node))
+    return nodes
+
+
+class _Parser:
+    """Recursive-descent parser producing a Python ast.Module."""
+
+    def __init__(self, tokens):
+        self.tokens = tokens
+        self.pos = 0
+        self.scopes = [{}] # Declared name -> type, for the program and each open subroutine
+        self.local_declarations = {} # id(FunctionDef) -> names declared inside it
+
+    # --- Token helpers ---
+
+    def peek(self, offset=0):
+        return self.tokens[self.pos + offset]
+
+    def next(self):
+        token = self.tokens[self.pos]
+        self.pos += 1
+        return token
+
+    def at(self, *texts):
+        token = self.peek()
+        return token.kind in ("keyword", "op") and token.text in texts
+
+    def accept(self, *texts):
+        if self.at(*texts):
+            return self.next()
+        return None
+
+    def expect(self, *texts):
+        token = self.accept(*texts)
+        if token is None:
+            self.error(self.peek(), f"expected {' or '.join(texts)}")
+        return token
+
+    def error(self, token, message):
+        found = "end of line" if token.kind == "newline" else token.text or "end of input"
+        raise PseudocodeError(f"Line {token.line}: {message}, found {found!r}")
+
+    def identifier(self):
+        token = self.next()
+        if token.kind != "name":
+            self.error(token, "expected an identifier")
+        return _identifier(token.text)
+
+    def skip_newlines(self):
+        while self.peek().kind == "newline":
+            self.pos += 1
+
+    def end_statement(self):
+        token = self.peek()
+        if token.kind == "newline":
+            self.pos += 1
+        elif token.kind != "end":
+            self.error(token, "expected end of line")
+
+    def skip_type(self, stop):
+        """Skips a parameter or return type, which Python doesn't need."""
+        depth = 0
+        while True:
+            token = self.peek()
+            if token.kind in ("newline", "end") or (depth == 0 and token.text in stop):
+                return
+            depth += {"[": 1, "(": 1, "]": -1, ")": -1}.get(token.text, 0)
+            self.pos += 1
+
+    def declared_type(self, name):
+        for scope in reversed(self.scopes):
+            if name in scope:
+                return scope[name]
+        return None
+
+    # --- Statements ---
+
+    def program(self):
+        body = self.block(())
+        module = ast.Module(body, type_ignores=[])
+        self._add_globals(module)
+        return ast.fix_missing_locations(module)
+
+    def block(self, terminators):
+        statements = []
+        while True:
+            self.skip_newlines()
+            token = self.peek()
+            if token.kind == "end":
+                if terminators:
+                    self.error(token, f"expected {' or '.join(sorted(terminators))}")
+                break
+            if token.kind == "keyword" and token.text in terminators:
+                break
+            statements.extend(self.statement())
+        return statements or [ast.Pass()]
+
+    def statement(self):
+        token = self.peek()
+        if token.kind == "keyword":
+            handler = getattr(self, "statement_" + token.text.lower(), None)
+            if handler is None:
+                self.error(token, "unexpected keyword")
+            self.next()
+            statements = handler(token)
+        elif token.kind == "name":
+            statements = self.assignment_or_call()
+        else:
+            self.error(token, "expected a statement")
+        self.end_statement()
+        return _located(statements, token.line)
+
+    def statement_declare(self, token):
+        names = [self.identifier()]
+        while self.accept(","):
+            names.append(self.identifier())
+        self.expect(":")
+        statements = []
+        if self.accept("ARRAY"):
+            if self.accept("["):
+                dimensions = [self.bounds()]
+                while self.accept(","):
+                    dimensions.append(self.bounds())
+                self.expect("]")
+                if len(dimensions) > 2:
+                    self.error(token, "arrays have one or two dimensions")
+                element_type = "STRING" # Untyped arrays hold any value
+                if self.accept("OF") and self.peek().text in ARRAY_TYPES:
+                    element_type = self.next().text
+                for name in names:
+                    if len(dimensions) == 1:
+                        (lower, upper), = dimensions
+                        value = _call("_Array", [lower, upper, ast.Constant(element_type)])
+                    else:
+                        value = _call("_Array2D", [ast.Tuple(list(bounds), ast.Load()) for bounds in dimensions]
+                                      + [ast.Constant(element_type)])
+                    statements.append(ast.Assign([ast.Name(name, ast.Store())], value))
+            self.skip_type(())
+            data_type = "ARRAY"
+        else:
+            data_type = self.next().text if self.peek().kind in ("name", "keyword") else None
+        for name in names:
+            self.scopes[-1][name] = data_type
+        return statements
+
+    def bounds(self):
+        """lower:upper, or just a size (ARRAY[30] is ARRAY[1:30])."""
+        first = self.expression()
+        if self.accept(":"):
+            return first, self.expression()
+        return ast.Constant(1), first
+
+    def statement_constant(self, token):
+        name = self.identifier()
+        self.expect("=", "←")
+        self.scopes[-1][name] = "CONSTANT"
+        return [ast.Assign([ast.Name(name, ast.Store())], self.expression())]
+
+    def assignment_or_call(self):
+        if self.peek(1).text == "(" and self.peek(1).kind == "op":
+            return [ast.Expr(self.expression())] # Procedure called without CALL
+        target = self.target()
+        self.expect("←", "=")
+        return [ast.Assign([target], self.expression())]
+
+    def target(self):
+        name = self.identifier()
+        if self.accept("["):
+            index = self.index()
+            return ast.Subscript(_load(name), index, ast.Store())
+        return ast.Name(name, ast.Store())
+
+    def index(self):
+        """Parses the inside of [...] after the opening bracket."""
+        indices = [self.expression()]
+        while self.accept(","):
+            indices.append(self.expression())
+        self.expect("]")
+        return indices[0] if len(indices) == 1 else ast.Tuple(indices, ast.Load())
+
+    def statement_if(self, token):
+        test = self.expression()
+        self.skip_newlines()
+        self.expect("THEN")
+        body = self.block({"ELSE", "ELSEIF", "ENDIF"})
+        orelse = []
+        branch = self.next()
+        if branch.text == "ELSEIF" or (branch.text == "ELSE" and self.at("IF")):
+            if branch.text == "ELSE":
+                self.next()
+            orelse = _located(self.statement_if(branch), branch.line) # Consumes the ENDIF
+        elif branch.text == "ELSE":
+            orelse = self.block({"ENDIF"})
+            self.expect("ENDIF")
+        return [ast.If(test, body, orelse)]
+
+    def statement_while(self, token):
+        test = self.expression()
+        self.accept("DO")
+        body = self.block({"ENDWHILE"})
+        self.expect("ENDWHILE")
+        return [ast.While(test, body, [])]
+
+    def statement_repeat(self, token):
+        body = self.block({"UNTIL"})
+        until = self.expect("UNTIL")
+        test = self.expression()
+        check = _located([ast.If(test, [ast.Break()], [])], until.line)
+        return [ast.While(ast.Constant(True), body + check, [])]
+
+    def statement_for(self, token):
+        variable = self.identifier()
+        self.expect("←", "=")
+        start = self.expression()
+        self.expect("TO")
+        end = self.expression()
+        step = self.expression() if self.accept("STEP") else None
+        body = self.block({"ENDFOR", "NEXT"})
+        if self.next().text == "NEXT" and self.peek().kind == "name":
+            self.next() # NEXT i
+        loop_range = self._range(start, end, step, token.line)
+        return [ast.For(ast.Name(variable, ast.Store()), loop_range, body, [])]
+
+    def _range(self, start, end, step, line):
+        """range() over start..end inclusive: range(start, end + step_sign, step)."""
+        step_value = None
+        if step is None:
+            step_value = 1
+        elif isinstance(step, ast.Constant) and type(step.value) is int:
+            step_value = step.value
+        elif (isinstance(step, ast.UnaryOp) and isinstance(step.op, ast.USub)
+              and isinstance(step.operand, ast.Constant) and type(step.operand.value) is int):
+            step_value = -step.operand.value
+        if step_value is None: # Sign unknown until run time
+            return _call("_for_range", [start, end, step])
+        if step_value == 0:
+            raise PseudocodeError(f"Line {line}: FOR loop STEP cannot be 0")
+        direction = 1 if step_value > 0 else -1
+        if isinstance(end, ast.Constant) and type(end.value) is int:
+            stop = ast.Constant(end.value + direction)
+        else:
+            stop = ast.BinOp(end, ast.Add() if direction > 0 else ast.Sub(), ast.Constant(1))
+        args = [start, stop] if step is None else [start, stop, ast.Constant(step_value)]
+        return _call("_range", args)
+
+    def statement_procedure(self, token, end="ENDPROCEDURE"):
+        name = self.identifier()
+        parameters = []
+        if self.accept("("):
+            while not self.at(")"):
+                self.accept("BYVAL", "BYREF")
+                parameters.append(self.identifier())
+                if self.accept(":"):
+                    self.skip_type((",", ")"))
+                if not self.accept(","):
+                    break
+            self.expect(")")
+        if end == "ENDFUNCTION" and self.accept("RETURNS"):
+            self.skip_type(())
+        self.end_statement()
+
+        self.scopes.append(dict.fromkeys(parameters))
+        body = self.block({end})
+        self.expect(end)
+        local_names = self.scopes.pop()
+
+        arguments = ast.arguments(posonlyargs=[], args=[ast.arg(p) for p in parameters], kwonlyargs=[],
+                                  kw_defaults=[], defaults=[])
+        function = ast.FunctionDef(name, arguments, body, decorator_list=[], returns=None)
+        if "type_params" in ast.FunctionDef._fields: # Python 3.12+
+            function.type_params = []
+        self.local_declarations[id(function)] = set(local_names)
+        self.scopes[-1][name] = "FUNCTION"
+        return [function]
+
+    def statement_function(self, token):
+        return self.statement_procedure(token, "ENDFUNCTION")
+
+    def _add_globals(self, module):
+        """Adds `global x` to subroutines assigning top-level DECLAREd variables."""
+        program_names = {name for name, data_type in self.scopes[0].items() if data_type != "FUNCTION"}
+        for function in ast.walk(module):
+            if not isinstance(function, ast.FunctionDef):
+                continue
+            assigned = {node.id for statement in function.body for node in ast.walk(statement)
+                        if isinstance(node, ast.Name) and isinstance(node.ctx, ast.Store)}
+            shared = assigned & program_names - self.local_declarations[id(function)]
+            if shared:
+                function.body.insert(0, _located([ast.Global(sorted(shared))], function.lineno)[0])
+
+    def statement_return(self, token):
+        if self.peek().kind in ("newline", "end"):
+            return [ast.Return(None)]
+        return [ast.Return(self.expression())]
+
+    def statement_call(self, token):
+        name = self.identifier()
+        args = self.arguments() if self.accept("(") else []
+        return [ast.Expr(_call(name, args))]
+
+    def statement_output(self, token):
+        values = [self.expression()]
+        while self.accept(","):
+            values.append(self.expression())
+        return [ast.Expr(_call("_output", values))]
+
+    def statement_input(self, token):
+        target = self.target()
+        data_type = self.declared_type(target.id) if isinstance(target, ast.Name) else None
+        return [ast.Assign([target], _call("_input", [ast.Constant(data_type)]))]
+
+    # --- Expressions, lowest precedence first ---
+
+    def expression(self):
+        return self.disjunction()
+
+    def disjunction(self):
+        values = [self.conjunction()]
+        while self.accept("OR"):
+            values.append(self.conjunction())
+        return values[0] if len(values) == 1 else ast.BoolOp(ast.Or(), values)
+
+    def conjunction(self):
+        values = [self.negation()]
+        while self.accept("AND"):
+            values.append(self.negation())
+        return values[0] if len(values) == 1 else ast.BoolOp(ast.And(), values)
+
+    def negation(self):
+        if self.accept("NOT"):
+            return ast.UnaryOp(ast.Not(), self.negation())
+        return self.comparison()
+
+    def comparison(self):
+        left = self.sum()
+        while self.at(*COMPARISONS):
+            operator = COMPARISONS[self.next().text]
+            left = ast.Compare(left, [operator()], [self.sum()])
+        return left
+
+    def sum(self):
+        left = self.product()
+        while self.at(*ADDITIVE):
+            operator = ADDITIVE[self.next().text]
+            left = ast.BinOp(left, operator(), self.product())
+        return left
+
+    def product(self):
+        left = self.unary()
+        while self.at(*MULTIPLICATIVE):
+            operator = MULTIPLICATIVE[self.next().text]
+            left = ast.BinOp(left, operator(), self.unary())
+        return left
+
+    def unary(self):
+        if self.accept("-"):
+            return ast.UnaryOp(ast.USub(), self.unary())
+        if self.accept("+"):
+            return self.unary()
+        return self.power()
+
+    def power(self):
+        base = self.primary()
+        if self.accept("^"):
+            return ast.BinOp(base, ast.Pow(), self.unary())
+        return base
+
+    def arguments(self):
+        """Parses call arguments after the opening parenthesis."""
+        args = []
+        if not self.accept(")"):
+            args.append(self.expression())
+            while self.accept(","):
+                args.append(self.expression())
+            self.expect(")")
+        return args
+
+    def primary(self):
+        token = self.next()
+        if token.kind == "integer":
+            return ast.Constant(int(token.text))
+        if token.kind == "real":
+            return ast.Constant(float(token.text))
+        if token.kind == "string":
+            return ast.Constant(token.text[1:-1])
+        if token.kind == "char":
+            return ast.Constant(token.text[1])
+        if token.kind == "keyword":
+            if token.text in ("TRUE", "FALSE"):
+                return ast.Constant(token.text == "TRUE")
+            if token.text == "USERINPUT":
+                return _call("_input", [ast.Constant(None)])
+            if token.text in ("DIV", "MOD") and self.accept("("):
+                return _call(token.text, self.arguments())
+        if token.kind == "op" and token.text == "(":
+            value = self.expression()
+            self.expect(")")
+            return value
+        if token.kind != "name":
+            self.error(token, "expected an expression")
+
+        node = _load(_identifier(token.text))
+        while True:
+            if self.accept("("):
+                node = ast.Call(node, self.arguments(), [])
+            elif self.accept("["):
+                node = ast.Subscript(node, self.index(), ast.Load())
+            else:
+                return node
+
+
+def transpile(source):
+    """Parses pseudo-code and returns the equivalent Python ast.Module."""
+    return _Parser(tokenize(source)).program()
+
+
+def to_python(source):
+    """Returns the Python source the pseudo-code translates to."""
+    return ast.unparse(transpile(source))
+
+
+# --- Compilation cache ---
+
+_compiled = {} # Source hash -> code object, for repeated compiles in one process
+
+
+def source_hash(source):
+    """Cache key: the source, the compiler version and the Python bytecode version."""
+    digest = hashlib.sha256()
+    digest.update(COMPILER_VERSION.encode())
+    digest.update(importlib.util.MAGIC_NUMBER)
+    digest.update(source.encode("utf-8"))
+    return digest.hexdigest()
+
+
+def compile_pseudocode(source, filename="<pseudocode>", cache_dir=CACHE_DIR):
+    """
+    Returns a code object for pseudo-code, parsing it only on a cache miss.
+
+    Args:
+      source: The pseudo-code.
+      filename: Shown in tracebacks (line numbers are pseudo-code lines).
+      cache_dir: Directory of marshalled code objects, or None to only cache
+        in memory.
+    """
+    key = source_hash(source)
+    code = _compiled.get(key)
+    if code is not None:
+        return code
+
+    path = os.path.join(cache_dir, key + ".code") if cache_dir else None
+    if path is not None:
+        try:
+            with open(path, "rb") as f:
+                code = marshal.load(f)
+        except (OSError, EOFError, ValueError, TypeError): # Missing or corrupt: recompile
+            code = None
+
+    if code is None:
+        code = compile(transpile(source), filename, "exec")
+        if path is not None:
+            os.makedirs(cache_dir, exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as f:
+                marshal.dump(code, f)
+            os.replace(tmp_path, path)
+    _compiled[key] = code
+    return code
+
+
+def clear_cache(cache_dir=CACHE_DIR):
+    """Forgets compiled code in memory and deletes the on-disk cache files."""
+    _compiled.clear()
+    if cache_dir and os.path.isdir(cache_dir):
+        for name in os.listdir(cache_dir):
+            if name.endswith(".code"):
+                os.remove(os.path.join(cache_dir, name))
+
+
+# --- Runtime ---
+
+def _text(value):
+    """OUTPUT shows booleans as TRUE/FALSE, as pseudo-code writes them."""
+    if value is True or value is False:
+        return "TRUE" if value else "FALSE"
+    return str(value)
+
+
+def _convert_input(text, data_type):
+    """Converts an INPUT line to the variable's declared type (guessing if undeclared)."""
+    if data_type == "INTEGER":
+        return int(text)
+    if data_type == "REAL":
+        return float(text)
+    if data_type == "BOOLEAN":
+        return text.strip().upper() == "TRUE"
+    if data_type in ("CHAR", "STRING"):
+        return text
+    try:
+        return _str_to_num(text)
+    except ValueError:
+        return text
+
+
+def _for_range(start, end, step):
+    """FOR .. STEP s with a step only known at run time."""
+    if step == 0:
+        raise ValueError("FOR loop STEP cannot be 0")
+    return range(start, end + (1 if step > 0 else -1), step)
+
+
+def runtime(inputs=None, output=None):
+    """
+    Returns the globals pseudo-code runs in.
+
+    Args:
+      inputs: Iterable of strings answering INPUT/USERINPUT in order
+        (default: read from the keyboard with input()).
+      output: Callable receiving each OUTPUT line (default: print).
+    """
+    source = iter(inputs) if inputs is not None else None
+    write = output or print
+
+    def read(data_type):
+        if source is None:
+            return _convert_input(input(), data_type)
+        try:
+            return _convert_input(next(source), data_type)
+        except StopIteration:
+            raise EOFError("INPUT with no more inputs") from None
+
+    def show(*values):
+        write("".join(map(_text, values)))
+
+    namespace = dict(BUILTINS)
+    namespace.update(_Array=Array, _Array2D=Array2D, _range=range, _for_range=_for_range,
+                     _input=read, _output=show)
+    return namespace
+
+
+def run(source, inputs=None, output=None, cache_dir=CACHE_DIR):
+    """
+    Compiles (or loads from the cache) and runs pseudo-code.
+
+    Returns:
+      The namespace it ran in, so its variables, procedures and functions
+      can be used from Python.
+    """
+    code = compile_pseudocode(source, cache_dir=cache_dir)
+    namespace = runtime(inputs, output)
+    exec(code, namespace)
+    return namespace
+
+
+# Example usage
+if __name__ == "__main__":
+    fibonacci = """
+FUNCTION Fibonacci_Iterative(n: INTEGER) RETURNS INTEGER
+  DECLARE num1, num2, num3, i : INTEGER
+  IF n = 0 THEN
+    RETURN 0
+  ELSE IF n = 1 THEN
+    RETURN 1
+  ELSE
+    num1 ← 0
+    num2 ← 1
+    FOR i ← 2 TO n
+      num3 ← num1 + num2
+      num1 ← num2
+      num2 ← num3
+    ENDFOR
+    RETURN num3
+  ENDIF
+ENDFUNCTION
+
+DECLARE SpellingTest : ARRAY[1:30] OF INTEGER
+DECLARE index : INTEGER
+FOR index ← 1 TO 30 STEP 2
+  SpellingTest[index] ← Fibonacci_Iterative(index)
+ENDFOR
+OUTPUT "SpellingTest[29] = ", SpellingTest[29]
+
+num ← USERINPUT
+REPEAT
+  num ← num * 2
+UNTIL num >= 100
+OUTPUT num
+"""
+    print(to_python(fibonacci))
+    print()
+    run(fibonacci, inputs=["4"], cache_dir=None)
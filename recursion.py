@@ -0,0 +1,293 @@
+"""
+Running recursive definitions on an explicit stack (companion to S2A section 6.2).
+
+Every Python call pushes a stack frame, and CPython stops at about 1000
+frames with RecursionError: the "stack overflow" S2A section 6.2 describes.
+recursive_linear_search_v1 needs one frame per element, so it fails on any
+list longer than that, and quick_sort_recursive fails on sorted input.
+
+This module runs recursive definitions without growing the call stack. A
+function is written as a generator that yields call(...) where the original
+makes a recursive call; the runtime keeps the suspended generators on a
+Python list (the explicit stack) and sends each result back:
+
+  def factorial_frames(n):                  # Original:
+      if n == 0:                            #   if n == 0:
+          return 1                          #     return 1
+      rest = yield call(factorial_frames, n - 1)
+      return n * rest                       #   return n * factorial(n - 1)
+
+  run(factorial_frames, 5000)               # No RecursionError
+
+A call in tail position (`return f(...)` in the original) can be yielded as
+tail_call(...) instead: the current frame is replaced rather than kept, so the
+stack stays one frame deep however long the recursion runs (a trampoline).
+
+run(..., profiler=RecursionProfiler()) also records, per function, the frames
+pushed, the deepest point of the stack and the time spent in the runtime's
+call and return bookkeeping (the "call overhead").
+"""
+
+import time
+from collections import namedtuple
+
+from sorting import partition
+
+Call = namedtuple("Call", "function args tail")
+
+
+def call(function, *args):
+    """Request a call of function(*args); the yield evaluates to its result."""
+    return Call(function, args, False)
+
+
+def tail_call(function, *args):
+    """Request function(*args) as the result of the current frame, replacing it on the stack."""
+    return Call(function, args, True)
+
+
+class FunctionProfile:
+    """Statistics for one function run through the explicit-stack runtime."""
+
+    def __init__(self, name):
+        self.name = name
+        self.frames = 0 # Frames pushed, counting tail calls
+        self.max_depth = 0 # Deepest stack seen while this function was running
+        self.overhead = 0.0 # Seconds of call/return bookkeeping
+
+    def __repr__(self):
+        return (f"FunctionProfile({self.name!r}, frames={self.frames}, "
+                f"max_depth={self.max_depth}, overhead={self.overhead * 1000:.3f} ms)")
+
+
+class RecursionProfiler:
+    """Collects a FunctionProfile per function across any number of run() calls."""
+
+    def __init__(self):
+        self.functions = {}
+
+    def __getitem__(self, name):
+        return self.functions[name]
+
+    def _profile(self, function):
+        name = function.__name__
+        profile = self.functions.get(name)
+        if profile is None:
+            profile = self.functions[name] = FunctionProfile(name)
+        return profile
+
+    def report(self):
+        """Returns the statistics as a text table, one line per function."""
+        lines = [f"{'Function':<32}{'Frames':>12}{'Max depth':>12}{'Overhead (ms)':>16}"]
+        for profile in self.functions.values():
+            lines.append(f"{profile.name:<32}{profile.frames:>12}{profile.max_depth:>12}"
+                         f"{profile.overhead * 1000:>16.3f}")
+        return "\n".join(lines)
+
+
+def run(function, *args, profiler=None):
+    """
+    Runs a generator-style recursive function on an explicit stack.
+
+    Args:
+      function: A generator function that yields call(...) or tail_call(...)
+        for its recursive calls and returns its result.
+      args: Arguments for the outermost call.
+      profiler: Optional RecursionProfiler to record frames, depth and
+        call overhead.
+
+    Returns:
+      The result of function(*args).
+    """
+    if profiler is not None:
+        return _run_profiled(function, args, profiler)
+
+    stack = [function(*args)]
+    value = None
+    error = None # Exception raised by a callee, to be thrown into its caller
+    while stack:
+        try:
+            if error is None:
+                request = stack[-1].send(value)
+            else:
+                thrown, error = error, None
+                request = stack[-1].throw(thrown)
+        except StopIteration as stop:
+            stack.pop()
+            value = stop.value
+            continue
+        except BaseException as exc:
+            # The frame failed: unwind it and let its caller handle the error
+            stack.pop()
+            if not stack:
+                raise
+            error = exc
+            continue
+        try:
+            frame = request.function(*request.args)
+        except BaseException as exc: # e.g. wrong arguments: raised at the call site
+            error = exc
+            continue
+        if request.tail:
+            stack[-1] = frame
+        else:
+            stack.append(frame)
+        value = None
+    return value
+
+
+def _run_profiled(function, args, profiler):
+    """run() with timing around every push and pop. Kept separate so run() pays nothing for it."""
+    clock = time.perf_counter
+    start = clock()
+    profile = profiler._profile(function)
+    stack = [function(*args)]
+    profiles = [profile] # Profile of each frame on the stack
+    profile.frames += 1
+    profile.max_depth = max(profile.max_depth, 1)
+    profile.overhead += clock() - start
+    value = None
+    error = None # Exception raised by a callee, to be thrown into its caller
+
+    while stack:
+        try:
+            if error is None:
+                request = stack[-1].send(value)
+            else:
+                thrown, error = error, None
+                request = stack[-1].throw(thrown)
+        except StopIteration as stop:
+            start = clock()
+            stack.pop()
+            returning = profiles.pop()
+            value = stop.value
+            returning.overhead += clock() - start
+            continue
+        except BaseException as exc:
+            start = clock()
+            stack.pop()
+            returning = profiles.pop()
+            returning.overhead += clock() - start
+            if not stack:
+                raise
+            error = exc
+            continue
+
+        start = clock()
+        profile = profiler._profile(request.function)
+        try:
+            frame = request.function(*request.args)
+        except BaseException as exc:
+            error = exc
+            profile.overhead += clock() - start
+            continue
+        if request.tail:
+            stack[-1] = frame
+            profiles[-1] = profile
+        else:
+            stack.append(frame)
+            profiles.append(profile)
+        profile.frames += 1
+        if len(stack) > profile.max_depth:
+            profile.max_depth = len(stack)
+        value = None
+        profile.overhead += clock() - start
+    return value
+
+
+# --- The recursive functions of S1B, S1C and S2A, in explicit-stack form ---
+
+def recursive_linear_search_frames(data_list, search_key, index=0):
+    """recursive_linear_search_v1 (S1B). Tail recursive, so it runs in one frame."""
+    # Base case 1: Index out of bounds
+    if index >= len(data_list):
+        return -1
+    # Base case 2: Found at current index
+    elif data_list[index] == search_key:
+        return index
+    # Recursive step: Search the rest of the list
+    else:
+        return (yield tail_call(recursive_linear_search_frames, data_list, search_key, index + 1))
+
+
+def binary_search_frames(search_key, sorted_list, low=0, high=None):
+    """binary_search_recursive (S1B). Tail recursive, so it runs in one frame."""
+    if high is None:
+        high = len(sorted_list) - 1 # Initialize high on first call
+
+    # Base case 1: Search space invalid
+    if low > high:
+        return -1
+    mid = (low + high) // 2
+    # Base case 2: Found
+    if search_key == sorted_list[mid]:
+        return mid
+    # Recursive step 1: Search lower half
+    elif search_key < sorted_list[mid]:
+        return (yield tail_call(binary_search_frames, search_key, sorted_list, low, mid - 1))
+    # Recursive step 2: Search upper half
+    else:
+        return (yield tail_call(binary_search_frames, search_key, sorted_list, mid + 1, high))
+
+
+def factorial_frames(n):
+    """factorial_recursive (S2A section 6). Needs n + 1 frames, kept on the explicit stack."""
+    if n < 0:
+        return "Factorial not defined for negative numbers"
+    elif n == 0: # Base case
+        return 1
+    else: # Recursive step
+        return n * (yield call(factorial_frames, n - 1))
+
+
+def quick_sort_frames(arr, first, last):
+    """quick_sort_recursive (S1C). The second call is a tail call."""
+    if first < last:
+        split_point = partition(arr, first, last)
+        # Recursively sort halves
+        yield call(quick_sort_frames, arr, first, split_point - 1)
+        yield tail_call(quick_sort_frames, arr, split_point + 1, last)
+
+
+def recursive_linear_search(data_list, search_key):
+    """recursive_linear_search_v1 for lists of any length."""
+    return run(recursive_linear_search_frames, data_list, search_key)
+
+
+def binary_search(search_key, sorted_list):
+    """binary_search_recursive without recursion limits."""
+    return run(binary_search_frames, search_key, sorted_list)
+
+
+def factorial(n):
+    """factorial_recursive for any n."""
+    return run(factorial_frames, n)
+
+
+def quick_sort(arr):
+    """quick_sort from S1C, safe on sorted or reversed input."""
+    run(quick_sort_frames, arr, 0, len(arr) - 1)
+
+
+# Example usage
+if __name__ == "__main__":
+    import sys
+
+    from searching import recursive_linear_search_v1
+
+    data = list(range(100_000))
+    try:
+        recursive_linear_search_v1(data, 99_999)
+    except RecursionError:
+        print(f"recursive_linear_search_v1 on {len(data)} items: RecursionError "
+              f"(limit {sys.getrecursionlimit()})")
+
+    profiler = RecursionProfiler()
+    print(f"recursive_linear_search: {run(recursive_linear_search_frames, data, 99_999, profiler=profiler)}")
+    print(f"binary_search: {run(binary_search_frames, 99_999, data, profiler=profiler)}")
+    print(f"factorial(5000) has {run(factorial_frames, 5000, profiler=profiler).bit_length()} bits")
+    sorted_input = list(range(5000))
+    run(quick_sort_frames, sorted_input, 0, len(sorted_input) - 1, profiler=profiler)
+    print(f"quick_sort on sorted input: {sorted_input == list(range(5000))}")
+    print()
+    print(profiler.report())
@@ -0,0 +1,224 @@
+"""
+Searching algorithms from "S1B - Searching Algorithms" as an importable module.
+
+The functions are the notebook versions, unchanged, so other modules can
+build on them and check their results against them.
+
+Iterative bound searches for sorted lists with duplicate keys follow them:
+lower_bound / upper_bound, binary_search_leftmost / binary_search_rightmost
+and count_in_range. All of them accept an optional key function.
+"""
+
+
+def linear_search_unordered(search_key, data_list):
+  """
+  Performs a linear search on an unordered list.
+
+  Args:
+    search_key: The item to search for.
+    data_list: The list to search within.
+
+  Returns:
+    The index of the first occurrence of search_key if found, otherwise -1.
+  """
+  index = 0
+  found_at = -1
+  while index < len(data_list):
+    if data_list[index] == search_key:
+      found_at = index
+      break # Exit loop once found
+    index += 1
+  return found_at
+
+
+def linear_search_ordered(search_key, sorted_list):
+  """
+  Performs a linear search on an ordered (ascending) list
+  with early termination.
+
+  Args:
+    search_key: The item to search for.
+    sorted_list: The sorted list to search within.
+
+  Returns:
+    True if found, False otherwise.
+  """
+  for item in sorted_list:
+    if item == search_key:
+      return True # Found
+    elif search_key < item:
+      return False # Can stop early
+  return False # Reached end of list without finding
+
+
+def recursive_linear_search_v1(data_list, search_key, index=0):
+  """
+  Recursive linear search (Approach 1: check first).
+
+  Args:
+    data_list: The list to search.
+    search_key: The item to find.
+    index: The current starting index for the search (default 0).
+
+  Returns:
+    The index where the item is found, or -1 if not found.
+  """
+  # Base case 1: Index out of bounds
+  if index >= len(data_list):
+    return -1
+  # Base case 2: Found at current index
+  elif data_list[index] == search_key:
+    return index
+  # Recursive step: Search the rest of the list
+  else:
+    return recursive_linear_search_v1(data_list, search_key, index + 1)
+
+
+def binary_search_iterative(search_key, sorted_list):
+  """
+  Performs an iterative binary search on a sorted list.
+
+  Args:
+    search_key: The item to search for.
+    sorted_list: The sorted list to search within.
+
+  Returns:
+    The index where search_key is found, or -1 if not found.
+  """
+  low = 0
+  high = len(sorted_list) - 1
+  found_at = -1
+
+  while low <= high:
+    mid = (low + high) // 2 # Integer division for middle index
+
+    if search_key == sorted_list[mid]:
+      found_at = mid
+      break # Found
+    elif search_key < sorted_list[mid]:
+      high = mid - 1 # Search lower half
+    else: # search_key > sorted_list[mid]
+      low = mid + 1 # Search upper half
+
+  return found_at
+
+
+def binary_search_recursive(search_key, sorted_list, low=0, high=None):
+  """
+  Performs a recursive binary search on a sorted list.
+
+  Args:
+    search_key: The item to search for.
+    sorted_list: The sorted list.
+    low: The starting index of the current search space.
+    high: The ending index of the current search space.
+
+  Returns:
+    The index where search_key is found, or -1 if not found.
+  """
+  if high is None:
+    high = len(sorted_list) - 1 # Initialize high on first call
+
+  # Base case 1: Search space invalid
+  if low > high:
+    return -1
+  else:
+    mid = (low + high) // 2
+
+    # Base case 2: Found
+    if search_key == sorted_list[mid]:
+      return mid
+    # Recursive step 1: Search lower half
+    elif search_key < sorted_list[mid]:
+      return binary_search_recursive(search_key, sorted_list, low, mid - 1)
+    # Recursive step 2: Search upper half
+    else: # search_key > sorted_list[mid]
+      return binary_search_recursive(search_key, sorted_list, mid + 1, high)
+
+
+def lower_bound(search_key, sorted_list, key=None, low=0, high=None):
+  """
+  Finds the first position whose item is not less than search_key.
+
+  Iterative, so it uses one stack frame however long the list is, and it
+  keeps halving until the range is empty instead of stopping at the first
+  match, which makes the answer well defined when there are duplicates.
+
+  Args:
+    search_key: The value to compare against.
+    sorted_list: A list sorted in ascending order (of key(item) if key is given).
+    key: Optional function applied to each probed item, e.g.
+      lambda record: record["age"]. Only the O(log n) probed items are
+      projected, so no projected list is built.
+    low: The starting index of the search space.
+    high: One past the last index of the search space (default len(sorted_list)).
+
+  Returns:
+    An index in [low, high]; high if every item is less than search_key.
+  """
+  if high is None:
+    high = len(sorted_list)
+  while low < high:
+    mid = (low + high) // 2
+    item = sorted_list[mid] if key is None else key(sorted_list[mid])
+    if item < search_key:
+      low = mid + 1 # Answer is to the right of mid
+    else:
+      high = mid # mid could be the answer
+  return low
+
+
+def upper_bound(search_key, sorted_list, key=None, low=0, high=None):
+  """
+  Finds the first position whose item is greater than search_key.
+
+  Takes the same arguments as lower_bound. Every item before the returned
+  index is <= search_key.
+  """
+  if high is None:
+    high = len(sorted_list)
+  while low < high:
+    mid = (low + high) // 2
+    item = sorted_list[mid] if key is None else key(sorted_list[mid])
+    if search_key < item:
+      high = mid # mid could be the answer
+    else:
+      low = mid + 1 # Answer is to the right of mid
+  return low
+
+
+def binary_search_leftmost(search_key, sorted_list, key=None):
+  """
+  Returns the index of the first occurrence of search_key, or -1 if not found.
+  """
+  index = lower_bound(search_key, sorted_list, key)
+  if index < len(sorted_list):
+    item = sorted_list[index] if key is None else key(sorted_list[index])
+    if item == search_key:
+      return index
+  return -1
+
+
+def binary_search_rightmost(search_key, sorted_list, key=None):
+  """
+  Returns the index of the last occurrence of search_key, or -1 if not found.
+  """
+  index = upper_bound(search_key, sorted_list, key) - 1
+  if index >= 0:
+    item = sorted_list[index] if key is None else key(sorted_list[index])
+    if item == search_key:
+      return index
+  return -1
+
+
+def count_in_range(low_key, high_key, sorted_list, key=None):
+  """
+  Counts the items x with low_key <= x <= high_key (both ends inclusive).
+
+  Two binary searches, so O(log n) regardless of how many items match.
+  Returns 0 if low_key > high_key.
+  """
+  if high_key < low_key:
+    return 0
+  first = lower_bound(low_key, sorted_list, key)
+  return upper_bound(high_key, sorted_list, key, low=first) - first
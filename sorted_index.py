@@ -0,0 +1,289 @@
+"""
+On-disk sorted index searched with binary search through a memory map
+(companion to S1B - Searching Algorithms).
+
+The S1B binary searches index into a Python list (sorted_list[mid]). This
+module stores sorted keys in a file of fixed-width records so that record
+i starts at HEADER_SIZE + i * width. SortedIndexReader memory-maps that file
+and exposes it as a read-only sequence, so the unchanged
+binary_search_iterative (and the bound searches) in searching.py run
+directly against the mapped buffer. A lookup reads only the O(log n) pages
+it probes; the file is never loaded into a list.
+
+File layout (little-endian header, big-endian records):
+
+  offset 0   6s  magic b"SIDX01"
+  offset 6   B   key kind: 0 = signed 64-bit integer, 1 = fixed-width bytes
+  offset 7   x   padding
+  offset 8   I   record width in bytes
+  offset 12  Q   number of records
+  offset 20  ... zero padding up to HEADER_SIZE
+  offset 32  records, each `width` bytes, in ascending order
+
+Keys are encoded so that comparing the raw record bytes gives the same order
+as comparing the keys: integers are stored big-endian with the sign bit
+flipped, byte strings are right-padded with b"\\0".
+
+build_index writes an index from an unsorted stream of keys with an external
+sort: sorted runs of at most `run_size` keys are spilled to temporary files
+and then merged with heapq.merge, at most `max_fan_in` runs at a time (in
+several passes if needed) with read buffers sized from `memory_budget`.
+"""
+
+import heapq
+import mmap
+import os
+import struct
+import tempfile
+
+from searching import binary_search_iterative, count_in_range, lower_bound
+
+MAGIC = b"SIDX01"
+HEADER = struct.Struct("<6sBxIQ")
+HEADER_SIZE = 32
+KIND_INT = 0
+KIND_BYTES = 1
+INT_WIDTH = 8
+SIGN_BIT = 1 << 63
+RUN_SIZE = 1_000_000     # Keys held in memory per sorted run while building
+IO_BUFFER = 1 << 20      # Largest buffer per run file, and the index file's buffer
+MIN_BUFFER = 64 * 1024   # Smallest read buffer per run file
+MEMORY_BUDGET = 64 << 20 # Read buffer memory shared by the runs merged at once
+MAX_FAN_IN = 128         # Most run files open at once while merging
+
+
+def encode_key(key, kind, width):
+  """Encodes a key as `width` bytes whose byte order matches the key order."""
+  if kind == KIND_INT:
+    if not -SIGN_BIT <= key < SIGN_BIT:
+      raise ValueError(f"Key {key!r} does not fit in a signed 64-bit record")
+    return (key + SIGN_BIT).to_bytes(INT_WIDTH, "big")
+  if isinstance(key, str):
+    key = key.encode("utf-8")
+  if len(key) > width:
+    raise ValueError(f"Key {key!r} is longer than the {width}-byte record width")
+  return key.ljust(width, b"\0")
+
+
+def decode_key(record, kind):
+  """Inverse of encode_key (byte keys come back with the padding stripped)."""
+  if kind == KIND_INT:
+    return int.from_bytes(record, "big") - SIGN_BIT
+  return bytes(record).rstrip(b"\0")
+
+
+class SortedIndexReader:
+  """
+  Read-only, memory-mapped view of an index file written by build_index.
+
+  Behaves like a sorted list of encoded keys: len(reader) is the record
+  count and reader[i] returns record i as bytes, sliced straight from the
+  map. The search methods take plain keys and encode them first.
+
+  Example:
+    with SortedIndexReader("ids.idx") as index:
+      index.find(1234)              # -> position or -1
+      index.count_range(100, 200)   # -> keys with 100 <= key <= 200
+  """
+
+  def __init__(self, path):
+    self.file = open(path, "rb")
+    try:
+      self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+    except ValueError: # Empty file cannot be mapped
+      self.file.close()
+      raise ValueError(f"{path} is not a sorted index file")
+
+    if len(self.map) < HEADER_SIZE: # Too short to hold a header
+      self.close()
+      raise ValueError(f"{path} is not a sorted index file")
+    magic, self.kind, self.width, self.count = HEADER.unpack_from(self.map, 0)
+    if magic != MAGIC or len(self.map) < HEADER_SIZE + self.count * self.width:
+      self.close()
+      raise ValueError(f"{path} is not a sorted index file")
+    if hasattr(self.map, "madvise"):
+      # Binary search jumps around the file, so read-ahead only wastes I/O
+      self.map.madvise(mmap.MADV_RANDOM)
+
+  def __len__(self):
+    return self.count
+
+  def __getitem__(self, index):
+    if index < 0:
+      index += self.count
+    if not 0 <= index < self.count:
+      raise IndexError("index out of range")
+    start = HEADER_SIZE + index * self.width
+    return self.map[start:start + self.width]
+
+  def key_at(self, index):
+    """Returns the decoded key stored at position index."""
+    return decode_key(self[index], self.kind)
+
+  def encode(self, key):
+    return encode_key(key, self.kind, self.width)
+
+  def find(self, key):
+    """Returns a position holding key, or -1 (binary_search_iterative on the map)."""
+    return binary_search_iterative(self.encode(key), self)
+
+  def find_first(self, key):
+    """Returns the first position holding key, or -1."""
+    encoded = self.encode(key)
+    index = lower_bound(encoded, self)
+    return index if index < self.count and self[index] == encoded else -1
+
+  def __contains__(self, key):
+    return self.find(key) != -1
+
+  def count_range(self, low_key, high_key):
+    """Counts keys with low_key <= key <= high_key."""
+    return count_in_range(self.encode(low_key), self.encode(high_key), self)
+
+  def close(self):
+    self.map.close()
+    self.file.close()
+
+  def __enter__(self):
+    return self
+
+  def __exit__(self, *exc_info):
+    self.close()
+
+
+def _write_run(records, directory):
+  """Sorts one chunk of encoded keys and spills it to a temporary file."""
+  records.sort()
+  run = tempfile.NamedTemporaryFile(dir=directory, suffix=".run", delete=False)
+  with run:
+    run.write(b"".join(records))
+  return run.name
+
+
+def _read_run(path, width, buffer_size):
+  """Yields the records of a run file, reading about buffer_size bytes at a time."""
+  block_size = max(1, buffer_size // width) * width
+  with open(path, "rb") as f:
+    while True:
+      block = f.read(block_size)
+      if not block:
+        return
+      for start in range(0, len(block), width):
+        yield block[start:start + width]
+
+
+def _buffer_size(memory_budget, files):
+  """Splits the memory budget between the run files that are open at once."""
+  return max(MIN_BUFFER, min(IO_BUFFER, memory_budget // files))
+
+
+def _merge_records(runs, out, width, buffer_size, unique):
+  """k-way merges run files into an open file. Returns the number of records written."""
+  count = 0
+  previous = None
+  for record in heapq.merge(*(_read_run(run, width, buffer_size) for run in runs)):
+    if unique and record == previous:
+      continue
+    out.write(record)
+    previous = record
+    count += 1
+  return count
+
+
+def _merge_group(runs, width, buffer_size, unique, directory):
+  """Merges a group of runs into a new run file and returns its path."""
+  run = tempfile.NamedTemporaryFile(dir=directory, suffix=".run", delete=False)
+  try:
+    with run:
+      _merge_records(runs, run, width, buffer_size, unique)
+  except BaseException:
+    os.remove(run.name)
+    raise
+  return run.name
+
+
+def build_index(keys, path, kind=KIND_INT, width=INT_WIDTH, run_size=RUN_SIZE,
+                unique=False, temp_dir=None, max_fan_in=MAX_FAN_IN,
+                memory_budget=MEMORY_BUDGET):
+  """
+  Writes an index file from an unsorted iterable of keys.
+
+  Args:
+    keys: Any iterable of ints (kind=KIND_INT) or bytes/str (kind=KIND_BYTES).
+      It is consumed once, so it can be a generator reading a huge file.
+    path: Where to write the index.
+    kind: KIND_INT or KIND_BYTES.
+    width: Record width for KIND_BYTES (ignored for integers).
+    run_size: Keys held in memory per sorted run; bounds memory use.
+    unique: Drop duplicate keys while merging.
+    temp_dir: Directory for the temporary run files (default: next to path).
+    max_fan_in: Most runs merged at once. With more runs than this, groups
+      of runs are first merged into longer runs, so the number of open
+      files stays bounded.
+    memory_budget: Bytes of read buffers shared by the runs of one merge.
+
+  Returns:
+    The number of records written.
+  """
+  if kind == KIND_INT:
+    width = INT_WIDTH
+  elif kind != KIND_BYTES:
+    raise ValueError(f"Unknown key kind {kind!r}")
+  if max_fan_in < 2:
+    raise ValueError(f"max_fan_in must be at least 2, got {max_fan_in}")
+  if temp_dir is None:
+    temp_dir = os.path.dirname(os.path.abspath(path))
+
+  runs = []
+  created = [] # Every run file made, so a failure part-way still cleans up
+  try:
+    # Phase 1: split the stream into sorted runs on disk
+    chunk = []
+    for key in keys:
+      chunk.append(encode_key(key, kind, width))
+      if len(chunk) >= run_size:
+        created.append(_write_run(chunk, temp_dir))
+        runs.append(created[-1])
+        chunk = []
+    if chunk or not runs:
+      created.append(_write_run(chunk, temp_dir))
+      runs.append(created[-1])
+
+    # Merge in several passes while there are too many runs to open at once
+    buffer_size = _buffer_size(memory_budget, max_fan_in)
+    while len(runs) > max_fan_in:
+      merged = []
+      for start in range(0, len(runs), max_fan_in):
+        group = runs[start:start + max_fan_in]
+        created.append(_merge_group(group, width, buffer_size, unique, temp_dir))
+        merged.append(created[-1])
+        for run in group:
+          os.remove(run)
+      runs = merged
+
+    # Phase 2: k-way merge of the runs into the index file
+    with open(path, "wb", buffering=IO_BUFFER) as out:
+      out.write(b"\0" * HEADER_SIZE) # Placeholder until the count is known
+      count = _merge_records(runs, out, width, _buffer_size(memory_budget, len(runs)), unique)
+      out.seek(0)
+      out.write(HEADER.pack(MAGIC, kind, width, count))
+  finally:
+    for run in created:
+      if os.path.exists(run):
+        os.remove(run)
+  return count
+
+
+# Example usage
+if __name__ == "__main__":
+  import random
+
+  index_path = os.path.join(tempfile.gettempdir(), "example.idx")
+  ids = random.sample(range(1_000_000), 100_000)
+  build_index(ids, index_path, run_size=10_000)
+
+  with SortedIndexReader(index_path) as index:
+    print(f"Records: {len(index)}, first: {index.key_at(0)}, last: {index.key_at(-1)}")
+    print(f"find({ids[0]}) -> position {index.find(ids[0])}")
+    print(f"Keys in [1000, 2000]: {index.count_range(1000, 2000)}")
+  os.remove(index_path)
@@ -0,0 +1,344 @@
+"""
+Blocked sorted list (companion to S1B - Searching Algorithms and S1C -
+Sorting Algorithms).
+
+Keeping a list sorted by appending and calling insertion_sort again, then
+looking items up with binary_search_iterative, costs O(n) per insert. A
+SortedList keeps its items in a list of sorted blocks of about `load` items
+each, plus the last item of every block (`_maxes`):
+
+  - a lookup bisects _maxes to find the block, then bisects the block;
+  - an insert or delete does the same and shifts at most one block, which is
+    a short memmove, splitting a block that grows past 2 * load and joining
+    one that shrinks below load / 2 with its neighbour.
+
+So search, insert and delete cost O(log n) comparisons plus O(load) moves,
+and irange() iterates any key range in order. Duplicate items are allowed.
+
+save_snapshot / load_snapshot store the items in a compact file for a fast
+restart: loading reads the blocks back in order and never re-sorts.
+
+File layout (little-endian):
+
+  offset 0   6s  magic b"SLST01"
+  offset 6   B   item kind: 0 = signed 64-bit integers, 1 = 64-bit floats,
+                 2 = pickled blocks (any other orderable items)
+  offset 7   x   padding
+  offset 8   Q   number of items
+  offset 16  Q   block size (load) the items were written with
+  offset 24  ... the items: packed machine values for kinds 0 and 1, or one
+                 pickled list per block for kind 2
+"""
+
+import os
+import pickle
+import struct
+import sys
+from array import array
+from bisect import bisect_left, bisect_right, insort
+from itertools import chain
+
+LOAD = 1000 # Target block size
+
+MAGIC = b"SLST01"
+HEADER = struct.Struct("<6sBxQQ")
+KIND_INT = 0
+KIND_FLOAT = 1
+KIND_PICKLE = 2
+TYPECODES = {KIND_INT: "q", KIND_FLOAT: "d"}
+INT64_MIN = -(1 << 63)
+INT64_MAX = (1 << 63) - 1
+
+
+class SortedList:
+  """
+  A list that keeps its items in ascending order.
+
+  Items are added with add() / update() rather than by position. Iterating
+  while the list is being changed is not supported, as with a plain list.
+  """
+
+  def __init__(self, items=(), load=LOAD):
+    if load < 4:
+      raise ValueError(f"load must be at least 4, got {load}")
+    self._load = load
+    self._blocks = [] # Non-empty sorted lists
+    self._maxes = [] # _maxes[i] == _blocks[i][-1]
+    self._len = 0
+    self.update(items)
+
+  @classmethod
+  def from_sorted(cls, items, load=LOAD):
+    """Builds a SortedList from items already in ascending order without sorting them."""
+    result = cls(load=load)
+    result._set_items(list(items))
+    return result
+
+  def _set_items(self, items):
+    """Replaces the contents with a sorted list of items, cut into blocks."""
+    load = self._load
+    self._blocks = [items[start:start + load] for start in range(0, len(items), load)]
+    self._maxes = [block[-1] for block in self._blocks]
+    self._len = len(items)
+
+  def __len__(self):
+    return self._len
+
+  def __iter__(self):
+    return chain.from_iterable(self._blocks)
+
+  def __reversed__(self):
+    return chain.from_iterable(map(reversed, reversed(self._blocks)))
+
+  def __repr__(self):
+    return f"{type(self).__name__}({list(self)!r})"
+
+  def __eq__(self, other):
+    if not isinstance(other, SortedList):
+      return NotImplemented
+    return self._len == other._len and all(a == b for a, b in zip(self, other))
+
+  def copy(self):
+    """Returns a shallow copy (the blocks are copied, the items are shared)."""
+    result = type(self)(load=self._load)
+    result._blocks = [block.copy() for block in self._blocks]
+    result._maxes = self._maxes.copy()
+    result._len = self._len
+    return result
+
+  def __getitem__(self, index):
+    """Returns the item at a position; O(number of blocks) except for the ends."""
+    if index < 0:
+      index += self._len
+    if not 0 <= index < self._len:
+      raise IndexError("SortedList index out of range")
+    if index == 0:
+      return self._blocks[0][0]
+    if index == self._len - 1:
+      return self._maxes[-1]
+    for block in self._blocks:
+      if index < len(block):
+        return block[index]
+      index -= len(block)
+
+  def __contains__(self, value):
+    i = bisect_left(self._maxes, value)
+    if i == len(self._maxes):
+      return False
+    block = self._blocks[i]
+    return block[bisect_left(block, value)] == value
+
+  def add(self, value):
+    """Inserts value after any equal items."""
+    maxes = self._maxes
+    if not maxes:
+      self._blocks.append([value])
+      maxes.append(value)
+    else:
+      i = bisect_right(maxes, value)
+      if i == len(maxes): # Past the last item: append to the last block
+        i -= 1
+        self._blocks[i].append(value)
+        maxes[i] = value
+      else:
+        insort(self._blocks[i], value)
+      if len(self._blocks[i]) > 2 * self._load:
+        self._split(i)
+    self._len += 1
+
+  def update(self, values):
+    """
+    Adds every item of an iterable.
+
+    A batch that is large compared with the list is sorted and merged in one
+    pass (Timsort merges the two sorted runs); a small one is added item by
+    item.
+    """
+    values = sorted(values)
+    if not values:
+      return
+    if len(values) * 8 >= self._len:
+      items = list(self)
+      items.extend(values)
+      items.sort()
+      self._set_items(items)
+    else:
+      for value in values:
+        self.add(value)
+
+  def remove(self, value):
+    """Removes one occurrence of value; raises ValueError if there is none."""
+    if not self.discard(value):
+      raise ValueError(f"{value!r} not in SortedList")
+
+  def discard(self, value):
+    """Removes one occurrence of value if present. Returns True if one was removed."""
+    maxes = self._maxes
+    i = bisect_left(maxes, value)
+    if i == len(maxes):
+      return False
+    block = self._blocks[i]
+    j = bisect_left(block, value)
+    if block[j] != value:
+      return False
+    del block[j]
+    self._len -= 1
+    if not block:
+      del self._blocks[i]
+      del maxes[i]
+    else:
+      maxes[i] = block[-1]
+      if len(block) < self._load // 2 and len(self._blocks) > 1:
+        self._join(i)
+    return True
+
+  def _split(self, i):
+    """Splits block i in two."""
+    block = self._blocks[i]
+    half = len(block) // 2
+    self._blocks[i:i + 1] = [block[:half], block[half:]]
+    self._maxes[i:i + 1] = [block[half - 1], block[-1]]
+
+  def _join(self, i):
+    """Joins a small block i with a neighbour, splitting the result again if it is too large."""
+    if i == len(self._blocks) - 1:
+      i -= 1 # Join the last block with the one before it
+    self._blocks[i].extend(self._blocks.pop(i + 1))
+    self._maxes[i] = self._maxes.pop(i + 1)
+    if len(self._blocks[i]) > 2 * self._load:
+      self._split(i)
+
+  def count(self, value):
+    """Returns the number of items equal to value."""
+    return sum(1 for _ in self.irange(value, value))
+
+  def irange(self, low=None, high=None, inclusive=(True, True)):
+    """
+    Iterates the items between low and high in ascending order.
+
+    Args:
+      low: Smallest item to include (None: from the start).
+      high: Largest item to include (None: to the end).
+      inclusive: Whether low and high themselves are included.
+
+    Yields:
+      The items in range. Each block is sliced once, so the list must not
+      be changed until iteration is finished.
+    """
+    maxes = self._maxes
+    blocks = self._blocks
+    if low is None:
+      i, j = 0, 0
+    else:
+      search = bisect_left if inclusive[0] else bisect_right
+      i = search(maxes, low)
+      if i == len(maxes):
+        return
+      j = search(blocks[i], low)
+
+    for block_index in range(i, len(blocks)):
+      block = blocks[block_index]
+      if high is not None and (maxes[block_index] > high if inclusive[1] else maxes[block_index] >= high):
+        end = (bisect_right if inclusive[1] else bisect_left)(block, high)
+        yield from block[j:end]
+        return # Reached high
+      yield from block[j:] if j else block
+      j = 0
+
+
+def _kind_of(items):
+  """Picks the most compact snapshot kind that can hold every item."""
+  if not len(items):
+    return KIND_INT
+  first, last = items[0], items[len(items) - 1]
+  if all(type(value) is int for value in items) and first >= INT64_MIN and last <= INT64_MAX:
+    return KIND_INT
+  if all(type(value) is float for value in items):
+    return KIND_FLOAT
+  return KIND_PICKLE
+
+
+def save_snapshot(sorted_list, path):
+  """
+  Writes the items of a SortedList to a snapshot file.
+
+  The file is written next to path and renamed over it, so a reader (or a
+  crash part-way through) never sees a half-written snapshot.
+
+  Returns:
+    The number of items written.
+  """
+  kind = _kind_of(sorted_list)
+  tmp_path = f"{path}.{os.getpid()}.tmp"
+  try:
+    with open(tmp_path, "wb") as f:
+      f.write(HEADER.pack(MAGIC, kind, len(sorted_list), sorted_list._load))
+      for block in sorted_list._blocks:
+        if kind == KIND_PICKLE:
+          pickle.dump(block, f, protocol=pickle.HIGHEST_PROTOCOL)
+        else:
+          values = array(TYPECODES[kind], block)
+          if sys.byteorder == "big":
+            values.byteswap() # Stored little-endian
+          values.tofile(f)
+    os.replace(tmp_path, path)
+  except BaseException:
+    if os.path.exists(tmp_path):
+      os.remove(tmp_path)
+    raise
+  return len(sorted_list)
+
+
+def load_snapshot(path, load=None):
+  """
+  Reads a snapshot file written by save_snapshot.
+
+  Args:
+    path: The snapshot file.
+    load: Block size of the returned list (default: the one it was saved with).
+
+  Returns:
+    A SortedList with the saved items.
+  """
+  with open(path, "rb") as f:
+    header = f.read(HEADER.size)
+    if len(header) != HEADER.size:
+      raise ValueError(f"{path} is too short to be a snapshot")
+    magic, kind, count, saved_load = HEADER.unpack(header)
+    if magic != MAGIC:
+      raise ValueError(f"{path} is not a snapshot file")
+    result = SortedList(load=load or saved_load)
+    if kind == KIND_PICKLE:
+      items = []
+      while len(items) < count:
+        items.extend(pickle.load(f))
+    elif kind in TYPECODES:
+      values = array(TYPECODES[kind])
+      values.fromfile(f, count)
+      if sys.byteorder == "big":
+        values.byteswap()
+      items = values.tolist()
+    else:
+      raise ValueError(f"Unknown snapshot kind {kind} in {path}")
+  result._set_items(items)
+  return result
+
+
+# Example usage
+if __name__ == "__main__":
+  import random
+  import tempfile
+
+  scores = SortedList(random.sample(range(1000), 20), load=8)
+  scores.add(500)
+  scores.update([1, 999, 500])
+  scores.remove(999)
+  print(f"Items: {list(scores)}")
+  print(f"500 in list: {500 in scores}, count(500): {scores.count(500)}")
+  print(f"Between 100 and 300: {list(scores.irange(100, 300))}")
+  print(f"Smallest: {scores[0]}, largest: {scores[-1]}")
+
+  snapshot_path = os.path.join(tempfile.gettempdir(), "example.slst")
+  save_snapshot(scores, snapshot_path)
+  print(f"Restored equal: {load_snapshot(snapshot_path) == scores}")
+  os.remove(snapshot_path)
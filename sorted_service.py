@@ -0,0 +1,366 @@
+"""
+Asyncio front end for SortedList (see sorted_list.py).
+
+SortedListService owns one SortedList inside an event loop:
+
+  - add() and remove() are queued. Every write queued while the loop is busy
+    is applied in one batch on the next loop iteration (runs of consecutive
+    adds as a single SortedList.update), then the waiting callers resume, so
+    many concurrent writers share the cost of one update.
+  - Reads (contains, count, len, irange) are answered straight from the list
+    without waiting for queued writes. irange hands out items in pages and
+    lets other tasks run between pages, so a long range never stalls the
+    loop.
+  - With a snapshot_path the list is restored from that file on start and
+    saved to it on close (and every snapshot_interval seconds if given). The
+    list is copied in the loop and written by a worker thread.
+
+serve() puts a service behind a TCP server speaking one request per line,
+and Client is the matching asyncio client. Values are integers:
+
+  ADD <value>                     -> OK
+  DEL <value>                     -> 1 if an item was removed, else 0
+  HAS <value>                     -> 1 or 0
+  COUNT <value>                   -> number of equal items
+  RANGE <low> <high> [<limit>]    -> items in [low, high], space separated
+  LEN                             -> number of items
+  SNAPSHOT                        -> number of items saved
+
+A bad request is answered with ERR <message>.
+"""
+
+import asyncio
+import os
+from itertools import islice
+
+from sorted_list import LOAD, SortedList, load_snapshot, save_snapshot
+
+PAGE_SIZE = 1000 # Items irange takes from the list between yields to the loop
+
+# Request name -> accepted numbers of values
+COMMANDS = {"ADD": (1,), "DEL": (1,), "HAS": (1,), "COUNT": (1,), "RANGE": (2, 3),
+            "LEN": (0,), "SNAPSHOT": (0,)}
+
+
+class SortedListService:
+  """
+  A SortedList shared by the tasks of one event loop.
+
+  Use it with `async with SortedListService(...) as service:` or call
+  start() and close() yourself.
+
+  Attributes:
+    items: The SortedList; read it freely, but write through add()/remove().
+    batches: Number of write batches applied so far.
+    batched_writes: Number of writes in those batches.
+  """
+
+  def __init__(self, items=(), snapshot_path=None, snapshot_interval=None, batch_delay=0.0,
+               load=LOAD):
+    """
+    Args:
+      items: Initial items (added to any restored from the snapshot). A
+        SortedList is taken over as is when there is nothing to restore.
+      snapshot_path: File to restore from on start and save to on close, or None.
+      snapshot_interval: Seconds between periodic snapshots, or None.
+      batch_delay: Seconds a write waits for more writes to join its batch;
+        0 batches only the writes queued during one loop iteration.
+      load: Block size of the SortedList.
+    """
+    self.items = SortedList(load=load)
+    self.snapshot_path = snapshot_path
+    self.snapshot_interval = snapshot_interval
+    self.batch_delay = batch_delay
+    self.batches = 0
+    self.batched_writes = 0
+    self._initial = items
+    self._pending = [] # (is_add, value, future) in arrival order
+    self._flush_handle = None
+    self._snapshot_lock = asyncio.Lock()
+    self._snapshot_task = None
+
+  async def start(self):
+    """Restores the snapshot (if any), adds the initial items and starts periodic snapshots."""
+    if self.snapshot_path is not None and os.path.exists(self.snapshot_path):
+      self.items = await asyncio.to_thread(load_snapshot, self.snapshot_path, self.items._load)
+    if isinstance(self._initial, SortedList) and not self.items:
+      self.items = self._initial # Used as is, without copying
+    else:
+      self.items.update(self._initial)
+    self._initial = ()
+    if self.snapshot_path is not None and self.snapshot_interval:
+      self._snapshot_task = asyncio.create_task(self._snapshot_periodically())
+    return self
+
+  async def close(self):
+    """Applies queued writes, stops periodic snapshots and saves a final snapshot."""
+    if self._snapshot_task is not None:
+      self._snapshot_task.cancel()
+      try:
+        await self._snapshot_task
+      except asyncio.CancelledError:
+        pass
+      self._snapshot_task = None
+    if self._flush_handle is not None:
+      self._flush_handle.cancel()
+      self._flush()
+    if self.snapshot_path is not None:
+      await self.snapshot()
+
+  async def __aenter__(self):
+    return await self.start()
+
+  async def __aexit__(self, *exc_info):
+    await self.close()
+
+  # --- Writes ---
+
+  def _submit(self, is_add, value):
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+    self._pending.append((is_add, value, future))
+    if self._flush_handle is None:
+      if self.batch_delay:
+        self._flush_handle = loop.call_later(self.batch_delay, self._flush)
+      else:
+        self._flush_handle = loop.call_soon(self._flush)
+    return future
+
+  async def add(self, value):
+    """Adds value; returns once it is in the list."""
+    await self._submit(True, value)
+
+  async def remove(self, value):
+    """Removes one item equal to value. Returns True if there was one."""
+    return await self._submit(False, value)
+
+  def _flush(self):
+    """Applies every queued write in arrival order and resumes the writers."""
+    self._flush_handle = None
+    pending, self._pending = self._pending, []
+    self.batches += 1
+    self.batched_writes += len(pending)
+
+    results = [None] * len(pending)
+    start = 0
+    while start < len(pending):
+      end = start
+      while end < len(pending) and pending[end][0]:
+        end += 1
+      if end > start: # A run of adds
+        try:
+          self.items.update([value for _, value, _ in pending[start:end]])
+        except TypeError as e: # Items that cannot be compared reject the whole run
+          results[start:end] = [e] * (end - start)
+      else:
+        try:
+          results[start] = self.items.discard(pending[start][1])
+        except TypeError as e:
+          results[start] = e
+        end += 1
+      start = end
+
+    for (_, _, future), result in zip(pending, results):
+      if future.done(): # Caller was cancelled
+        continue
+      if isinstance(result, Exception):
+        future.set_exception(result)
+      else:
+        future.set_result(result)
+
+  # --- Reads ---
+
+  def __len__(self):
+    return len(self.items)
+
+  def __contains__(self, value):
+    return value in self.items
+
+  def count(self, value):
+    return self.items.count(value)
+
+  async def irange(self, low=None, high=None, inclusive=(True, True), page_size=PAGE_SIZE):
+    """
+    Async version of SortedList.irange that can run alongside writers.
+
+    Items are copied out page_size at a time and the search resumes after
+    the last item handed out, so writes applied between pages are seen if
+    they fall later in the range and missed if they fall earlier.
+    """
+    low_inclusive = inclusive[0]
+    skip = 0 # Items equal to low that were already handed out
+    while True:
+      page = list(islice(self.items.irange(low, high, (low_inclusive, inclusive[1])),
+                         skip, skip + page_size))
+      for item in page:
+        yield item
+      if len(page) < page_size:
+        return # Reached high or the end
+      last = page[-1]
+      equal = 0
+      while equal < len(page) and page[-1 - equal] == last:
+        equal += 1
+      if equal == len(page) and low_inclusive and low == last:
+        skip += equal # Still inside a run of duplicates
+      else:
+        skip = equal
+      low, low_inclusive = last, True
+      await asyncio.sleep(0) # Let writers run between pages
+
+  # --- Snapshots ---
+
+  async def snapshot(self):
+    """Saves the list to snapshot_path. Returns the number of items saved."""
+    if self.snapshot_path is None:
+      raise ValueError("The service has no snapshot_path")
+    async with self._snapshot_lock:
+      frozen = self.items.copy()
+      return await asyncio.to_thread(save_snapshot, frozen, self.snapshot_path)
+
+  async def _snapshot_periodically(self):
+    while True:
+      await asyncio.sleep(self.snapshot_interval)
+      await self.snapshot()
+
+
+# --- TCP front end ---
+
+async def _execute(service, words):
+  """Runs one request and returns the response line."""
+  if not words:
+    return "ERR empty request"
+  command, args = words[0].upper(), words[1:]
+  try:
+    values = [int(arg) for arg in args]
+  except ValueError:
+    return f"ERR values must be integers: {' '.join(args)}"
+  if command not in COMMANDS:
+    return f"ERR unknown command {command}"
+  if len(values) not in COMMANDS[command]:
+    return f"ERR {command} takes {' or '.join(map(str, COMMANDS[command]))} values"
+
+  if command == "ADD":
+    await service.add(values[0])
+    return "OK"
+  if command == "DEL":
+    return "1" if await service.remove(values[0]) else "0"
+  if command == "HAS":
+    return "1" if values[0] in service else "0"
+  if command == "COUNT":
+    return str(service.count(values[0]))
+  if command == "RANGE":
+    limit = values[2] if len(values) == 3 else None
+    items = []
+    async for item in service.irange(values[0], values[1]):
+      if limit is not None and len(items) >= limit:
+        break
+      items.append(str(item))
+    return " ".join(items)
+  if command == "LEN":
+    return str(len(service))
+  try:
+    return str(await service.snapshot())
+  except (ValueError, OSError) as e:
+    return f"ERR {e}"
+
+
+async def serve(service, host="127.0.0.1", port=0):
+  """
+  Starts a TCP server for a started service.
+
+  Returns:
+    The asyncio.Server; its address is server.sockets[0].getsockname().
+  """
+  async def handle(reader, writer):
+    try:
+      while line := await reader.readline():
+        response = await _execute(service, line.decode("ascii", "replace").split())
+        writer.write(response.encode("ascii") + b"\n")
+        await writer.drain()
+    except ConnectionError:
+      pass # Client went away
+    finally:
+      writer.close()
+
+  return await asyncio.start_server(handle, host, port)
+
+
+class Client:
+  """
+  Asyncio client for serve(). Requests on one connection are answered in
+  order, one at a time; open a Client per task for concurrent requests.
+  """
+
+  def __init__(self, reader, writer):
+    self._reader = reader
+    self._writer = writer
+    self._lock = asyncio.Lock()
+
+  @classmethod
+  async def connect(cls, host="127.0.0.1", port=0):
+    return cls(*await asyncio.open_connection(host, port))
+
+  async def request(self, *words):
+    """Sends one request and returns its response line; raises ValueError on ERR."""
+    async with self._lock:
+      self._writer.write(" ".join(map(str, words)).encode("ascii") + b"\n")
+      await self._writer.drain()
+      line = await self._reader.readline()
+    if not line:
+      raise ConnectionError("Server closed the connection")
+    response = line.decode("ascii").rstrip("\n")
+    if response.startswith("ERR"):
+      raise ValueError(response[4:])
+    return response
+
+  async def add(self, value):
+    await self.request("ADD", value)
+
+  async def remove(self, value):
+    return await self.request("DEL", value) == "1"
+
+  async def contains(self, value):
+    return await self.request("HAS", value) == "1"
+
+  async def count(self, value):
+    return int(await self.request("COUNT", value))
+
+  async def range(self, low, high, limit=None):
+    words = ("RANGE", low, high) if limit is None else ("RANGE", low, high, limit)
+    return [int(item) for item in (await self.request(*words)).split()]
+
+  async def len(self):
+    return int(await self.request("LEN"))
+
+  async def snapshot(self):
+    return int(await self.request("SNAPSHOT"))
+
+  async def close(self):
+    self._writer.close()
+    await self._writer.wait_closed()
+
+
+# Example usage
+if __name__ == "__main__":
+  import tempfile
+
+  async def main():
+    snapshot_path = os.path.join(tempfile.gettempdir(), "example-service.slst")
+    async with SortedListService(range(0, 100, 10), snapshot_path=snapshot_path) as service:
+      await asyncio.gather(*(service.add(value) for value in (35, 5, 95, 35)))
+      print(f"Batches: {service.batches} for {service.batched_writes} writes")
+      print(f"Items: {[item async for item in service.irange()]}")
+
+      server = await serve(service)
+      client = await Client.connect(*server.sockets[0].getsockname()[:2])
+      print(f"HAS 35: {await client.contains(35)}, COUNT 35: {await client.count(35)}")
+      print(f"DEL 40: {await client.remove(40)}, RANGE 30 60: {await client.range(30, 60)}")
+      await client.close()
+      server.close()
+      await server.wait_closed()
+
+    async with SortedListService(snapshot_path=snapshot_path) as restored:
+      print(f"Restored {len(restored)} items from {snapshot_path}")
+    os.remove(snapshot_path)
+
+  asyncio.run(main())
@@ -0,0 +1,582 @@
+"""
+Sorting algorithms from "S1C - Sorting Algorithms" as an importable module.
+
+insertion_sort, bubble_sort_optimized, quick_sort and merge_sort are the
+notebook versions, so other modules can build on them and compare against
+them.
+
+introsort is the production quicksort: median-of-three / ninther pivots,
+three-way partitioning, insertion sort for small partitions and a heapsort
+fallback when partitioning keeps going badly, so it is O(n log n) on every
+input and its stack depth is O(log n).
+
+merge_sort_bottom_up and natural_merge_sort are stable merge sorts that use
+one preallocated buffer instead of slicing; natural_merge_sort also takes
+advantage of runs that are already in order.
+"""
+
+from bisect import bisect_left, bisect_right
+
+
+def insertion_sort(arr):
+    """Sorts a list using the Insertion Sort algorithm (in-place)."""
+    n = len(arr)
+    # Traverse through 1 to n-1 (0-based indexing)
+    for index in range(1, n):
+        unsorted_value = arr[index] # Element to be inserted
+        current = index - 1       # Index of the last element in the sorted subarray
+
+        # Move elements of arr[0..current] that are greater than unsorted_value
+        # one position ahead of their current position
+        while current >= 0 and unsorted_value < arr[current]:
+            arr[current + 1] = arr[current] # Shift element to the right
+            current -= 1
+
+        # Insert unsorted_value after the element just smaller than it.
+        arr[current + 1] = unsorted_value
+
+
+def bubble_sort_optimized(arr):
+    """Sorts a list using the optimized Bubble Sort algorithm (in-place)."""
+    n = len(arr)
+    swapped = True # Initialize flag to start the loop
+    num_passes = 0
+
+    # The outer loop continues as long as a swap was made in the inner loop
+    # The range of the inner loop decreases with each pass
+    while swapped:
+        swapped = False # Assume no swaps in this pass
+        # Inner loop iterates up to the last sorted element
+        for i in range(n - 1 - num_passes):
+            if arr[i] > arr[i+1]:
+                # Swap elements
+                arr[i], arr[i+1] = arr[i+1], arr[i] # Python's tuple swap
+                swapped = True # Mark that a swap occurred
+        num_passes += 1 # Increment pass counter
+
+
+def partition(arr, first, last):
+    """Partitions the array using the first element as pivot (Hoare-like)."""
+    pivot_value = arr[first]
+    left_mark = first + 1
+    right_mark = last
+    done = False
+
+    while not done:
+        # Move left_mark right
+        while left_mark <= right_mark and arr[left_mark] <= pivot_value:
+            left_mark += 1
+
+        # Move right_mark left
+        while right_mark >= left_mark and arr[right_mark] >= pivot_value:
+            right_mark -= 1
+
+        # Check if markers crossed
+        if right_mark < left_mark:
+            done = True
+        else:
+            # Swap elements
+            arr[left_mark], arr[right_mark] = arr[right_mark], arr[left_mark]
+
+    # Swap pivot into correct position
+    arr[first], arr[right_mark] = arr[right_mark], arr[first]
+
+    return right_mark # Return split point
+
+
+def quick_sort_recursive(arr, first, last):
+    """Recursive helper function for Quicksort."""
+    if first < last:
+        split_point = partition(arr, first, last)
+        # Recursively sort halves
+        quick_sort_recursive(arr, first, split_point - 1)
+        quick_sort_recursive(arr, split_point + 1, last)
+
+
+def quick_sort(arr):
+    """Sorts a list using the Quicksort algorithm (in-place)."""
+    quick_sort_recursive(arr, 0, len(arr) - 1)
+
+
+def merge_sort(arr):
+    """Sorts a list using the Merge Sort algorithm."""
+    if len(arr) > 1:
+        # Divide
+        mid = len(arr) // 2
+        left_half = arr[:mid]  # Slicing creates copies
+        right_half = arr[mid:]
+
+        # Conquer (Recursive calls)
+        merge_sort(left_half)
+        merge_sort(right_half)
+
+        # Combine (Merge)
+        i = 0 # Pointer for left_half
+        j = 0 # Pointer for right_half
+        k = 0 # Pointer for original arr (to place merged elements)
+
+        # Merge elements into arr
+        while i < len(left_half) and j < len(right_half):
+            if left_half[i] < right_half[j]:
+                arr[k] = left_half[i]
+                i += 1
+            else:
+                arr[k] = right_half[j]
+                j += 1
+            k += 1
+
+        # Copy remaining elements from left_half (if any)
+        while i < len(left_half):
+            arr[k] = left_half[i]
+            i += 1
+            k += 1
+
+        # Copy remaining elements from right_half (if any)
+        while j < len(right_half):
+            arr[k] = right_half[j]
+            j += 1
+            k += 1
+    # Base case (len(arr) <= 1) does nothing, as it's already sorted
+
+
+# --- Production quicksort (introsort) ---
+
+INSERTION_CUTOFF = 16  # Partitions this small are finished with insertion sort
+NINTHER_CUTOFF = 128   # Partitions this large use the ninther as pivot
+
+
+def insertion_sort_range(arr, first, last):
+    """Insertion sort restricted to arr[first..last] (inclusive), in-place."""
+    for index in range(first + 1, last + 1):
+        unsorted_value = arr[index]
+        current = index - 1
+        while current >= first and unsorted_value < arr[current]:
+            arr[current + 1] = arr[current]
+            current -= 1
+        arr[current + 1] = unsorted_value
+
+
+def heap_sort_range(arr, first, last):
+    """Heapsort restricted to arr[first..last] (inclusive), in-place, O(n log n)."""
+    size = last - first + 1
+
+    def sift_down(root, end):
+        # Move arr[first + root] down until the max-heap property holds below it
+        while True:
+            child = 2 * root + 1
+            if child >= end:
+                return
+            if child + 1 < end and arr[first + child] < arr[first + child + 1]:
+                child += 1
+            if not arr[first + root] < arr[first + child]:
+                return
+            arr[first + root], arr[first + child] = arr[first + child], arr[first + root]
+            root = child
+
+    for root in range(size // 2 - 1, -1, -1):
+        sift_down(root, size)
+    for end in range(size - 1, 0, -1):
+        arr[first], arr[first + end] = arr[first + end], arr[first]
+        sift_down(0, end)
+
+
+def _median_of_three(arr, a, b, c):
+    """Returns the index (a, b or c) holding the median of the three values."""
+    if arr[a] < arr[b]:
+        if arr[b] < arr[c]:
+            return b
+        return c if arr[a] < arr[c] else a
+    if arr[a] < arr[c]:
+        return a
+    return c if arr[b] < arr[c] else b
+
+
+def choose_pivot(arr, first, last):
+    """
+    Picks a pivot index for arr[first..last].
+
+    Median of first/middle/last for mid-sized ranges; for large ranges the
+    ninther (median of three medians-of-three), which is much harder to
+    drive into the O(n^2) case than arr[first].
+    """
+    mid = (first + last) // 2
+    if last - first + 1 < NINTHER_CUTOFF:
+        return _median_of_three(arr, first, mid, last)
+    step = (last - first + 1) // 8
+    return _median_of_three(
+        arr,
+        _median_of_three(arr, first, first + step, first + 2 * step),
+        _median_of_three(arr, mid - step, mid, mid + step),
+        _median_of_three(arr, last - 2 * step, last - step, last),
+    )
+
+
+def partition_three_way(arr, first, last, pivot_index):
+    """
+    Dutch national flag partition of arr[first..last] around arr[pivot_index].
+
+    Returns (lt, gt) such that arr[first..lt-1] < pivot, arr[lt..gt] == pivot
+    and arr[gt+1..last] > pivot. Runs of keys equal to the pivot are placed
+    once and never looked at again, so inputs with many duplicates stay
+    O(n log n).
+    """
+    pivot_value = arr[pivot_index]
+    lt = first   # arr[first..lt-1] < pivot
+    i = first    # arr[lt..i-1] == pivot
+    gt = last    # arr[gt+1..last] > pivot
+    while i <= gt:
+        if arr[i] < pivot_value:
+            arr[lt], arr[i] = arr[i], arr[lt]
+            lt += 1
+            i += 1
+        elif pivot_value < arr[i]:
+            arr[i], arr[gt] = arr[gt], arr[i]
+            gt -= 1
+        else:
+            i += 1
+    return lt, gt
+
+
+def _introsort_loop(arr, first, last, depth_limit):
+    # Loop on the larger side and recurse into the smaller one, so the
+    # recursion depth is at most log2(n)
+    while last - first + 1 > INSERTION_CUTOFF:
+        if depth_limit == 0:
+            heap_sort_range(arr, first, last) # Partitioning is degrading
+            return
+        depth_limit -= 1
+
+        lt, gt = partition_three_way(arr, first, last, choose_pivot(arr, first, last))
+        if lt - first < last - gt:
+            _introsort_loop(arr, first, lt - 1, depth_limit)
+            first = gt + 1
+        else:
+            _introsort_loop(arr, gt + 1, last, depth_limit)
+            last = lt - 1
+    insertion_sort_range(arr, first, last)
+
+
+def introsort(arr):
+    """
+    Sorts a list in-place with a hybrid quicksort (introsort). Not stable.
+
+    Worst case O(n log n) time and O(log n) stack, unlike quick_sort, which
+    is O(n^2) on sorted or reverse-sorted input and can overflow the stack.
+    """
+    n = len(arr)
+    if n < 2:
+        return
+    _introsort_loop(arr, 0, n - 1, 2 * n.bit_length())
+
+
+# --- Buffered merge sort and natural merge sort ---
+
+MERGE_BLOCK = 32  # Bottom-up merge sort first insertion-sorts blocks of this size
+MIN_GALLOP = 7    # Consecutive wins before a merge switches to galloping
+
+
+def _merge_into(src, dst, lo, mid, hi):
+    """Stably merges src[lo:mid] and src[mid:hi] into dst[lo:hi]."""
+    i = lo
+    j = mid
+    k = lo
+    while i < mid and j < hi:
+        if src[j] < src[i]: # Take from the right only if strictly smaller (stable)
+            dst[k] = src[j]
+            j += 1
+        else:
+            dst[k] = src[i]
+            i += 1
+        k += 1
+    while i < mid:
+        dst[k] = src[i]
+        i += 1
+        k += 1
+    while j < hi:
+        dst[k] = src[j]
+        j += 1
+        k += 1
+
+
+def merge_sort_bottom_up(arr):
+    """
+    Sorts a list in-place with a stable, bottom-up merge sort.
+
+    merge_sort slices arr[:mid] and arr[mid:] at every level, allocating
+    O(n log n) temporary lists in total. This version allocates a single
+    auxiliary list of length n up front. Each pass merges runs of width w
+    from one list into the other, then the two lists swap roles, so no
+    other memory is allocated. Blocks of MERGE_BLOCK items are insertion
+    sorted first.
+    """
+    n = len(arr)
+    if n < 2:
+        return
+    for start in range(0, n, MERGE_BLOCK):
+        insertion_sort_range(arr, start, min(start + MERGE_BLOCK, n) - 1)
+
+    src = arr
+    dst = [None] * n # The only allocation
+    width = MERGE_BLOCK
+    while width < n:
+        for lo in range(0, n, 2 * width):
+            mid = min(lo + width, n)
+            hi = min(lo + 2 * width, n)
+            _merge_into(src, dst, lo, mid, hi)
+        src, dst = dst, src
+        width *= 2
+
+    if src is not arr:
+        arr[:] = src # Copies in place; arr stays the same list object
+
+
+def _gallop(key, a, lo, hi, right, from_end=False):
+    """
+    Finds where key belongs in sorted a[lo:hi] by exponential search.
+
+    right=True returns the bisect_right position (after equal items),
+    right=False the bisect_left position. The search starts at a[lo] (or at
+    a[hi - 1] when from_end is True) and doubles its step, so it costs
+    O(log k) comparisons when the answer is k places from that end.
+    """
+    search = bisect_right if right else bisect_left
+    if from_end:
+        step = 1
+        high = hi # a[high:hi] all belong after key
+        while high - step >= lo:
+            item = a[high - step]
+            if (not key < item) if right else (item < key): # Only < is needed
+                break
+            high -= step
+            step *= 2
+        return search(a, key, max(lo, high - step + 1), high)
+
+    step = 1
+    low = lo # a[lo:low] all belong before key
+    while low + step - 1 < hi:
+        item = a[low + step - 1]
+        if not ((not key < item) if right else (item < key)):
+            break
+        low += step
+        step *= 2
+    return search(a, key, low, min(hi, low + step - 1))
+
+
+def _merge_lo(arr, buf, lo, mid, hi, gallop_state):
+    """Merges arr[lo:mid] (copied to buf) with arr[mid:hi], filling from the left."""
+    count_left = mid - lo
+    for t in range(count_left):
+        buf[t] = arr[lo + t]
+    i = 0    # Next item of the left run (in buf)
+    j = mid  # Next item of the right run (in arr)
+    k = lo   # Next slot to fill
+    min_gallop = gallop_state[0]
+
+    while i < count_left and j < hi:
+        # One item at a time until one run keeps winning
+        wins_left = wins_right = 0
+        while i < count_left and j < hi and wins_left < min_gallop and wins_right < min_gallop:
+            if arr[j] < buf[i]:
+                arr[k] = arr[j]
+                j += 1
+                wins_right += 1
+                wins_left = 0
+            else:
+                arr[k] = buf[i]
+                i += 1
+                wins_left += 1
+                wins_right = 0
+            k += 1
+
+        # Galloping: move whole blocks found by exponential search
+        while i < count_left and j < hi:
+            end = _gallop(arr[j], buf, i, count_left, right=True)
+            moved_left = end - i
+            while i < end:
+                arr[k] = buf[i]
+                i += 1
+                k += 1
+            if i == count_left:
+                break
+            end = _gallop(buf[i], arr, j, hi, right=False)
+            moved_right = end - j
+            while j < end:
+                arr[k] = arr[j]
+                j += 1
+                k += 1
+            if moved_left < MIN_GALLOP and moved_right < MIN_GALLOP:
+                min_gallop += 1 # Galloping isn't paying off; make it harder to re-enter
+                break
+            min_gallop = max(1, min_gallop - 1)
+
+    while i < count_left: # The rest of the right run is already in place
+        arr[k] = buf[i]
+        i += 1
+        k += 1
+    gallop_state[0] = min_gallop
+
+
+def _merge_hi(arr, buf, lo, mid, hi, gallop_state):
+    """Merges arr[lo:mid] with arr[mid:hi] (copied to buf), filling from the right."""
+    count_right = hi - mid
+    for t in range(count_right):
+        buf[t] = arr[mid + t]
+    i = mid - 1          # Last item of the left run (in arr)
+    j = count_right - 1  # Last item of the right run (in buf)
+    k = hi - 1           # Next slot to fill
+    min_gallop = gallop_state[0]
+
+    while i >= lo and j >= 0:
+        wins_left = wins_right = 0
+        while i >= lo and j >= 0 and wins_left < min_gallop and wins_right < min_gallop:
+            if buf[j] < arr[i]: # Left item is larger, so it goes last
+                arr[k] = arr[i]
+                i -= 1
+                wins_left += 1
+                wins_right = 0
+            else:
+                arr[k] = buf[j]
+                j -= 1
+                wins_right += 1
+                wins_left = 0
+            k -= 1
+
+        while i >= lo and j >= 0:
+            start = _gallop(buf[j], arr, lo, i + 1, right=True, from_end=True)
+            moved_left = i + 1 - start
+            while i >= start:
+                arr[k] = arr[i]
+                i -= 1
+                k -= 1
+            if i < lo:
+                break
+            start = _gallop(arr[i], buf, 0, j + 1, right=False, from_end=True)
+            moved_right = j + 1 - start
+            while j >= start:
+                arr[k] = buf[j]
+                j -= 1
+                k -= 1
+            if moved_left < MIN_GALLOP and moved_right < MIN_GALLOP:
+                min_gallop += 1
+                break
+            min_gallop = max(1, min_gallop - 1)
+
+    while j >= 0: # The rest of the left run is already in place
+        arr[k] = buf[j]
+        j -= 1
+        k -= 1
+    gallop_state[0] = min_gallop
+
+
+def _merge_runs(arr, buf, runs, index, gallop_state):
+    """Merges runs[index] with runs[index + 1] (both [start, length])."""
+    lo, count_left = runs[index]
+    mid, count_right = runs[index + 1]
+    hi = mid + count_right
+    runs[index][1] = count_left + count_right
+    del runs[index + 1]
+
+    # Items of the left run <= the first right item are already in place,
+    # as are items of the right run >= the last left item
+    lo = _gallop(arr[mid], arr, lo, mid, right=True)
+    if lo == mid:
+        return
+    hi = _gallop(arr[mid - 1], arr, mid, hi, right=False, from_end=True)
+    if mid - lo <= hi - mid:
+        _merge_lo(arr, buf, lo, mid, hi, gallop_state)
+    else:
+        _merge_hi(arr, buf, lo, mid, hi, gallop_state)
+
+
+def _count_run(arr, lo, n):
+    """
+    Returns the length of the run starting at arr[lo].
+
+    A strictly descending run is reversed in place so every run ends up
+    ascending. (Descending runs must be strict, otherwise reversing would
+    swap equal items and break stability.)
+    """
+    hi = lo + 1
+    if hi == n:
+        return 1
+    if arr[hi] < arr[lo]:
+        while hi + 1 < n and arr[hi + 1] < arr[hi]:
+            hi += 1
+        left, right = lo, hi
+        while left < right:
+            arr[left], arr[right] = arr[right], arr[left]
+            left += 1
+            right -= 1
+    else:
+        while hi + 1 < n and not arr[hi + 1] < arr[hi]:
+            hi += 1
+    return hi - lo + 1
+
+
+def _min_run(n):
+    """Minimum run length: n itself if n < 64, otherwise between 32 and 64."""
+    extra = 0
+    while n >= 64:
+        extra |= n & 1
+        n >>= 1
+    return n + extra
+
+
+def natural_merge_sort(arr):
+    """
+    Sorts a list in-place with an adaptive, stable merge sort (Timsort-style).
+
+    Existing ascending and strictly descending runs are detected and kept;
+    short runs are extended to a minimum length with insertion sort. Runs
+    are merged following Timsort's stack rules, and each merge gallops
+    (exponential search) through blocks that are already in order, so
+    sorted or nearly sorted input takes close to O(n) time. Uses one
+    auxiliary list of n // 2 + 1 items.
+    """
+    n = len(arr)
+    if n < 2:
+        return
+    buf = [None] * (n // 2 + 1) # A merge never copies more than the smaller run
+    min_run = _min_run(n)
+    gallop_state = [MIN_GALLOP]
+    runs = [] # Stack of [start, length]
+
+    lo = 0
+    while lo < n:
+        run_length = _count_run(arr, lo, n)
+        if run_length < min_run:
+            forced = min(min_run, n - lo)
+            insertion_sort_range(arr, lo, lo + forced - 1)
+            run_length = forced
+        runs.append([lo, run_length])
+        lo += run_length
+
+        # Keep run lengths decreasing roughly like Fibonacci numbers, so
+        # merges stay balanced and the stack stays O(log n) deep
+        while len(runs) > 1:
+            top = len(runs) - 2
+            if ((top > 0 and runs[top - 1][1] <= runs[top][1] + runs[top + 1][1])
+                    or (top > 1 and runs[top - 2][1] <= runs[top - 1][1] + runs[top][1])):
+                if runs[top - 1][1] < runs[top + 1][1]:
+                    top -= 1
+            elif runs[top][1] > runs[top + 1][1]:
+                break
+            _merge_runs(arr, buf, runs, top, gallop_state)
+
+    while len(runs) > 1:
+        top = len(runs) - 2
+        if top > 0 and runs[top - 1][1] < runs[top + 1][1]:
+            top -= 1
+        _merge_runs(arr, buf, runs, top, gallop_state)
+
+
+# Example Usage
+if __name__ == "__main__":
+    my_list = [42, 20, 55, 59, 70, 81, 32, 62, 28] # Example from PDF p.9
+    print(f"Original list: {my_list}")
+    introsort(my_list)
+    print(f"Sorted list:   {my_list}")
+
+    already_sorted = list(range(100_000)) # quick_sort would hit RecursionError here
+    introsort(already_sorted)
+    print(f"Sorted 100,000 presorted items: {already_sorted == sorted(already_sorted)}")
@@ -0,0 +1,224 @@
+"""
+Linear searches over streams (companion to S1B - Searching Algorithms).
+
+linear_search_unordered and linear_search_ordered in searching.py need a
+list: they call len(data_list) and index into it. The generators here take
+any iterable (a file, a socket reader, another generator) and look at each
+item once, so the data never has to be held in memory:
+
+  search_stream            - yields (index, item) for every match, like
+                             linear_search_unordered
+  search_ordered_stream    - the same for an ascending stream, stopping at
+                             the first item greater than search_key, like
+                             linear_search_ordered
+  search_stream_async,
+  search_ordered_stream_async
+                           - async generators for async iterators (plain
+                             iterables are accepted too)
+
+For raw bytes (e.g. a multi-GB log) searching item by item is far too slow,
+so two byte-level searches yield the offset of every occurrence of a byte
+pattern instead:
+
+  search_buffer  - over bytes, bytearray, memoryview or mmap, in place
+  search_chunks  - over a binary file object, read in fixed-size chunks into
+                   one reused buffer, so memory use does not grow with the
+                   file size
+
+Occurrences are non-overlapping, as with bytes.count.
+"""
+
+import re
+
+CHUNK_SIZE = 1 << 20 # Bytes read per chunk by search_chunks
+
+
+def search_stream(search_key, stream, key=None, first=False):
+  """
+  Performs a linear search over an iterable without materialising it.
+
+  Args:
+    search_key: The item to search for.
+    stream: Any iterable; it is consumed once.
+    key: Optional function applied to each item before comparing, e.g.
+      operator.itemgetter(0) to search records by their first field.
+    first: If True, stop after the first match.
+
+  Yields:
+    (index, item) for every item equal to search_key, in stream order.
+  """
+  for index, item in enumerate(stream):
+    if (item if key is None else key(item)) == search_key:
+      yield index, item
+      if first:
+        return # Exit once found
+
+
+def search_ordered_stream(search_key, sorted_stream, key=None, first=False):
+  """
+  Performs a linear search over an ascending iterable with early termination.
+
+  Equal items are adjacent in a sorted stream, so every match is yielded
+  before the first item greater than search_key, where the search stops
+  without reading the rest of the stream.
+
+  Args:
+    search_key: The item to search for.
+    sorted_stream: An iterable in ascending order (of key(item) if key is
+      given); it is consumed up to the first item past search_key.
+    key: Optional function applied to each item before comparing.
+    first: If True, stop after the first match.
+
+  Yields:
+    (index, item) for every item equal to search_key.
+  """
+  for index, item in enumerate(sorted_stream):
+    value = item if key is None else key(item)
+    if value == search_key:
+      yield index, item
+      if first:
+        return # Exit once found
+    elif search_key < value:
+      return # Can stop early
+
+
+async def _async_items(stream):
+  """Iterates an async iterable, or a plain iterable as if it were one."""
+  if hasattr(stream, "__aiter__"):
+    async for item in stream:
+      yield item
+  else:
+    for item in stream:
+      yield item
+
+
+async def search_stream_async(search_key, stream, key=None, first=False):
+  """
+  Async version of search_stream for async iterators (e.g. lines from an
+  asyncio.StreamReader). Use it with `async for index, item in ...`.
+  """
+  index = 0
+  async for item in _async_items(stream):
+    if (item if key is None else key(item)) == search_key:
+      yield index, item
+      if first:
+        return # Exit once found
+    index += 1
+
+
+async def search_ordered_stream_async(search_key, sorted_stream, key=None, first=False):
+  """Async version of search_ordered_stream."""
+  index = 0
+  async for item in _async_items(sorted_stream):
+    value = item if key is None else key(item)
+    if value == search_key:
+      yield index, item
+      if first:
+        return # Exit once found
+    elif search_key < value:
+      return # Can stop early
+    index += 1
+
+
+def _compile_pattern(pattern):
+  if not pattern:
+    raise ValueError("pattern must not be empty")
+  return re.compile(re.escape(bytes(pattern)))
+
+
+def search_buffer(pattern, buffer, start=0, end=None, first=False):
+  """
+  Finds a byte pattern in a buffer without copying it.
+
+  The buffer is searched through the buffer protocol, so slicing a
+  memoryview or searching an mmap of a file does not copy any data.
+
+  Args:
+    pattern: The bytes to search for (not empty).
+    buffer: bytes, bytearray, memoryview, mmap or any other contiguous
+      bytes-like object.
+    start, end: Limit the search to buffer[start:end]; offsets are still
+      relative to the whole buffer.
+    first: If True, stop after the first occurrence.
+
+  Yields:
+    The offset of every non-overlapping occurrence, in increasing order.
+  """
+  regex = _compile_pattern(pattern)
+  if end is None:
+    end = len(buffer) if not isinstance(buffer, memoryview) else buffer.nbytes
+  for match in regex.finditer(buffer, start, end):
+    yield match.start()
+    if first:
+      return # Exit once found
+
+
+def search_chunks(pattern, stream, chunk_size=CHUNK_SIZE, first=False):
+  """
+  Finds a byte pattern in a binary stream using constant memory.
+
+  Chunks are read with readinto() into a single buffer of
+  chunk_size + len(pattern) - 1 bytes. The last len(pattern) - 1 bytes of
+  each chunk are carried over to the front of the buffer, so occurrences
+  that straddle two chunks are still found.
+
+  Args:
+    pattern: The bytes to search for (not empty).
+    stream: A binary file object with readinto(), e.g. open(path, "rb") or
+      socket.makefile("rb"). It is read from its current position.
+    chunk_size: Bytes read per chunk.
+    first: If True, stop after the first occurrence.
+
+  Yields:
+    The offset of every non-overlapping occurrence, counted from where
+    reading started.
+  """
+  regex = _compile_pattern(pattern)
+  overlap = len(pattern) - 1
+  buffer = bytearray(chunk_size + overlap)
+  view = memoryview(buffer)
+  base = 0 # Stream offset of buffer[0]
+  kept = 0 # Bytes carried over from the previous chunk
+  resume = 0 # Where to continue searching, past the last occurrence
+  while True:
+    count = stream.readinto(view[kept:kept + chunk_size])
+    if not count:
+      return # End of stream
+    filled = kept + count
+    for match in regex.finditer(buffer, resume, filled):
+      yield base + match.start()
+      if first:
+        return # Exit once found
+      resume = match.end()
+    # Carry the tail that may hold the start of an occurrence
+    kept = min(overlap, filled)
+    view[:kept] = buffer[filled - kept:filled]
+    base += filled - kept
+    resume = max(resume - (filled - kept), 0)
+
+
+# Example usage
+if __name__ == "__main__":
+  import asyncio
+  import io
+
+  readings = [3, 8, 1, 8, 5, 8]
+  print(f"All 8s: {list(search_stream(8, readings))}")
+  print(f"First 8: {next(search_stream(8, iter(readings), first=True), None)}")
+
+  sorted_readings = iter([1, 3, 5, 5, 7, 9, 11])
+  print(f"5s in a sorted stream: {list(search_ordered_stream(5, sorted_readings))}")
+  print(f"Left unread after stopping at 7: {list(sorted_readings)}")
+
+  async def lines():
+    for line in (b"GET /", b"POST /login", b"GET /about"):
+      await asyncio.sleep(0)
+      yield line
+
+  async def main():
+    return [match async for match in search_stream_async(b"GET", lines(), key=lambda line: line[:3])]
+  print(f"GET requests: {asyncio.run(main())}")
+
+  log = b"INFO start\nERROR disk full\nINFO retry\nERROR disk full\n" * 3
+  print(f"ERROR offsets in buffer: {list(search_buffer(b'ERROR', memoryview(log)))}")
+  print(f"ERROR offsets in 16-byte chunks: {list(search_chunks(b'ERROR', io.BytesIO(log), chunk_size=16))}")
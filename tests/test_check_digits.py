@@ -0,0 +1,21 @@
+import numpy as np
+
+from check_digits import mod11_batch, mod11_check_digit, nric_batch, nric_check_letter
+
+
+def test_mod11_batch_strided_column():
+    codes = np.array(["12343", "00000", "98765", "12345", "0", "5"])
+    expected = mod11_batch(codes.copy())
+    strided = mod11_batch(codes[::2])
+    assert strided.valid.tolist() == expected.valid[::2].tolist()
+    assert strided.check.tolist() == expected.check[::2].tolist()
+
+
+def test_batch_column_of_2d_array():
+    payloads = ["1234", "9876", "0001"]
+    table = np.array([[p + mod11_check_digit(p), "x"] for p in payloads])
+    assert mod11_batch(table[:, 0]).valid.all()
+
+    nrics = [p + nric_check_letter(p) for p in ("S1234567", "T7654321", "F0000001")]
+    table = np.array([[code, "x"] for code in nrics])
+    assert nric_batch(table[:, 0]).valid.all()
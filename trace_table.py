@@ -0,0 +1,409 @@
+"""
+Automatic trace tables (companion to S2A section 3, Trace Table).
+
+S2A builds trace tables by hand: one row per executed line, with the
+variables that changed, the result of any condition tested and any output.
+trace() produces the same table by running a real Python function:
+
+  table = trace(binary_search_iterative, args=(24, [8, 16, 24, 32, 40]))
+  print(table.to_markdown())
+  table.to_csv("trace.csv")
+
+Only the traced function's own lines are recorded (not the functions it
+calls), and only for the outermost call: recursive calls run untraced, so
+their locals never overwrite the caller's rows. A cell is left blank when the variable did not change on that line,
+as S2A recommends.
+
+Two tracing back ends are available:
+  "monitoring"  sys.monitoring (Python 3.12+). Line events are enabled only
+                for the traced code object, and lines outside the `lines`
+                filter are disabled after their first hit, so untraced code
+                runs at full speed.
+  "settrace"    sys.settrace, for older Pythons.
+
+For large inputs, memory and overhead are bounded by:
+  max_steps     stop recording after this many line executions
+  ring_size     keep only the last N rows (a ring buffer)
+  sample_every  record only every k-th step
+  lines         record only these line numbers (absolute, as in the file)
+  variables     only show and diff these variables
+"""
+
+import ast
+import copy
+import csv
+import inspect
+import io
+import sys
+from collections import deque
+from contextlib import redirect_stdout
+
+CONDITION_CALLS = {"len", "abs", "min", "max"} # Calls that are safe to re-evaluate
+CONTAINER_LIMIT = 100 # Lists/dicts/sets larger than this are not copied for diffing
+MAX_STEPS = 10_000
+TOOL_NAME = "trace_table"
+
+
+class TraceRow:
+    """One executed line: what changed, the condition result and any output."""
+
+    __slots__ = ("step", "line", "code", "changes", "condition", "output")
+
+    def __init__(self, step, line, code):
+        self.step = step
+        self.line = line
+        self.code = code
+        self.changes = {}
+        self.condition = None
+        self.output = ""
+
+
+class TraceTable:
+    """Rows recorded by trace(), plus the traced function's return value."""
+
+    def __init__(self, function, ring_size=None):
+        self.function = function.__name__
+        self.rows = deque(maxlen=ring_size)
+        self.columns = [] # Variables in the order they first appear
+        self.result = None
+        self.steps = 0 # Line executions seen (including unrecorded ones)
+        self.truncated = False
+
+    def _add_column(self, name):
+        if name not in self.columns:
+            self.columns.append(name)
+
+    def header(self):
+        return ["Step", "Line", "Code", *self.columns, "Condition", "OUTPUT"]
+
+    def records(self):
+        """Yields each row as a list of strings matching header()."""
+        for row in self.rows:
+            cells = [str(row.step), str(row.line), row.code]
+            cells += [repr(row.changes[name]) if name in row.changes else "" for name in self.columns]
+            cells.append("" if row.condition is None else str(row.condition).upper())
+            cells.append(row.output)
+            yield cells
+
+    def to_markdown(self):
+        """Returns the table as a Markdown table, like the one in S2A section 3."""
+        header = self.header()
+        lines = ["| " + " | ".join(header) + " |",
+                 "|" + "|".join("-" * (len(cell) + 2) for cell in header) + "|"]
+        for cells in self.records():
+            cells[2] = f"`{cells[2]}`"
+            lines.append("| " + " | ".join(cell.replace("|", "\\|") for cell in cells) + " |")
+        if self.truncated:
+            lines.append(f"\n*Trace stopped after {self.steps} steps.*")
+        return "\n".join(lines)
+
+    def to_csv(self, destination):
+        """Writes the table as CSV to a path or an open text file."""
+        if isinstance(destination, str):
+            with open(destination, "w", newline="", encoding="utf-8") as f:
+                return self.to_csv(f)
+        writer = csv.writer(destination)
+        writer.writerow(self.header())
+        writer.writerows(self.records())
+
+    def __len__(self):
+        return len(self.rows)
+
+
+CONTAINERS = (list, dict, set, bytearray)
+
+
+class _LargeContainer:
+    """Stands in for a container over CONTAINER_LIMIT in the diff snapshot."""
+
+    __slots__ = ("value", "length")
+
+    def __init__(self, value):
+        self.value = value
+        self.length = len(value)
+
+    def changed(self, value):
+        # Identity and length only: comparing contents would cost O(n) per step
+        return value is not self.value or len(value) != self.length
+
+
+def _snapshot_value(value):
+    """Copies small containers so in-place changes (arr[i] = x) show up in the diff."""
+    if isinstance(value, CONTAINERS) and len(value) <= CONTAINER_LIMIT:
+        return copy.copy(value)
+    return value
+
+
+def _diff_value(value):
+    """Like _snapshot_value, but large containers are kept as identity + length."""
+    if isinstance(value, CONTAINERS) and len(value) > CONTAINER_LIMIT:
+        return _LargeContainer(value)
+    return _snapshot_value(value)
+
+
+def _changed(old, value):
+    if isinstance(old, _LargeContainer):
+        return old.changed(value)
+    return old != value
+
+
+def _condition_expressions(lines, first_line):
+    """
+    Maps line number -> compiled test of each if/elif/while whose test is
+    safe to evaluate again (no calls except len/abs/min/max, no walrus).
+    """
+    if not lines:
+        return {}
+    source = "".join(lines)
+    indent = len(source) - len(source.lstrip())
+    tree = ast.parse("\n".join(line[indent:] for line in source.splitlines()))
+
+    conditions = {}
+    for node in ast.walk(tree):
+        if not isinstance(node, (ast.If, ast.While)):
+            continue
+        safe = all(
+            not isinstance(part, ast.NamedExpr)
+            and not (isinstance(part, ast.Call)
+                     and not (isinstance(part.func, ast.Name) and part.func.id in CONDITION_CALLS))
+            for part in ast.walk(node.test))
+        if safe:
+            expression = ast.Expression(node.test)
+            line = node.test.lineno + first_line - 1
+            conditions[line] = compile(expression, f"<condition line {line}>", "eval")
+    return conditions
+
+
+class _Recorder:
+    """Shared bookkeeping for both back ends: diffs, conditions, output, limits."""
+
+    def __init__(self, function, variables, lines, max_steps, ring_size, sample_every):
+        self.table = TraceTable(function, ring_size)
+        self.code = function.__code__
+        self.variables = set(variables) if variables else None
+        self.lines = set(lines) if lines else None
+        self.max_steps = max_steps
+        self.sample_every = sample_every
+        try:
+            source, first_line = inspect.getsourcelines(function)
+        except (OSError, TypeError): # No source (e.g. defined in a REPL): no code or conditions
+            source, first_line = [], 0
+        self.source_lines = {first_line + offset: text.strip() for offset, text in enumerate(source)}
+        self.conditions = _condition_expressions(source, first_line)
+        self.snapshot = {}
+        self.frame = None # The outermost call's frame, the only one recorded
+        self.pending = None # Row of the line that is executing now
+        self.output = io.StringIO() # Output of the pending row
+        self.active = True
+
+    def wants(self, line):
+        return self.lines is None or line in self.lines
+
+    def _current(self, frame_locals):
+        return {name: value for name, value in frame_locals.items()
+                if self.variables is None or name in self.variables}
+
+    def _finish_pending(self, frame_locals):
+        """Attributes variable changes and output since the pending row started to it."""
+        row, self.pending = self.pending, None
+        changes = {name: _snapshot_value(value) for name, value in self._current(frame_locals).items()
+                   if name not in self.snapshot or _changed(self.snapshot[name], value)}
+        self.snapshot = {}
+        row.changes = changes
+        row.output = self.output.getvalue().rstrip("\n")
+        for name in changes:
+            self.table._add_column(name)
+
+    def line(self, line, frame):
+        """
+        Handles one line event. Returns False once tracing should stop.
+
+        Locals are only read for recorded rows: when a row starts (the
+        baseline) and at the next event (the diff), so skipped steps cost
+        no more than a counter update.
+        """
+        if frame is not self.frame:
+            if self.frame is not None:
+                return True # A recursive call
+            self.frame = frame
+        if self.pending is not None:
+            self._finish_pending(frame.f_locals)
+        if not self.wants(line):
+            return True
+
+        if self.table.steps >= self.max_steps:
+            self.table.truncated = True
+            self.active = False
+            return False
+        self.table.steps += 1
+        if (self.table.steps - 1) % self.sample_every:
+            return True
+
+        frame_locals = frame.f_locals
+        row = TraceRow(self.table.steps, line, self.source_lines.get(line, ""))
+        condition = self.conditions.get(line)
+        if condition is not None:
+            try:
+                row.condition = bool(eval(condition, frame.f_globals, dict(frame_locals)))
+            except Exception: # A condition that can't be evaluated is simply left blank
+                row.condition = None
+        self.snapshot = {name: _diff_value(value) for name, value in self._current(frame_locals).items()}
+        self.output.seek(0)
+        self.output.truncate() # Output of unrecorded steps is not shown
+        self.table.rows.append(row)
+        self.pending = row
+        return True
+
+    def finish(self, frame, result):
+        if frame is not self.frame:
+            return # A recursive call returned
+        if self.pending is not None:
+            self._finish_pending(frame.f_locals)
+        self.table.result = result
+
+
+class _Output(io.TextIOBase):
+    """
+    Stands in for sys.stdout while tracing. Output of a recorded row is kept
+    for its OUTPUT cell; everything else (unrecorded steps, output after the
+    step cap) goes to the real stdout, so memory stays bounded.
+    """
+
+    def __init__(self, recorder, stdout):
+        self.recorder = recorder
+        self.stdout = stdout
+
+    def writable(self):
+        return True
+
+    def write(self, text):
+        if self.recorder.pending is not None:
+            return self.recorder.output.write(text)
+        return self.stdout.write(text)
+
+    def flush(self):
+        self.stdout.flush()
+
+
+def _run_settrace(recorder, function, args, kwargs):
+    code = recorder.code
+    previous = sys.gettrace()
+
+    def stop(frame):
+        # Returning None does not stop line events for a frame on CPython <= 3.11,
+        # so switch them off explicitly and put the previous tracer back
+        frame.f_trace_lines = False
+        frame.f_trace = None
+        sys.settrace(previous)
+
+    def local_trace(frame, event, arg):
+        if not recorder.active:
+            stop(frame)
+            return None
+        if event == "line":
+            if not recorder.line(frame.f_lineno, frame):
+                stop(frame)
+                return None
+        elif event == "return":
+            recorder.finish(frame, arg)
+        return local_trace
+
+    def global_trace(frame, event, arg):
+        # Only the outermost call of the traced function gets a line tracer
+        if event == "call" and frame.f_code is code and recorder.active and recorder.frame is None:
+            recorder.frame = frame
+            return local_trace
+        return None
+
+    sys.settrace(global_trace)
+    try:
+        return function(*args, **kwargs)
+    finally:
+        sys.settrace(previous)
+
+
+def _run_monitoring(recorder, function, args, kwargs):
+    monitoring = sys.monitoring
+    tool = next((tool_id for tool_id in range(6) if monitoring.get_tool(tool_id) is None), None)
+    if tool is None:
+        raise RuntimeError("No free sys.monitoring tool id")
+    events = monitoring.events
+    code = recorder.code
+
+    def on_line(event_code, line):
+        if not recorder.active:
+            return monitoring.DISABLE
+        if not recorder.wants(line):
+            if recorder.pending is not None:
+                recorder.line(line, sys._getframe(1)) # Closes the pending row
+            return monitoring.DISABLE # Never report this line again
+        if not recorder.line(line, sys._getframe(1)):
+            monitoring.set_local_events(tool, code, 0)
+        return None
+
+    def on_return(event_code, offset, retval):
+        if event_code is code:
+            recorder.finish(sys._getframe(1), retval)
+
+    monitoring.use_tool_id(tool, TOOL_NAME)
+    try:
+        monitoring.register_callback(tool, events.LINE, on_line)
+        monitoring.register_callback(tool, events.PY_RETURN, on_return)
+        monitoring.set_local_events(tool, code, events.LINE | events.PY_RETURN)
+        return function(*args, **kwargs)
+    finally:
+        monitoring.set_local_events(tool, code, 0)
+        monitoring.register_callback(tool, events.LINE, None)
+        monitoring.register_callback(tool, events.PY_RETURN, None)
+        monitoring.free_tool_id(tool)
+        monitoring.restart_events()
+
+
+def trace(function, args=(), kwargs=None, mode="auto", variables=None, lines=None,
+          max_steps=MAX_STEPS, ring_size=None, sample_every=1):
+    """
+    Runs function(*args, **kwargs) and records its trace table.
+
+    Args:
+      function: A plain Python function, e.g. insertion_sort.
+      args, kwargs: Arguments to call it with.
+      mode: "monitoring" (Python 3.12+), "settrace", or "auto" to use
+        monitoring when available.
+      variables: Names of the variables to show (default: all locals).
+      lines: Absolute line numbers to record (default: every line).
+      max_steps: Stop recording after this many line executions. The
+        function still runs to completion, and its later output goes to the
+        real stdout.
+      ring_size: Keep only the last ring_size rows.
+      sample_every: Record every k-th line execution.
+
+    Returns:
+      A TraceTable; its `result` attribute holds the function's return value.
+    """
+    kwargs = kwargs or {}
+    if mode == "auto":
+        mode = "monitoring" if hasattr(sys, "monitoring") else "settrace"
+    if mode == "monitoring" and not hasattr(sys, "monitoring"):
+        raise RuntimeError("sys.monitoring needs Python 3.12 or later")
+    if mode not in ("monitoring", "settrace"):
+        raise ValueError(f"Unknown trace mode {mode!r}")
+
+    recorder = _Recorder(function, variables, lines, max_steps, ring_size, sample_every)
+    run = _run_monitoring if mode == "monitoring" else _run_settrace
+    with redirect_stdout(_Output(recorder, sys.stdout)):
+        result = run(recorder, function, args, kwargs)
+    recorder.frame = None
+    recorder.table.result = result
+    return recorder.table
+
+
+# Example usage
+if __name__ == "__main__":
+    def double_until_100(num):
+        # num <- USERINPUT; WHILE num < 100 DO num <- num * 2; OUTPUT num
+        while num < 100:
+            num = num * 2
+        print(num)
+        return num
+
+    print(trace(double_until_100, args=(4,)).to_markdown())